@@ -18,12 +18,11 @@ def _run_init() -> None:
         except Exception:
             pass
 
-    # Register commands and observer.
+    # Register commands; the controller and its observer are built once a spreadsheet shows up.
     try:
-        from SketcherAutoAlias.core.controller import CONTROLLER
+        from SketcherAutoAlias.core.startup import install
 
-        CONTROLLER.register_commands()
-        CONTROLLER.start_observer()
+        install()
     except Exception as exc:
         local_warn(f"Controller could not be loaded: {exc}")
         return
@@ -38,9 +37,15 @@ def _run_init() -> None:
             def modifyToolBars(self):
                 return [
                     {"append": "SketcherAutoAlias_CreateAliasNow", "toolBar": "Spreadsheet"},
+                    {"append": "SketcherAutoAlias_SyncSelection", "toolBar": "Spreadsheet"},
                     {"append": "SketcherAutoAlias_Toggle", "toolBar": "Spreadsheet"},
                 ]
 
+            def modifyMenuBar(self):
+                return [
+                    {"append": "SketcherAutoAlias_ShowSyncStats", "menuItem": "Spreadsheet_Export"},
+                ]
+
         existing = getattr(Gui, "SPREADSHEET_ALIAS_WB_MANIPULATOR", None)
         if existing is not None and hasattr(Gui, "removeWorkbenchManipulator"):
             try:
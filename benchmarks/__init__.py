@@ -0,0 +1 @@
+"""Benchmarks for SketcherAutoAlias (run with ``python -m SketcherAutoAlias.benchmarks.<name>``)."""
@@ -0,0 +1,54 @@
+"""Benchmark: pure alias planning, serial vs. a process pool, without any sheet API.
+
+Run from the directory that contains the ``SketcherAutoAlias`` package::
+
+    python -m SketcherAutoAlias.benchmarks.bench_plan [sheets] [rows] [jobs]
+
+Each synthetic sheet is a ``SheetView`` built directly from labels, so the
+numbers cover ``plan_aliases`` alone.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from SketcherAutoAlias.core.alias_plan import plan_aliases
+from SketcherAutoAlias.core.cells import pack
+from SketcherAutoAlias.core.sheet_view import SheetView
+
+
+def _make_view(rows: int) -> SheetView:
+    view = SheetView()
+    for row in range(1, rows + 1):
+        view.record(pack(row, 1), f"param {row % 97}", "")
+        view.record(pack(row, 2), str(row), "")
+    return view
+
+
+def _plan(rows: int) -> int:
+    return len(plan_aliases(_make_view(rows)).aliases)
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    sheets = int(args[0]) if args else 80
+    rows = int(args[1]) if len(args) > 1 else 2000
+    jobs = int(args[2]) if len(args) > 2 else 4
+    print(f"sheets={sheets} rows={rows} jobs={jobs}")
+    print(f"{'mode':<8} {'wall [s]':>10} {'aliases':>10}")
+
+    start = time.perf_counter()
+    planned = sum(map(_plan, [rows] * sheets))
+    print(f"{'serial':<8} {time.perf_counter() - start:>10.3f} {planned:>10}")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        planned = sum(pool.map(_plan, [rows] * sheets))
+    print(f"{'pool':<8} {time.perf_counter() - start:>10.3f} {planned:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
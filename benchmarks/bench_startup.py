@@ -0,0 +1,93 @@
+"""Benchmark: cost of loading the addon at FreeCAD start-up and on the first spreadsheet.
+
+Run from the directory that contains the ``SketcherAutoAlias`` package::
+
+    python -m SketcherAutoAlias.benchmarks.bench_startup [runs]
+
+Every run is a fresh interpreter with minimal ``FreeCAD``/``FreeCADGui``
+stand-ins, so imports are cold. ``startup`` is ``import InitGui`` (what
+FreeCAD pays on every launch), ``first sheet`` is what the first spreadsheet
+adds (controller, service and observer) and ``eager`` builds the controller
+right away, as the addon did before start-up was made lazy.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_CHILD = r"""
+import json, sys, time, types
+
+app = types.ModuleType("FreeCAD")
+gui = types.ModuleType("FreeCADGui")
+app.Console = types.SimpleNamespace(PrintMessage=print, PrintWarning=print, PrintError=print)
+app.ActiveDocument = None
+app.ParamGet = lambda _path: types.SimpleNamespace(
+    GetBool=lambda _k, d: d, GetInt=lambda _k, d: d, GetString=lambda _k, d: d
+)
+app.addDocumentObserver = lambda _observer: None
+app.removeDocumentObserver = lambda _observer: None
+gui.addCommand = lambda _name, _command: None
+sys.modules["FreeCAD"] = app
+sys.modules["FreeCADGui"] = gui
+
+def plugin_modules():
+    return sum(1 for name in sys.modules if name.startswith("SketcherAutoAlias"))
+
+timings = {}
+start = time.perf_counter()
+if sys.argv[1] == "eager":
+    from SketcherAutoAlias.core.controller import get_controller
+    get_controller().start_observer()
+    timings["eager"] = time.perf_counter() - start
+else:
+    import SketcherAutoAlias.InitGui
+    timings["startup"] = time.perf_counter() - start
+    timings["startup_modules"] = plugin_modules()
+    from SketcherAutoAlias.core.startup import StartupObserver
+    sheet = types.SimpleNamespace(TypeId="Spreadsheet::Sheet", Name="Params", Label="Params", Objects=[])
+    sheet.Document = types.SimpleNamespace(Name="Doc", Objects=[sheet], Restoring=True)
+    start = time.perf_counter()
+    StartupObserver().slotCreatedObject(sheet)
+    timings["first sheet"] = time.perf_counter() - start
+timings["modules"] = plugin_modules()
+print(json.dumps(timings))
+"""
+
+
+def _run(mode: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode],
+        cwd=_PACKAGE_PARENT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    runs = int(args[0]) if args else 10
+    lazy = [_run("lazy") for _ in range(runs)]
+    eager = [_run("eager") for _ in range(runs)]
+    print(f"runs={runs} (median of cold interpreter starts)")
+    print(f"{'phase':<12} {'wall [ms]':>10} {'modules':>8}")
+    for label, samples, key, modules in (
+        ("startup", lazy, "startup", "startup_modules"),
+        ("first sheet", lazy, "first sheet", "modules"),
+        ("eager", eager, "eager", "modules"),
+    ):
+        wall = statistics.median(sample[key] for sample in samples) * 1000
+        print(f"{label:<12} {wall:>10.2f} {samples[0][modules]:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""Scaling benchmark for ``AliasService.sync_sheet``.
+
+Run from the directory that contains the ``SketcherAutoAlias`` package::
+
+    python -m SketcherAutoAlias.benchmarks.bench_sync [--sizes 100,1000,10000,100000]
+        [--output FILE] [--compare OLD_FILE]
+
+For every sheet size and profile (label density, duplicate-label ratio and
+share of rows that already have their alias) four scenarios are measured:
+
+- ``first``: first sync of the sheet,
+- ``repeat``: a second sync without any change,
+- ``edit_hinted``: one label renamed, sync told which cell changed,
+- ``edit_diff``: one label renamed, sync has to find the change itself.
+
+Each result records wall time, peak traced memory and the number of calls
+per sheet API method. Results are written as JSON (by default to
+``benchmarks/results/<version>.json``) so runs of different versions can be
+compared with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from SketcherAutoAlias import __version__
+from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.camel_case import clear_caches
+from SketcherAutoAlias.core.prefs import Preferences
+
+from .fakes import SHEET_API, BenchSheet, make_sheet
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+PROFILES: Dict[str, Dict[str, float]] = {
+    "typical": {"label_density": 0.5, "duplicate_ratio": 0.1, "alias_ratio": 0.0},
+    "duplicates": {"label_density": 0.9, "duplicate_ratio": 0.8, "alias_ratio": 0.0},
+    "aliased": {"label_density": 0.5, "duplicate_ratio": 0.1, "alias_ratio": 0.9},
+}
+
+Scenario = Callable[[BenchSheet], Tuple[AliasService, Callable[[], int]]]
+
+
+def _first(sheet: BenchSheet):
+    service = AliasService(Preferences())
+    return service, lambda: service.sync_sheet(sheet)
+
+
+def _repeat(sheet: BenchSheet):
+    service = AliasService(Preferences())
+    service.sync_sheet(sheet)
+    return service, lambda: service.sync_sheet(sheet)
+
+
+def _edit(hinted: bool) -> Scenario:
+    def scenario(sheet: BenchSheet):
+        service = AliasService(Preferences())
+        service.sync_sheet(sheet)
+        sheet.put("A1", "renamed parameter")
+        changed = ["A1"] if hinted else None
+        return service, lambda: service.sync_sheet(sheet, changed)
+
+    return scenario
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "first": _first,
+    "repeat": _repeat,
+    "edit_hinted": _edit(True),
+    "edit_diff": _edit(False),
+}
+
+
+def measure(size: int, profile: Dict[str, float], scenario: Scenario) -> Dict[str, object]:
+    # Timed run.
+    clear_caches()
+    sheet = make_sheet(size, **profile)
+    _service, run = scenario(sheet)
+    sheet.reset_counters()
+    start = time.perf_counter()
+    updated = run()
+    wall = time.perf_counter() - start
+    calls = {name: sheet.calls[name] for name in SHEET_API}
+
+    # Same scenario again under tracemalloc for the memory peak.
+    clear_caches()
+    sheet = make_sheet(size, **profile)
+    _service, run = scenario(sheet)
+    tracemalloc.start()
+    try:
+        run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_s": round(wall, 6),
+        "peak_kib": round(peak / 1024, 1),
+        "updated": updated,
+        "undo_entries": sheet.Document.undo_count,
+        "calls": calls,
+    }
+
+
+def run_suite(sizes: List[int]) -> Dict[str, object]:
+    results = []
+    for size in sizes:
+        for profile_name, profile in PROFILES.items():
+            for scenario_name, scenario in SCENARIOS.items():
+                result = measure(size, profile, scenario)
+                result.update({"size": size, "profile": profile_name, "scenario": scenario_name})
+                results.append(result)
+                print(_format_row(result), flush=True)
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object]) -> None:
+    def key(item):
+        return item["size"], item["profile"], item["scenario"]
+
+    old = {key(item): item for item in baseline["results"]}
+    print(f"\nCompared with {baseline.get('version', '?')} ({baseline.get('created', '?')}):")
+    print(f"{'size':>7} {'profile':<11} {'scenario':<12} {'wall x':>8} {'peak x':>8} {'calls x':>8}")
+    for item in current["results"]:
+        before = old.get(key(item))
+        if before is None:
+            continue
+        print(
+            f"{item['size']:>7} {item['profile']:<11} {item['scenario']:<12}"
+            f" {_ratio(item['wall_s'], before['wall_s']):>8}"
+            f" {_ratio(item['peak_kib'], before['peak_kib']):>8}"
+            f" {_ratio(sum(item['calls'].values()), sum(before['calls'].values())):>8}"
+        )
+
+
+def _ratio(new: float, old: float) -> str:
+    if not old:
+        return "-" if not new else "new"
+    return f"{new / old:.2f}"
+
+
+def _format_row(result: Dict[str, object]) -> str:
+    calls = result["calls"]
+    api_calls = " ".join(f"{name}={calls[name]}" for name in SHEET_API if calls[name])
+    return (
+        f"{result['size']:>7} {result['profile']:<11} {result['scenario']:<12}"
+        f" {result['wall_s']:>9.4f}s {result['peak_kib']:>10.1f}KiB  {api_calls}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SketcherAutoAlias.benchmarks.bench_sync")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma separated cell counts")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<version>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    suite = run_suite(sizes)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{__version__}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(suite, handle, indent=1)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            compare(suite, json.load(handle))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+"""Synthetic FreeCAD stand-ins with per-method call counters."""
+
+from __future__ import annotations
+
+import random
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+SHEET_API = ("get", "getAlias", "getAddressFromAlias", "isValidAlias", "set", "setAlias", "getNonEmptyCells")
+
+
+class BenchDocument:
+    """Models undo entries and transactions the way FreeCAD counts them."""
+
+    def __init__(self) -> None:
+        self.Name = "Bench"
+        self.HasPendingTransaction = False
+        self.RecomputesFrozen = False
+        self.undo_count = 0
+
+    def openTransaction(self, _name: str) -> None:  # noqa: N802
+        self.HasPendingTransaction = True
+
+    def commitTransaction(self) -> None:  # noqa: N802
+        self.HasPendingTransaction = False
+        self.undo_count += 1
+
+    def abortTransaction(self) -> None:  # noqa: N802
+        self.HasPendingTransaction = False
+
+
+class BenchSheet:
+    """Spreadsheet fake; a write outside a transaction is one undo entry and,
+    unless recomputes are frozen, recomputes the sheet (touching every cell)."""
+
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self, document: Optional[BenchDocument] = None, name: str = "Params") -> None:
+        self.Name = name
+        self.Label = name
+        self.Document = document or BenchDocument()
+        self.cells: Dict[str, str] = {}
+        self.alias_to_cell: Dict[str, str] = {}
+        self.cell_to_alias: Dict[str, str] = {}
+        self.recomputes = 0
+        self.calls: Counter = Counter()
+
+    def isValidAlias(self, alias: str) -> bool:  # noqa: N802
+        self.calls["isValidAlias"] += 1
+        return bool(IDENTIFIER_RE.match(alias))
+
+    def getAddressFromAlias(self, alias: str):  # noqa: N802
+        self.calls["getAddressFromAlias"] += 1
+        return self.alias_to_cell.get(alias, "")
+
+    def getAlias(self, cell: str):  # noqa: N802
+        self.calls["getAlias"] += 1
+        return self.cell_to_alias.get(cell, "")
+
+    def getNonEmptyCells(self) -> List[str]:  # noqa: N802
+        self.calls["getNonEmptyCells"] += 1
+        return list(self.cells)
+
+    def get(self, cell: str):
+        self.calls["get"] += 1
+        return self.cells.get(cell, "")
+
+    def set(self, cell: str, value: str) -> None:
+        self.calls["set"] += 1
+        self.put(cell, value)
+        self._after_write()
+
+    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
+        self.calls["setAlias"] += 1
+        owner = self.alias_to_cell.get(alias)
+        if owner and owner != cell:
+            raise ValueError(alias)
+        self.put_alias(cell, alias)
+        self._after_write()
+
+    def recompute(self) -> None:
+        self.recomputes += 1
+        for _value in self.cells.values():
+            pass
+
+    def put(self, cell: str, value: str) -> None:
+        """Change a cell without counting an API call (used to set up scenarios)."""
+        if value:
+            self.cells[cell] = value
+        else:
+            self.cells.pop(cell, None)
+
+    def put_alias(self, cell: str, alias: str) -> None:
+        old = self.cell_to_alias.pop(cell, None)
+        if old:
+            self.alias_to_cell.pop(old, None)
+        self.alias_to_cell[alias] = cell
+        self.cell_to_alias[cell] = alias
+
+    def reset_counters(self) -> None:
+        self.calls.clear()
+        self.recomputes = 0
+        self.Document.undo_count = 0
+
+    def _after_write(self) -> None:
+        if not self.Document.HasPendingTransaction:
+            self.Document.undo_count += 1
+        if not self.Document.RecomputesFrozen:
+            self.recompute()
+
+
+def make_sheet(
+    cells: int,
+    label_density: float = 0.5,
+    duplicate_ratio: float = 0.1,
+    alias_ratio: float = 0.0,
+    seed: int = 1,
+) -> BenchSheet:
+    """Build a two-column-pair parameter sheet with about ``cells`` non-empty cells.
+
+    ``label_density`` is the share of rows whose name cell is filled,
+    ``duplicate_ratio`` the share of labels drawn from a small pool of repeated
+    names and ``alias_ratio`` the share of labelled rows that already carry their alias.
+    """
+    rng = random.Random(seed)
+    sheet = BenchSheet()
+    rows = max(1, cells // 4)
+    pool = [f"offset {number}" for number in range(5)]
+    for row in range(1, rows + 1):
+        for label_col, value_col in (("A", "B"), ("D", "E")):
+            value_cell = f"{value_col}{row}"
+            sheet.put(value_cell, f"{rng.randint(1, 500)} mm")
+            if rng.random() >= label_density:
+                continue
+            if rng.random() < duplicate_ratio:
+                label = rng.choice(pool)
+            else:
+                label = f"param {label_col} {row}"
+            sheet.put(f"{label_col}{row}", label)
+            alias = label.replace(" ", "_").lower()
+            if rng.random() < alias_ratio and alias not in sheet.alias_to_cell:
+                sheet.put_alias(value_cell, alias)
+    return sheet
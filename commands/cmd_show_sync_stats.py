@@ -0,0 +1,23 @@
+"""Command: print alias sync statistics to the report view."""
+
+from __future__ import annotations
+
+from SketcherAutoAlias.core.constants import ICON_STATS
+
+
+class ShowSyncStatsCommand:
+    def __init__(self, controller) -> None:
+        self._controller = controller
+
+    def GetResources(self) -> dict:  # noqa: N802 (FreeCAD API)
+        return {
+            "Pixmap": ICON_STATS,
+            "MenuText": "Show Alias Sync Stats",
+            "ToolTip": "Print timing and FreeCAD API call counts of automatic alias syncs to the report view.",
+        }
+
+    def IsActive(self) -> bool:  # noqa: N802
+        return True
+
+    def Activated(self, *args) -> None:  # noqa: N802
+        self._controller.show_sync_stats()
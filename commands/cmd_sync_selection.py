@@ -0,0 +1,23 @@
+"""Command: create aliases for the selected cell range only."""
+
+from __future__ import annotations
+
+from SketcherAutoAlias.core.constants import ICON_SYNC_SELECTION
+
+
+class SyncSelectionCommand:
+    def __init__(self, controller) -> None:
+        self._controller = controller
+
+    def GetResources(self) -> dict:  # noqa: N802 (FreeCAD API)
+        return {
+            "Pixmap": ICON_SYNC_SELECTION,
+            "MenuText": "Create Alias for Selection",
+            "ToolTip": "Create/update aliases only for the rows of the cells selected in the spreadsheet view.",
+        }
+
+    def IsActive(self) -> bool:  # noqa: N802
+        return self._controller.is_active()
+
+    def Activated(self, *args) -> None:  # noqa: N802
+        self._controller.sync_selected_range()
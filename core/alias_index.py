@@ -0,0 +1,126 @@
+"""In-memory alias lookup tables used while syncing a sheet."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class AliasNamespace:
+    """Aliases claimed by several sheets of one document: alias -> [(sheet key, cell), ...].
+
+    Sheet indexes attached to the namespace claim and release their aliases as
+    they change, so checking a name against every sheet stays one dict lookup.
+    When two sheets already carry the same alias, the first claim is the owner;
+    the others stay listed and take over when it is released.
+    """
+
+    def __init__(self) -> None:
+        self.owners: Dict[str, List[Tuple[str, int]]] = {}
+
+    def owner(self, alias: str) -> Optional[Tuple[str, int]]:
+        claims = self.owners.get(alias)
+        return claims[0] if claims else None
+
+    def claim(self, alias: str, scope: str, cell: int) -> None:
+        claims = self.owners.setdefault(alias, [])
+        if (scope, cell) not in claims:
+            claims.append((scope, cell))
+
+    def release(self, alias: str, scope: str, cell: int) -> None:
+        claims = self.owners.get(alias)
+        if claims is None or (scope, cell) not in claims:
+            return
+        claims.remove((scope, cell))
+        if not claims:
+            del self.owners[alias]
+
+
+class AliasIndex:
+    """Bidirectional alias <-> packed cell map with constant-time collision suffixes.
+
+    The index mirrors the aliases of one sheet, so choosing an alias for a row
+    never has to probe the sheet through ``getAddressFromAlias``. For every base
+    name it remembers the next suffix worth trying during the current sync, so
+    300 rows labelled ``offset`` get ``offset``, ``offset2`` ... ``offset300``
+    without rescanning the taken suffixes for each row.
+    """
+
+    def __init__(self) -> None:
+        self.alias_to_cell: Dict[str, int] = {}
+        self.cell_to_alias: Dict[int, str] = {}
+        self._next_suffix: Dict[str, int] = {}
+        self._namespace: Optional[AliasNamespace] = None
+        self._scope = ""
+
+    def attach(self, namespace: AliasNamespace, scope: str) -> None:
+        """Share this index's aliases with ``namespace`` under the sheet key ``scope``."""
+        self.detach()
+        self._namespace = namespace
+        self._scope = scope
+        for cell, alias in self.cell_to_alias.items():
+            namespace.claim(alias, scope, cell)
+
+    def detach(self) -> None:
+        if self._namespace is None:
+            return
+        for cell, alias in self.cell_to_alias.items():
+            self._namespace.release(alias, self._scope, cell)
+        self._namespace = None
+
+    def begin_sync(self) -> None:
+        # Suffix cursors are only valid while aliases are not being released.
+        self._next_suffix.clear()
+
+    def owner(self, alias: str) -> Optional[int]:
+        return self.alias_to_cell.get(alias)
+
+    def alias_of(self, cell: int) -> str:
+        return self.cell_to_alias.get(cell, "")
+
+    def assign(self, cell: int, alias: str) -> None:
+        """Record that ``cell`` now carries ``alias`` (an empty alias clears it)."""
+        namespace = self._namespace
+        previous = self.cell_to_alias.pop(cell, "")
+        if previous and self.alias_to_cell.get(previous) == cell:
+            del self.alias_to_cell[previous]
+        if previous and namespace is not None:
+            namespace.release(previous, self._scope, cell)
+        if not alias:
+            return
+        other = self.alias_to_cell.get(alias)
+        if other is not None and other != cell:
+            self.cell_to_alias.pop(other, None)
+            if namespace is not None:
+                namespace.release(alias, self._scope, other)
+        self.alias_to_cell[alias] = cell
+        self.cell_to_alias[cell] = alias
+        if namespace is not None:
+            namespace.claim(alias, self._scope, cell)
+
+    def allocate(self, base: str, cell: int, is_valid: Callable[[str], bool]) -> str:
+        """Return the alias ``cell`` should carry for ``base`` (``base``, ``base2``, ...)."""
+        if not base:
+            return ""
+        if is_valid(base):
+            if self._available(base, cell):
+                return base
+        elif not is_valid(f"{base}2"):
+            # If the suffixed name is rejected as well, more suffixes will not help.
+            return ""
+
+        suffix = self._next_suffix.get(base, 2)
+        candidate = f"{base}{suffix}"
+        while not self._available(candidate, cell):
+            suffix += 1
+            candidate = f"{base}{suffix}"
+        self._next_suffix[base] = suffix
+        return candidate
+
+    def _available(self, alias: str, cell: int) -> bool:
+        owner = self.alias_to_cell.get(alias)
+        if owner is not None and owner != cell:
+            return False
+        if self._namespace is None:
+            return True
+        shared = self._namespace.owner(alias)
+        return shared is None or shared == (self._scope, cell)
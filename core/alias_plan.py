@@ -0,0 +1,280 @@
+"""Pure alias planning: decide which aliases a sheet needs without touching FreeCAD."""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .camel_case import to_valid_aliases
+from .cells import MAX_COLUMN_INDEX, col_of, format_cell, is_cell_address, left_of, right_of
+from .sheet_view import SheetView
+
+# FreeCAD's alias pattern: a letter, then letters, digits and underscores.
+IDENTIFIER_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+# Unit symbols of FreeCAD's expression parser; an alias with one of these names
+# would be read as a quantity, so ``Sheet.isValidAlias`` rejects them.
+UNIT_NAMES = frozenset(
+    """
+    nm um mm cm dm m km mil in ft thou yd mi mph sqft cft
+    ug mg g kg t oz lb st cwt
+    s min h A mA kA MA K mK uK mol mmol cd
+    l ml
+    Pa kPa MPa GPa bar mbar Torr mTorr uTorr psi ksi Mpsi
+    W mW kW MW hp J mJ kJ Ws VA VAs CV kWh Wh eV keV MeV cal kcal
+    N mN kN MN V mV kV Ohm kOhm MOhm S mS kS uS Hz kHz MHz GHz THz
+    C T G Gs F mF uF nF pF H mH uH nH Wb deg rad gon
+    """.split()
+)
+
+# Constants of the expression parser and properties of a spreadsheet object;
+# an alias is also a property of the sheet, so these names are taken.
+RESERVED_NAMES = frozenset(
+    """
+    pi e
+    cells columnWidths rowHeights Label Label2 Visibility ExpressionEngine Proxy
+    """.split()
+)
+
+# Content written into an empty value cell so it stays usable as a value.
+PLACEHOLDER_VALUE = "0"
+
+
+def is_valid_alias(alias: str) -> bool:
+    """Offline approximation of ``Sheet.isValidAlias``.
+
+    An identifier that is neither a cell address, a unit symbol nor a reserved name.
+    """
+    return (
+        bool(IDENTIFIER_RE.match(alias))
+        and not is_cell_address(alias)
+        and alias not in UNIT_NAMES
+        and alias not in RESERVED_NAMES
+    )
+
+
+class PlannedAlias:
+    """One alias write: ``alias`` goes to ``cell``, labelled by the cell on its left.
+
+    An empty ``alias`` removes ``previous`` from a cell whose label is gone.
+    """
+
+    def __init__(self, cell: int, alias: str, base: str, previous: str, label: str) -> None:
+        self.cell = cell
+        self.alias = alias
+        # The alias derived from the label before a collision suffix was added.
+        self.base = base
+        # The alias ``cell`` carried before this plan.
+        self.previous = previous
+        self.label = label
+
+
+class AliasPlan:
+    """Writes needed to bring a sheet's aliases in line with its labels.
+
+    Cells are packed integers (see ``cells.py``); ``skipped`` holds label cells
+    for which no valid alias could be generated, with their label text.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[int] = []
+        self.aliases: List[PlannedAlias] = []
+        self.skipped: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.values) + len(self.aliases)
+
+    def split(self, rows: int) -> List["AliasPlan"]:
+        """Split into plans touching at most ``rows`` target cells each, in row order."""
+        if rows <= 0 or len(self) <= rows:
+            return [self]
+        values = set(self.values)
+        entries = {entry.cell: entry for entry in self.aliases}
+        targets = sorted(values | set(entries))
+        chunks: List[AliasPlan] = []
+        for start in range(0, len(targets), rows):
+            chunk = AliasPlan()
+            for cell in targets[start : start + rows]:
+                if cell in values:
+                    chunk.values.append(cell)
+                if cell in entries:
+                    chunk.aliases.append(entries[cell])
+            chunks.append(chunk)
+        chunks[0].skipped = self.skipped
+        return chunks
+
+
+def plan_aliases(
+    view: SheetView,
+    cells: Optional[Iterable[int]] = None,
+    is_valid: Callable[[str], bool] = is_valid_alias,
+    remove_stale: bool = False,
+    keep_existing: bool = False,
+) -> AliasPlan:
+    """Plan the aliases for ``view``.
+
+    ``cells`` limits planning to rows whose label or value cell is listed;
+    ``None`` plans the whole sheet. The planner never calls into FreeCAD
+    (unless ``is_valid`` does) but records planned aliases and placeholder
+    values in ``view``, and through ``view.index`` in the document namespace
+    it may be attached to. ``apply_plan`` and the next plan rely on that
+    state, so plan where the view is used: a throw-away view can be planned
+    in a worker process (see ``headless/``), a snapshot only on the main thread.
+
+    ``view.produced`` maps every label to the alias planned for it. With
+    ``remove_stale``, the alias of a listed label that no longer qualifies
+    (cleared, turned into a number, ...) is removed before new aliases are
+    chosen, so a moved label can take its old name along.
+
+    With ``keep_existing``, value cells that already carry an alias keep it
+    and their labels are not planned; other labels are planned around those
+    aliases instead of around renames that will never be written.
+    """
+    plan = AliasPlan()
+    if cells is None:
+        source_cells = _source_cells(view, view.contents)
+        stale_cells: Iterable[int] = list(view.produced)
+    else:
+        affected = _affected_cells(cells)
+        source_cells = _source_cells(view, affected)
+        stale_cells = [cell for cell in affected if cell in view.produced]
+    if remove_stale:
+        sources = set(source_cells)
+        for label_cell in sorted(cell for cell in stale_cells if cell not in sources):
+            _plan_removal(view, plan, label_cell)
+    if not source_cells:
+        return plan
+
+    index = view.index
+    index.begin_sync()
+    base_aliases = to_valid_aliases(view.contents.get(cell, "") for cell in source_cells)
+
+    for name_cell in source_cells:
+        raw_name = view.contents.get(name_cell, "")
+        target_cell = right_of(name_cell)
+        if not raw_name or target_cell is None:
+            continue
+        if keep_existing and index.alias_of(target_cell):
+            continue
+
+        base_alias = base_aliases[raw_name]
+        chosen_alias = index.allocate(base_alias, target_cell, is_valid)
+        if not chosen_alias:
+            plan.skipped.append((name_cell, raw_name))
+            continue
+        view.produced[name_cell] = chosen_alias
+
+        if target_cell not in view.contents:
+            # Keep target cell usable as a value cell if it was untouched.
+            plan.values.append(target_cell)
+            view.contents[target_cell] = PLACEHOLDER_VALUE
+
+        if index.owner(chosen_alias) == target_cell:
+            continue
+
+        plan.aliases.append(PlannedAlias(target_cell, chosen_alias, base_alias, index.alias_of(target_cell), raw_name))
+        index.assign(target_cell, chosen_alias)
+
+    return plan
+
+
+def plan_report(plan: AliasPlan) -> Dict[str, List[Dict[str, str]]]:
+    """JSON-friendly summary of ``plan`` using A1-style addresses.
+
+    ``aliases`` lists every alias that would be set (new or renamed),
+    ``collisions`` the subset that needs a suffix because the label's own
+    name is taken, ``removals`` aliases of cleared labels (with
+    ``remove_stale``), ``skipped`` labels
+    without a usable alias and ``initialised`` the cells that would be set to 0.
+    """
+    report: Dict[str, List[Dict[str, str]]] = {
+        "aliases": [],
+        "collisions": [],
+        "removals": [],
+        "skipped": [{"cell": format_cell(cell), "label": label} for cell, label in plan.skipped],
+        "initialised": [{"cell": format_cell(cell), "value": PLACEHOLDER_VALUE} for cell in plan.values],
+    }
+    for entry in plan.aliases:
+        row = {
+            "cell": format_cell(entry.cell),
+            "label_cell": format_cell(left_of(entry.cell)),
+            "label": entry.label,
+            "alias": entry.alias,
+            "previous": entry.previous,
+        }
+        if not entry.alias:
+            report["removals"].append(row)
+            continue
+        report["aliases"].append(row)
+        if entry.alias != entry.base:
+            report["collisions"].append({**row, "base": entry.base})
+    return report
+
+
+def stale_aliases(view: SheetView) -> List[Tuple[int, str]]:
+    """``(value cell, alias)`` pairs whose label no longer produces them.
+
+    Only labels the planner has seen are checked, so this costs one lookup per
+    generated alias instead of a scan of the sheet.
+    """
+    stale = []
+    for label_cell, alias in sorted(view.produced.items()):
+        target = right_of(label_cell)
+        if target is None or view.index.alias_of(target) != alias:
+            continue
+        if not _source_cells(view, [label_cell]):
+            stale.append((target, alias))
+    return stale
+
+
+def plan_stale_cleanup(view: SheetView) -> AliasPlan:
+    """Plan the removal of every alias reported by ``stale_aliases``."""
+    plan = AliasPlan()
+    for target, _alias in stale_aliases(view):
+        _plan_removal(view, plan, left_of(target))
+    return plan
+
+
+def looks_like_name_cell(text: str) -> bool:
+    cleaned = (text or "").strip()
+    if not cleaned:
+        return False
+    if cleaned.startswith("="):
+        return False
+    if cleaned[0].isdigit():
+        return False
+    if not any(ch.isalpha() for ch in cleaned):
+        return False
+    return True
+
+
+def _plan_removal(view: SheetView, plan: AliasPlan, label_cell: int) -> None:
+    alias = view.produced.pop(label_cell)
+    target = right_of(label_cell)
+    # Leave the cell alone when someone else has changed its alias since.
+    if target is None or view.index.alias_of(target) != alias:
+        return
+    plan.aliases.append(PlannedAlias(target, "", "", alias, view.contents.get(label_cell, "")))
+    view.index.assign(target, "")
+
+
+def _affected_cells(dirty: Iterable[int]) -> Set[int]:
+    # A changed cell matters as a label (itself) and as a value cell (its left neighbor).
+    affected: Set[int] = set(dirty)
+    for cell in list(affected):
+        left = left_of(cell)
+        if left is not None:
+            affected.add(left)
+    return affected
+
+
+def _source_cells(view: SheetView, cells: Iterable[int]) -> List[int]:
+    # Packed cells sort row-major, so no (row, col) tuples are needed.
+    return sorted(
+        cell
+        for cell in cells
+        if col_of(cell) < MAX_COLUMN_INDEX
+        # Do not treat existing value/alias cells as source labels.
+        and cell not in view.aliases
+        and looks_like_name_cell(view.contents.get(cell, ""))
+    )
@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
-import re
-from typing import Iterable, List, Optional, Tuple
-
-from .camel_case import to_valid_alias
-from .logging_utils import info, warn
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .alias_index import AliasNamespace
+from .alias_plan import (
+    PLACEHOLDER_VALUE,
+    AliasPlan,
+    PlannedAlias,
+    is_valid_alias,
+    looks_like_name_cell,
+    plan_aliases,
+    plan_report,
+    plan_stale_cleanup,
+)
+from .camel_case import to_valid_aliases
+from .cells import address_to_cell, format_cell, left_of, parse_cell, right_of, row_of
+from .logging_utils import MessageBatch, info
 from .prefs import Preferences
-
-CELL_RE = re.compile(r"^([A-Z]+)([1-9][0-9]*)$")
-MAX_COLUMN_INDEX = 16384  # XFD
+from .sheet_scan import cell_count
+from .sheet_view import SheetView
+from .spreadsheet_utils import document_key, sheet_key
+from .stats import StatsRecorder
+from .write_batch import WriteBatch
 
 
 class AliasService:
-    def __init__(self, prefs: Preferences) -> None:
+    def __init__(self, prefs: Preferences, stats: Optional[StatsRecorder] = None) -> None:
         self._prefs = prefs
+        self._stats = stats
+        self._snapshots: Dict[str, SheetView] = {}
+        # document key -> aliases of all its sheets, only in document-unique mode
+        self._namespaces: Dict[str, AliasNamespace] = {}
+        self._document_unique = False
+        # Sheets read only to fill a namespace, or too large for an automatic
+        # sync; their next (allowed) sync plans every row.
+        self._unplanned: Set[str] = set()
+        # Sheets whose automatic sync was skipped for size, so that is reported once.
+        self._oversized: Set[str] = set()
+        # Sheets whose snapshot may be outdated everywhere; their next sync re-reads every cell.
+        self._rescan: Set[str] = set()
+        # sheet key -> label cell -> alias generated for it (``SheetView.produced``);
+        # outlives the snapshots so ``clean_stale_aliases`` still works after a rescan.
+        self._produced: Dict[str, Dict[int, str]] = {}
 
     def sync_document(self, document: object) -> int:
         total = 0
@@ -23,142 +51,429 @@ class AliasService:
             total += self.sync_sheet(sheet)
         return total
 
-    def sync_sheet(self, sheet: object) -> int:
+    def dry_run_document(self, document: object) -> List[Dict[str, object]]:
+        """Plan every sheet of ``document`` without writing; see ``dry_run_sheet``."""
+        sheets = list(self.iter_document_sheets(document))
+        views = [SheetView.read(sheet, self._prefs.probe_limits()) for sheet in sheets]
+        if self._prefs.is_document_unique_aliases():
+            namespace = AliasNamespace()
+            for sheet, view in zip(sheets, views):
+                view.index.attach(namespace, sheet_key(sheet))
+        return [self._dry_run(sheet, view) for sheet, view in zip(sheets, views)]
+
+    def dry_run_sheet(self, sheet: object) -> Dict[str, object]:
+        """Report what a full sync of ``sheet`` would change, without changing anything.
+
+        The sheet is read once into a throw-away view, so neither the sheet nor
+        the cached snapshots are touched, and no transaction or recompute runs.
+        In document-unique mode the aliases of the other sheets are taken into
+        account as the real sync would. The result holds ``sheet``/``label``
+        plus the lists of ``plan_report``.
+        """
+        view = SheetView.read(sheet, self._prefs.probe_limits())
+        if self._prefs.is_document_unique_aliases():
+            view.index.attach(self._dry_run_namespace(sheet), sheet_key(sheet))
+        return self._dry_run(sheet, view)
+
+    def _dry_run_namespace(self, sheet: object) -> AliasNamespace:
+        """Aliases of the other sheets of ``sheet``'s document, from their snapshots where possible."""
+        namespace = AliasNamespace()
+        key = sheet_key(sheet)
+        for other in self.iter_document_sheets(getattr(sheet, "Document", None)):
+            other_key = sheet_key(other)
+            if other_key == key:
+                continue
+            view = self._snapshots.get(other_key) or SheetView.read(other, self._prefs.probe_limits())
+            for cell, alias in view.aliases.items():
+                namespace.claim(alias, other_key, cell)
+        return namespace
+
+    def _dry_run(self, sheet: object, view: SheetView) -> Dict[str, object]:
+        # The labels the plugin generated aliases for, so cleared ones show up as removals.
+        view.produced.update(self._produced.get(sheet_key(sheet), {}))
+        plan = plan_aliases(view, None, self._alias_validator(sheet), self._prefs.is_remove_stale_aliases())
+        report: Dict[str, object] = {
+            "sheet": getattr(sheet, "Name", ""),
+            "label": getattr(sheet, "Label", getattr(sheet, "Name", "")),
+        }
+        report.update(plan_report(plan))
+        return report
+
+    def forget(self, sheet: object) -> None:
+        """Drop everything known about ``sheet``, e.g. once it is deleted."""
+        key = sheet_key(sheet)
+        for keys in (self._unplanned, self._oversized, self._rescan):
+            keys.discard(key)
+        self._produced.pop(key, None)
+        view = self._snapshots.pop(key, None)
+        if view is not None:
+            # Releases the sheet's aliases; the namespace stays with the other sheets.
+            view.index.detach()
+
+    def invalidate(self, sheet: Optional[object] = None) -> None:
+        """Make the next sync of ``sheet`` (or of all sheets) re-read and re-plan every cell.
+
+        A single sheet keeps its snapshot until then, so in document-unique
+        mode its aliases stay claimed in the document's namespace. The labels
+        the plugin generated aliases for are kept as well, see ``forget``.
+        """
+        if sheet is None:
+            self._snapshots.clear()
+            self._namespaces.clear()
+            self._unplanned.clear()
+            self._rescan.clear()
+            return
+        key = sheet_key(sheet)
+        if key in self._snapshots:
+            self._rescan.add(key)
+            self._unplanned.add(key)
+
+    def sync_sheet(self, sheet: object, changed_cells: Optional[Iterable[str]] = None, max_cells: int = 0) -> int:
+        """Sync aliases of ``sheet``.
+
+        The first sync of a sheet scans every non-empty cell and stores a snapshot.
+        Later syncs only reprocess rows whose label or value cell changed: either the
+        cells listed in ``changed_cells``, or the cells whose content/alias differs
+        from the snapshot when no hint is given. With ``max_cells``, a sheet with
+        more non-empty cells is skipped, see ``is_oversized``.
+        """
         if not self._is_sheet_object(sheet):
             return 0
 
-        source_cells = self._source_cells(sheet)
-        if not source_cells:
-            return 0
+        stats = self._stats
+        if stats is None or not stats.enabled:
+            return self._sync_sheet(sheet, changed_cells, max_cells)[0]
 
-        updates = 0
-        label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
+        proxy = stats.start(sheet)
+        updates, scanned = self._sync_sheet(proxy, changed_cells, max_cells)
+        stats.finish(proxy, scanned, updates)
+        return updates
 
-        for name_cell in source_cells:
-            raw_name = self._cell_text(sheet, name_cell)
-            target_cell = self._cell_to_right(name_cell)
-            if not raw_name or not target_cell:
-                continue
+    def is_oversized(self, sheet: object) -> bool:
+        """Whether the last sync of ``sheet`` was skipped for exceeding ``max_cells``."""
+        return sheet_key(sheet) in self._oversized
 
-            base_alias = to_valid_alias(raw_name)
-            chosen_alias = self._choose_alias(sheet, base_alias, target_cell)
-            if not chosen_alias:
-                warn(f"Skipping {name_cell}: alias for '{raw_name}' could not be generated.")
-                continue
+    def sync_range(self, sheet: object, cells: Iterable[int]) -> int:
+        """Sync only the rows whose label or value cell is in ``cells`` (packed cells).
 
-            if self._cell_is_empty(sheet, target_cell):
-                # Keep target cell usable as a value cell if it was untouched.
-                self._set_cell(sheet, target_cell, "0")
+        Without a snapshot of ``sheet`` only ``cells`` and their left and right
+        neighbours are read, so the cost follows the range, not the sheet. The
+        throw-away view learns where the labels' base names are held through
+        ``getAddressFromAlias``; other duplicates are found when ``setAlias``
+        rejects them and the row gets the next free suffix. With a snapshot, or
+        in document-unique mode, this is a hinted ``sync_sheet``.
+        """
+        if not self._is_sheet_object(sheet):
+            return 0
+        cells = set(cells)
+        self._check_document_unique()
+        if self._document_unique or sheet_key(sheet) in self._snapshots:
+            return self.sync_sheet(sheet, [format_cell(cell) for cell in cells])
+
+        stats = self._stats
+        proxy = stats.start(sheet) if stats is not None and stats.enabled else None
+        target = proxy if proxy is not None else sheet
+        read = sorted(_with_neighbours(cells))
+        view = SheetView.read_cells(target, read)
+        self._seed_base_owners(target, view)
+        is_valid = self._alias_validator(target)
+        updates = self.apply_plan(target, view, plan_aliases(view, cells, is_valid), is_valid)
+        if proxy is not None:
+            stats.finish(proxy, len(read), updates)
+        self._log_updates(sheet, updates)
+        return updates
 
-            if self._alias_points_to(sheet, chosen_alias, target_cell):
+    def _seed_base_owners(self, sheet: object, view: SheetView) -> None:
+        # A row outside the view may own a label's base name; without it the
+        # planner would move a suffixed alias back to the base name.
+        index = view.index
+        labels = (text for text in view.contents.values() if looks_like_name_cell(text))
+        for base in sorted(set(to_valid_aliases(labels).values())):
+            if index.owner(base) is not None:
                 continue
+            owner = self._get_alias_cell(sheet, base)
+            if owner is not None and not index.alias_of(owner):
+                index.assign(owner, base)
+
+    def clean_stale_aliases(self, sheet: object) -> int:
+        """Remove aliases whose label was cleared since the plugin created them.
 
-            if self._set_alias(sheet, target_cell, chosen_alias):
-                updates += 1
-            else:
-                warn(f"Failed to set alias '{chosen_alias}' at {target_cell}.")
+        The sheet is synced first; the cleanup then only visits the labels the
+        plugin generated aliases for. Returns the number of aliases removed.
+        """
+        if not self._is_sheet_object(sheet):
+            return 0
+        self.sync_sheet(sheet)
+        view = self._snapshots.get(sheet_key(sheet))
+        if view is None:
+            return 0
+        removed = self.apply_plan(sheet, view, plan_stale_cleanup(view))
+        if removed:
+            label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
+            info(f"Removed {removed} stale alias(es) in spreadsheet '{label}'.")
+        return removed
+
+    def iter_sync_chunks(self, sheet: object, rows: int) -> Iterator[int]:
+        """Fully resync ``sheet``, planning ``rows`` sheet rows and writing at most
+        ``rows`` target cells per step.
+
+        The sheet is read in the first step; rows are then planned band by band,
+        so no step plans more than ``rows`` rows. Yields the number of aliases
+        written by each step; every step is its own transaction. Closing the
+        iterator early leaves the steps written so far in place and invalidates
+        the snapshot, so the next sync re-reads the sheet.
+        """
+        if not self._is_sheet_object(sheet):
+            return
+        self.invalidate(sheet)
+        stats = self._stats
+        proxy = stats.start(sheet) if stats is not None and stats.enabled else None
+        target = proxy if proxy is not None else sheet
+        updates = scanned = 0
+        completed = False
+        try:
+            view, _dirty, is_valid, scanned = self._refresh_view(target, None)
+            remove_stale = self._prefs.is_remove_stale_aliases()
+            skipped = AliasPlan()
+            for band in _row_bands(view, rows):
+                plan = plan_aliases(view, band, is_valid, remove_stale)
+                # Reported once for the whole sheet, after the last band.
+                skipped.skipped.extend(plan.skipped)
+                plan.skipped = []
+                for chunk in plan.split(rows):
+                    written = self.apply_plan(target, view, chunk, is_valid)
+                    updates += written
+                    yield written
+            self.apply_plan(target, view, skipped)
+            completed = True
+        finally:
+            if not completed:
+                # The snapshot already holds the planned state of unwritten rows.
+                self.invalidate(sheet)
+            if proxy is not None:
+                stats.finish(proxy, scanned, updates)
+            self._log_updates(sheet, updates)
+
+    def _sync_sheet(
+        self, sheet: object, changed_cells: Optional[Iterable[str]], max_cells: int = 0
+    ) -> Tuple[int, int]:
+        """Run one sync and return ``(aliases written, cells scanned)``."""
+        view, plan, is_valid, scanned = self._plan_sheet(sheet, changed_cells, max_cells)
+        updates = self.apply_plan(sheet, view, plan, is_valid)
+        self._log_updates(sheet, updates)
+        return updates, scanned
+
+    def _plan_sheet(
+        self,
+        sheet: object,
+        changed_cells: Optional[Iterable[str]],
+        max_cells: int = 0,
+    ) -> Tuple[SheetView, AliasPlan, Callable[[str], bool], int]:
+        view, dirty, is_valid, scanned = self._refresh_view(sheet, changed_cells, max_cells)
+        if dirty is not None and not dirty:
+            return view, AliasPlan(), is_valid, scanned
+        return view, plan_aliases(view, dirty, is_valid, self._prefs.is_remove_stale_aliases()), is_valid, scanned
+
+    def _refresh_view(
+        self,
+        sheet: object,
+        changed_cells: Optional[Iterable[str]],
+        max_cells: int = 0,
+    ) -> Tuple[SheetView, Optional[Set[int]], Callable[[str], bool], int]:
+        """Bring the snapshot of ``sheet`` up to date.
+
+        Returns ``(view, cells to plan, validator, cells scanned)``; ``None``
+        means every row has to be planned, an empty set that none has.
+        """
+        self._check_document_unique()
+        key = sheet_key(sheet)
+        is_valid = self._alias_validator(sheet)
+        if max_cells:
+            # Decide on the cell count alone, so a skipped sheet is never read.
+            cells = cell_count(sheet)
+            if cells is not None and cells > max_cells:
+                self._skip_oversized(sheet, key, cells, max_cells)
+                return SheetView(), set(), is_valid, 0
+        if self._document_unique:
+            self._join_namespace(sheet, key)
+        view = self._snapshots.get(key)
+        full = view is None or key in self._unplanned
+        if view is None:
+            view = self._read_view(sheet, key)
+            dirty, scanned = None, len(view.contents)
+        else:
+            hint = None if key in self._rescan else changed_cells
+            dirty, scanned = self._refresh_snapshot(sheet, view, hint)
+        self._rescan.discard(key)
+        if max_cells and len(view.contents) > max_cells:
+            self._skip_oversized(sheet, key, len(view.contents), max_cells)
+            return view, set(), is_valid, scanned
+        self._oversized.discard(key)
+        self._unplanned.discard(key)
+        return view, None if full else dirty, is_valid, scanned
+
+    def _read_view(self, sheet: object, key: str) -> SheetView:
+        view = SheetView.read(sheet, self._prefs.probe_limits())
+        self._store_snapshot(key, view)
+        if self._document_unique:
+            view.index.attach(self._namespaces[document_key(sheet)], key)
+        return view
+
+    def _store_snapshot(self, key: str, view: SheetView) -> None:
+        view.produced = self._produced.setdefault(key, {})
+        self._snapshots[key] = view
+
+    def _join_namespace(self, sheet: object, key: str) -> None:
+        """Build the document's namespace on first use by reading every other sheet once."""
+        doc_key = document_key(sheet)
+        if doc_key in self._namespaces:
+            return
+        namespace = AliasNamespace()
+        self._namespaces[doc_key] = namespace
+        for other in self.iter_document_sheets(getattr(sheet, "Document", None)):
+            other_key = sheet_key(other)
+            view = self._snapshots.get(other_key)
+            if view is None:
+                if other_key == key:
+                    # Read by the caller, through the sheet it was given.
+                    continue
+                view = SheetView.read(other, self._prefs.probe_limits())
+                self._store_snapshot(other_key, view)
+                self._unplanned.add(other_key)
+            view.index.attach(namespace, other_key)
+        view = self._snapshots.get(key)
+        if view is not None:
+            view.index.attach(namespace, key)
+
+    def _skip_oversized(self, sheet: object, key: str, cells: int, max_cells: int) -> None:
+        # Rows changed meanwhile are not tracked; the next allowed sync re-reads and plans the whole sheet.
+        self._unplanned.add(key)
+        if key in self._snapshots:
+            self._rescan.add(key)
+        if key in self._oversized:
+            return
+        self._oversized.add(key)
+        label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
+        info(
+            f"Spreadsheet '{label}' has {cells} cells, more than AutoSyncMaxCells ({max_cells}); "
+            "it is not synced automatically. Use Create Alias Now."
+        )
+
+    def _check_document_unique(self) -> None:
+        enabled = self._prefs.is_document_unique_aliases()
+        if enabled != self._document_unique:
+            # Snapshots are attached to namespaces (or not) when they are read.
+            self.invalidate()
+            self._document_unique = enabled
+
+    def apply_plan(
+        self,
+        sheet: object,
+        view: SheetView,
+        plan: AliasPlan,
+        is_valid: Optional[Callable[[str], bool]] = None,
+    ) -> int:
+        """Write ``plan`` to ``sheet`` in one transaction and return the number of aliases set.
+
+        Must run on the main thread. Aliases the sheet rejects are rolled back in
+        ``view``; when another cell turns out to hold the alias, the row is given
+        the next free suffix and retried.
+        """
+        label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
+        if plan.skipped:
+            skipped = MessageBatch("label(s) skipped, no valid alias")
+            for name_cell, raw_name in plan.skipped:
+                skipped.add(f"{format_cell(name_cell)} '{raw_name}'")
+            skipped.flush(label)
+        if not len(plan):
+            return 0
 
+        batch = WriteBatch(sheet)
+        for cell in plan.values:
+            batch.set_cell(format_cell(cell), PLACEHOLDER_VALUE)
+        pending: Dict[int, PlannedAlias] = {}
+        for entry in plan.aliases:
+            pending[entry.cell] = entry
+            batch.set_alias(format_cell(entry.cell), entry.alias)
+
+        if is_valid is None:
+            is_valid = self._alias_validator(sheet)
+        rejected = MessageBatch("alias(es) could not be set")
+        with batch.transaction():
+            failed = batch.flush()
+            while failed:
+                self._requeue_failed(sheet, batch, view, pending, failed, is_valid, rejected)
+                failed = batch.flush()
+
+        count = len(pending) - len(rejected)
+        rejected.flush(label)
+        return count
+
+    def _log_updates(self, sheet: object, updates: int) -> None:
         if updates:
+            label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
             info(f"Synced {updates} alias(es) in spreadsheet '{label}'.")
-        return updates
 
     def iter_document_sheets(self, document: object) -> Iterable[object]:
         for obj in getattr(document, "Objects", []):
             if self._is_sheet_object(obj):
                 yield obj
 
-    def _source_cells(self, sheet: object) -> List[str]:
-        parsed: List[Tuple[int, int, str]] = []
-        for cell in self._iter_non_empty_cells(sheet):
-            parsed_cell = self._parse_cell(cell)
-            if parsed_cell is None:
+    def _refresh_snapshot(
+        self,
+        sheet: object,
+        snapshot: SheetView,
+        changed_cells: Optional[Iterable[str]],
+    ) -> Tuple[Set[int], int]:
+        cells = None
+        if changed_cells is not None:
+            cells = {cell for cell in map(address_to_cell, changed_cells) if cell is not None}
+        return snapshot.refresh(sheet, cells, self._prefs.probe_limits())
+
+    def _alias_validator(self, sheet: object) -> Callable[[str], bool]:
+        cache: Dict[str, bool] = {}
+
+        def is_valid(alias: str) -> bool:
+            if alias not in cache:
+                cache[alias] = self._is_valid_alias(sheet, alias)
+            return cache[alias]
+
+        return is_valid
+
+    def _requeue_failed(
+        self,
+        sheet: object,
+        batch: WriteBatch,
+        view: SheetView,
+        pending: Dict[int, PlannedAlias],
+        failed: List[Tuple[str, str]],
+        is_valid: Callable[[str], bool],
+        rejected: MessageBatch,
+    ) -> None:
+        index = view.index
+        for target_address, alias in failed:
+            target_cell = parse_cell(target_address)
+            entry = pending[target_cell]
+            previous = entry.previous
+            index.assign(target_cell, "" if index.owner(previous) is not None else previous)
+            # The index only knows aliases of non-empty cells; learn about hidden owners and retry.
+            occupied = self._get_alias_cell(sheet, alias)
+            if occupied is None or occupied == target_cell or index.owner(alias) == occupied:
+                rejected.add(f"'{alias}' at {target_address}")
                 continue
-            col_index, row_index = parsed_cell
-            text = self._cell_text(sheet, cell)
-            if not self._looks_like_name_cell(text):
+            index.assign(occupied, alias)
+            retry_alias = index.allocate(entry.base, target_cell, is_valid)
+            if not retry_alias:
+                rejected.add(f"'{entry.base}' at {target_address}")
                 continue
-            if self._cell_has_alias(sheet, cell):
-                # Do not treat existing value/alias cells as source labels.
+            if index.owner(retry_alias) == target_cell:
+                # The cell already carries the alias the retry would choose.
+                del pending[target_cell]
+                view.produced[left_of(target_cell)] = retry_alias
                 continue
-            if col_index >= MAX_COLUMN_INDEX:
-                continue
-            parsed.append((row_index, col_index, cell))
-        parsed.sort()
-        return [cell for _row, _col, cell in parsed]
-
-    def _iter_non_empty_cells(self, sheet: object) -> Iterable[str]:
-        if hasattr(sheet, "getNonEmptyCells"):
-            try:
-                for address in sheet.getNonEmptyCells():
-                    text = self._normalize_cell_address(address)
-                    if text:
-                        yield text
-                return
-            except Exception:
-                pass
-
-        # Fallback if getNonEmptyCells is unavailable.
-        max_rows = 2000
-        max_cols = 26
-        for row in range(1, max_rows + 1):
-            for col in range(1, max_cols + 1):
-                cell = f"{self._col_index_to_name(col)}{row}"
-                if self._cell_text(sheet, cell):
-                    yield cell
-
-    def _looks_like_name_cell(self, text: str) -> bool:
-        cleaned = (text or "").strip()
-        if not cleaned:
-            return False
-        if cleaned.startswith("="):
-            return False
-        if cleaned[0].isdigit():
-            return False
-        if not any(ch.isalpha() for ch in cleaned):
-            return False
-        return True
-
-    def _cell_to_right(self, cell: str) -> Optional[str]:
-        parsed = self._parse_cell(cell)
-        if parsed is None:
-            return None
-        col_index, row_index = parsed
-        right_col = col_index + 1
-        if right_col > MAX_COLUMN_INDEX:
-            return None
-        return f"{self._col_index_to_name(right_col)}{row_index}"
-
-    def _parse_cell(self, cell: str) -> Optional[Tuple[int, int]]:
-        match = CELL_RE.match((cell or "").upper())
-        if not match:
-            return None
-        col_name, row = match.groups()
-        return self._col_name_to_index(col_name), int(row)
-
-    def _col_name_to_index(self, name: str) -> int:
-        total = 0
-        for char in name:
-            total = total * 26 + (ord(char) - ord("A") + 1)
-        return total
-
-    def _choose_alias(self, sheet: object, base_alias: str, target_cell: str) -> str:
-        alias = base_alias
-        suffix = 2
-
-        while suffix < 1000:
-            if self._can_use_alias(sheet, alias, target_cell):
-                return alias
-            alias = f"{base_alias}{suffix}"
-            suffix += 1
-        return ""
-
-    def _can_use_alias(self, sheet: object, alias: str, target_cell: str) -> bool:
-        if not self._is_valid_alias(sheet, alias):
-            return False
-        occupied = self._get_alias_cell(sheet, alias)
-        if not occupied:
-            return True
-        return occupied.upper() == target_cell.upper()
+            index.assign(target_cell, retry_alias)
+            view.produced[left_of(target_cell)] = retry_alias
+            batch.set_alias(target_address, retry_alias)
 
     def _is_valid_alias(self, sheet: object, alias: str) -> bool:
         if hasattr(sheet, "isValidAlias"):
@@ -166,100 +481,45 @@ class AliasService:
                 return bool(sheet.isValidAlias(alias))
             except Exception:
                 return False
-        return bool(re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", alias))
+        return is_valid_alias(alias)
 
-    def _alias_points_to(self, sheet: object, alias: str, target_cell: str) -> bool:
-        occupied = self._get_alias_cell(sheet, alias)
-        return bool(occupied) and occupied.upper() == target_cell.upper()
-
-    def _get_alias_cell(self, sheet: object, alias: str) -> str:
+    def _get_alias_cell(self, sheet: object, alias: str) -> Optional[int]:
         if not hasattr(sheet, "getAddressFromAlias"):
-            return ""
-        try:
-            address = sheet.getAddressFromAlias(alias)
-        except Exception:
-            return ""
-        return self._normalize_cell_address(address)
-
-    def _normalize_cell_address(self, address: object) -> str:
-        if address is None:
-            return ""
-        if isinstance(address, str):
-            return address.strip().upper()
-        if hasattr(address, "toString"):
-            try:
-                text = str(address.toString() or "").strip().upper()
-                if text:
-                    return text
-            except Exception:
-                pass
-        if hasattr(address, "column") and hasattr(address, "row"):
-            try:
-                col = self._col_index_to_name(int(address.column) + 1)
-                row = int(address.row) + 1
-                return f"{col}{row}"
-            except Exception:
-                pass
-        return str(address).strip().upper()
-
-    def _set_alias(self, sheet: object, cell: str, alias: str) -> bool:
-        if not hasattr(sheet, "setAlias"):
-            return False
-        try:
-            sheet.setAlias(cell, alias)
-            return True
-        except Exception:
-            return False
-
-    def _cell_is_empty(self, sheet: object, cell: str) -> bool:
-        value = self._get_cell(sheet, cell)
-        if value is None:
-            return True
-        if isinstance(value, str):
-            return value.strip() == ""
-        return False
-
-    def _cell_text(self, sheet: object, cell: str) -> str:
-        value = self._get_cell(sheet, cell)
-        if value is None:
-            return ""
-        return str(value).strip()
-
-    def _get_cell(self, sheet: object, cell: str):
-        if not hasattr(sheet, "get"):
             return None
         try:
-            return sheet.get(cell)
+            address = sheet.getAddressFromAlias(alias)
         except Exception:
             return None
-
-    def _set_cell(self, sheet: object, cell: str, value: str) -> None:
-        if not hasattr(sheet, "set"):
-            return
-        try:
-            sheet.set(cell, str(value))
-        except Exception as exc:
-            warn(f"Unable to set cell {cell}: {exc}")
-
-    def _cell_has_alias(self, sheet: object, cell: str) -> bool:
-        if not hasattr(sheet, "getAlias"):
-            return False
-        try:
-            value = sheet.getAlias(cell)
-        except Exception:
-            return False
-        if value is None:
-            return False
-        return bool(str(value).strip())
+        return address_to_cell(address)
 
     def _is_sheet_object(self, obj: object) -> bool:
         type_id = getattr(obj, "TypeId", "")
         return isinstance(type_id, str) and type_id.startswith("Spreadsheet::Sheet")
 
-    def _col_index_to_name(self, one_based: int) -> str:
-        chars = []
-        value = one_based
-        while value > 0:
-            value, rem = divmod(value - 1, 26)
-            chars.append(chr(ord("A") + rem))
-        return "".join(reversed(chars)) or "A"
+
+def _row_bands(view: SheetView, rows: int) -> Iterator[List[int]]:
+    """Cells of ``view`` (contents and generated labels) in bands of at most ``rows`` sheet rows."""
+    cells = sorted(set(view.contents) | set(view.produced))
+    if rows <= 0:
+        yield cells
+        return
+    band: List[int] = []
+    first_row = 0
+    for cell in cells:
+        row = row_of(cell)
+        if band and row - first_row >= rows:
+            yield band
+            band = []
+        if not band:
+            first_row = row
+        band.append(cell)
+    if band:
+        yield band
+
+
+def _with_neighbours(cells: Set[int]) -> Set[int]:
+    # Labels left of value cells in the range, and value cells right of its labels.
+    result = set(cells)
+    for cell in cells:
+        result.update(neighbour for neighbour in (left_of(cell), right_of(cell)) if neighbour is not None)
+    return result
@@ -4,34 +4,187 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable
+
+# Labels rarely change between syncs, so normalised results are memoised.
+CACHE_SIZE = 8192
 
 WORD_RE = re.compile(r"[A-Za-z0-9]+")
 SEPARATOR_RE = re.compile(r"[\s-]+")
 IDENT_RE = re.compile(r"[^A-Za-z0-9_]")
 UNDERSCORE_RE = re.compile(r"_+")
-UMLAUT_MAP = str.maketrans(
-    {
-        "ä": "ae",
-        "ö": "oe",
-        "ü": "ue",
-        "Ä": "Ae",
-        "Ö": "Oe",
-        "Ü": "Ue",
-        "ß": "ss",
-    }
+
+# Letters whose accent-stripped form is not the usual spelling; everything
+# else in the Latin blocks is derived from its Unicode decomposition.
+LATIN_OVERRIDES = {
+    "ä": "ae",
+    "ö": "oe",
+    "ü": "ue",
+    "Ä": "Ae",
+    "Ö": "Oe",
+    "Ü": "Ue",
+    "ß": "ss",
+    "ẞ": "SS",
+    "æ": "ae",
+    "Æ": "Ae",
+    "œ": "oe",
+    "Œ": "Oe",
+    "ø": "oe",
+    "Ø": "Oe",
+    "đ": "d",
+    "Đ": "D",
+    "ð": "d",
+    "Ð": "D",
+    "þ": "th",
+    "Þ": "Th",
+    "ł": "l",
+    "Ł": "L",
+    "ı": "i",
+    "ħ": "h",
+    "Ħ": "H",
+    "ŋ": "ng",
+    "Ŋ": "Ng",
+    "ŧ": "t",
+    "Ŧ": "T",
+    "ƒ": "f",
+    # Micro sign, as in "µm".
+    "µ": "u",
+}
+
+# Lower-case transliterations; upper-case letters are capitalised versions.
+GREEK = {
+    "α": "a",
+    "β": "v",
+    "γ": "g",
+    "δ": "d",
+    "ε": "e",
+    "ζ": "z",
+    "η": "i",
+    "θ": "th",
+    "ι": "i",
+    "κ": "k",
+    "λ": "l",
+    "μ": "m",
+    "ν": "n",
+    "ξ": "x",
+    "ο": "o",
+    "π": "p",
+    "ρ": "r",
+    "σ": "s",
+    "ς": "s",
+    "τ": "t",
+    "υ": "y",
+    "φ": "f",
+    "χ": "ch",
+    "ψ": "ps",
+    "ω": "o",
+}
+
+CYRILLIC = {
+    "а": "a",
+    "б": "b",
+    "в": "v",
+    "г": "g",
+    "д": "d",
+    "е": "e",
+    "ё": "e",
+    "ж": "zh",
+    "з": "z",
+    "и": "i",
+    "й": "y",
+    "к": "k",
+    "л": "l",
+    "м": "m",
+    "н": "n",
+    "о": "o",
+    "п": "p",
+    "р": "r",
+    "с": "s",
+    "т": "t",
+    "у": "u",
+    "ф": "f",
+    "х": "kh",
+    "ц": "ts",
+    "ч": "ch",
+    "ш": "sh",
+    "щ": "shch",
+    "ъ": "",
+    "ы": "y",
+    "ь": "",
+    "э": "e",
+    "ю": "yu",
+    "я": "ya",
+    "є": "ye",
+    "і": "i",
+    "ї": "yi",
+    "ґ": "g",
+    "ў": "u",
+    "ђ": "dj",
+    "ј": "j",
+    "љ": "lj",
+    "њ": "nj",
+    "ћ": "c",
+    "џ": "dz",
+}
+
+# Latin-1 Supplement, Latin Extended-A/B, IPA, combining marks, Greek, Cyrillic,
+# Latin Extended Additional, Greek Extended, super-/subscripts, ligatures and
+# full-width forms.
+TRANSLITERATED_RANGES = (
+    (0x00A0, 0x02AF),
+    (0x0300, 0x04FF),
+    (0x1E00, 0x1FFF),
+    (0x2070, 0x209F),
+    (0xFB00, 0xFB06),
+    (0xFF01, 0xFF5E),
 )
 
 
+@lru_cache(maxsize=1)
+def _transliteration_table() -> Dict[int, str]:
+    """Code point -> ASCII replacement, built on the first non-ASCII label."""
+    scripts = dict(LATIN_OVERRIDES)
+    for letters in (GREEK, CYRILLIC):
+        for lower, ascii_text in letters.items():
+            scripts[lower] = ascii_text
+            scripts.setdefault(lower.upper(), ascii_text.capitalize())
+
+    table: Dict[int, str] = {}
+    for start, end in TRANSLITERATED_RANGES:
+        for code in range(start, end + 1):
+            char = chr(code)
+            if char in scripts:
+                table[code] = scripts[char]
+                continue
+            if unicodedata.combining(char):
+                table[code] = ""
+                continue
+            # Accented letters: look up the base letter without its marks.
+            base = "".join(ch for ch in unicodedata.normalize("NFKD", char) if not unicodedata.combining(ch))
+            if base in scripts:
+                table[code] = scripts[base]
+                continue
+            # Keep the ASCII part of compatibility forms, e.g. "½" -> "12", "Ŀ" -> "L".
+            ascii_text = "".join(ch for ch in base if ch.isascii())
+            if ascii_text:
+                table[code] = ascii_text
+    return table
+
+
 def _normalize_text(raw: str) -> str:
     text = (raw or "").strip()
-    if not text:
-        return ""
-    text = text.translate(UMLAUT_MAP)
-    # Drop other accents/diacritics but keep ASCII base chars.
-    text = unicodedata.normalize("NFKD", text)
-    return "".join(ch for ch in text if not unicodedata.combining(ch))
+    if not text or text.isascii():
+        return text
+    # Compose decomposed input (e.g. "a" + U+0308) so one table lookup per character suffices.
+    text = unicodedata.normalize("NFC", text).translate(_transliteration_table())
+    if text.isascii():
+        return text
+    # Characters outside the table (e.g. "ℓ", "①", "𝐱") keep their compatibility decomposition.
+    return "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def to_camel_case(raw: str) -> str:
     text = _normalize_text(raw)
     if not text:
@@ -46,6 +199,7 @@ def to_camel_case(raw: str) -> str:
     return head + tail
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def to_valid_alias(raw: str) -> str:
     text = _normalize_text(raw)
     if not text:
@@ -60,3 +214,26 @@ def to_valid_alias(raw: str) -> str:
     if alias[0].isdigit():
         alias = "v" + alias
     return alias
+
+
+def to_valid_aliases(labels: Iterable[str]) -> Dict[str, str]:
+    """Map every distinct label to its alias, normalising each unique string once."""
+    return {label: to_valid_alias(label) for label in set(labels)}
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    stats = {}
+    for name, func in (("to_valid_alias", to_valid_alias), ("to_camel_case", to_camel_case)):
+        info = func.cache_info()
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+    return stats
+
+
+def clear_caches() -> None:
+    to_valid_alias.cache_clear()
+    to_camel_case.cache_clear()
@@ -0,0 +1,107 @@
+"""Packed integer cell coordinates.
+
+Inside the plugin a cell is an ``int`` holding ``row << COL_BITS | column``
+(both one-based), so ordering packed cells sorts them row-major and the right
+neighbour of a cell is simply ``cell + 1``. Address strings such as ``"AB123"``
+are only parsed or built where values cross the FreeCAD API boundary.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import product
+from string import ascii_uppercase
+from typing import Dict, List, Optional, Tuple
+
+CELL_RE = re.compile(r"^([A-Z]+)([1-9][0-9]*)$")
+MAX_COLUMN_INDEX = 16384  # XFD
+COL_BITS = 15
+COL_MASK = (1 << COL_BITS) - 1
+DIGITS = "0123456789"
+
+
+def _build_column_names() -> Tuple[str, ...]:
+    names = [""]
+    for width in (1, 2, 3):
+        names.extend("".join(letters) for letters in product(ascii_uppercase, repeat=width))
+    return tuple(names[: MAX_COLUMN_INDEX + 1])
+
+
+# COLUMN_NAMES[1] == "A", COLUMN_NAMES[MAX_COLUMN_INDEX] == "XFD".
+COLUMN_NAMES = _build_column_names()
+COLUMN_INDEX: Dict[str, int] = {name: index for index, name in enumerate(COLUMN_NAMES) if name}
+
+
+def pack(row: int, col: int) -> int:
+    return (row << COL_BITS) | col
+
+
+def row_of(cell: int) -> int:
+    return cell >> COL_BITS
+
+
+def col_of(cell: int) -> int:
+    return cell & COL_MASK
+
+
+def parse_cell(address: str) -> Optional[int]:
+    text = (address or "").strip().upper()
+    col_name = text.rstrip(DIGITS)
+    row_text = text[len(col_name):]
+    col = COLUMN_INDEX.get(col_name)
+    if col is None or not row_text or row_text[0] == "0":
+        return None
+    return pack(int(row_text), col)
+
+
+def format_cell(cell: int) -> str:
+    return f"{COLUMN_NAMES[cell & COL_MASK]}{cell >> COL_BITS}"
+
+
+def parse_range(text: str) -> Optional[List[int]]:
+    """Cells of an ``A1:C20`` range (or of a single address), row-major; ``None`` if invalid."""
+    start_text, separator, end_text = (text or "").partition(":")
+    start = parse_cell(start_text)
+    end = parse_cell(end_text) if separator else start
+    if start is None or end is None:
+        return None
+    top, bottom = sorted((row_of(start), row_of(end)))
+    first, last = sorted((col_of(start), col_of(end)))
+    return [pack(row, col) for row in range(top, bottom + 1) for col in range(first, last + 1)]
+
+
+def right_of(cell: int) -> Optional[int]:
+    if cell & COL_MASK >= MAX_COLUMN_INDEX:
+        return None
+    return cell + 1
+
+
+def left_of(cell: int) -> Optional[int]:
+    if cell & COL_MASK <= 1:
+        return None
+    return cell - 1
+
+
+def is_cell_address(text: str) -> bool:
+    return bool(CELL_RE.match(text or ""))
+
+
+def address_to_cell(address: object) -> Optional[int]:
+    """Convert whatever FreeCAD returned for an address (str, CellAddress, ...) to a packed cell."""
+    if address is None:
+        return None
+    if isinstance(address, str):
+        return parse_cell(address)
+    if hasattr(address, "toString"):
+        try:
+            cell = parse_cell(str(address.toString() or ""))
+            if cell is not None:
+                return cell
+        except Exception:
+            pass
+    if hasattr(address, "column") and hasattr(address, "row"):
+        try:
+            return pack(int(address.row) + 1, int(address.column) + 1)
+        except Exception:
+            pass
+    return parse_cell(str(address))
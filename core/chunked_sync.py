@@ -0,0 +1,130 @@
+"""Cooperative manual sync that plans and writes a bounded number of rows per event-loop tick."""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, Optional
+
+from .freecad_api import Gui, QtCore, QtGui
+from .logging_utils import warn
+
+
+class ChunkedSync:
+    """Resyncs a list of sheets one chunk at a time.
+
+    Each ``step`` plans at most ``rows`` rows and writes at most ``rows``
+    target cells of one sheet in its own transaction, so cancelling between
+    steps leaves every written chunk complete. Sheets that were not finished
+    are re-read on their next sync.
+    """
+
+    def __init__(
+        self,
+        service,
+        sheets: Iterable[object],
+        rows: int,
+        on_finished: Optional[Callable[["ChunkedSync"], None]] = None,
+    ) -> None:
+        self._service = service
+        self.sheets = list(sheets)
+        self._rows = rows
+        self._on_finished = on_finished
+        self._chunks: Optional[Iterator[int]] = None
+        self._next_sheet = 0
+        self.sheets_done = 0
+        self.updated = 0
+        self.cancelled = False
+        self.finished = False
+        self.driver: Optional[_ProgressDriver] = None
+
+    @property
+    def current_label(self) -> str:
+        if not 0 < self._next_sheet <= len(self.sheets):
+            return ""
+        sheet = self.sheets[self._next_sheet - 1]
+        return str(getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet")))
+
+    def step(self) -> bool:
+        """Run one chunk; return ``False`` once there is nothing left to do."""
+        if self.finished:
+            return False
+        if self._chunks is None:
+            if self._next_sheet >= len(self.sheets):
+                self._finish()
+                return False
+            sheet = self.sheets[self._next_sheet]
+            self._next_sheet += 1
+            self._chunks = self._service.iter_sync_chunks(sheet, self._rows)
+        try:
+            self.updated += next(self._chunks)
+        except StopIteration:
+            self._sheet_done()
+        except Exception as exc:
+            warn(f"Alias sync failed for '{self.current_label}': {exc}")
+            self._sheet_done()
+        return True
+
+    def run(self) -> int:
+        """Run the remaining steps synchronously and return the aliases written."""
+        while self.step():
+            pass
+        return self.updated
+
+    def cancel(self) -> None:
+        if self.finished:
+            return
+        self.cancelled = True
+        if self._chunks is not None:
+            self._chunks.close()
+            self._chunks = None
+        self._finish()
+
+    def _sheet_done(self) -> None:
+        self._chunks = None
+        self.sheets_done += 1
+
+    def _finish(self) -> None:
+        self.finished = True
+        if self._on_finished is not None:
+            self._on_finished(self)
+
+
+class _ProgressDriver:
+    """Runs a ``ChunkedSync`` from a zero-interval Qt timer behind a cancellable progress dialog."""
+
+    def __init__(self, job: ChunkedSync) -> None:
+        self._job = job
+        self._dialog = QtGui.QProgressDialog(
+            "Creating spreadsheet aliases...", "Cancel", 0, len(job.sheets), Gui.getMainWindow()
+        )
+        self._dialog.setWindowTitle("Create Alias Now")
+        self._dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self._dialog.setMinimumDuration(500)
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def _tick(self) -> None:
+        if self._dialog.wasCanceled():
+            self._job.cancel()
+        elif self._job.step():
+            # Updated per chunk, so a single large sheet still shows progress.
+            self._dialog.setLabelText(
+                f"Creating aliases in '{self._job.current_label}'... {self._job.updated} alias(es) written"
+            )
+            self._dialog.setValue(self._job.sheets_done)
+            return
+        self._timer.stop()
+        self._dialog.close()
+        self._dialog.deleteLater()
+
+
+def start_with_progress(job: ChunkedSync) -> bool:
+    """Run ``job`` in the background of the Qt event loop; ``False`` when there is no GUI."""
+    if Gui is None or QtCore is None or QtGui is None or not hasattr(Gui, "getMainWindow"):
+        return False
+    job.driver = _ProgressDriver(job)
+    job.driver.start()
+    return True
@@ -7,13 +7,39 @@ import os
 PARAM_PATH = "User parameter:BaseApp/Preferences/Mod/SketcherAutoAlias"
 
 PREF_AUTO_ALIAS_ENABLED = "AutoAliasEnabled"
+PREF_SYNC_DELAY_MS = "SyncDelayMs"
+PREF_PROBE_MAX_ROWS = "ProbeMaxRows"
+PREF_PROBE_MAX_COLUMNS = "ProbeMaxColumns"
+PREF_PROBE_EMPTY_RUN = "ProbeEmptyRun"
+PREF_SYNC_STATS_ENABLED = "SyncStatsEnabled"
+PREF_SYNC_CHUNK_ROWS = "SyncChunkRows"
+PREF_DOCUMENT_UNIQUE_ALIASES = "DocumentUniqueAliases"
+PREF_REMOVE_STALE_ALIASES = "RemoveStaleAliases"
+PREF_AUTO_SYNC_MAX_CELLS = "AutoSyncMaxCells"
+PREF_EXCLUDED_SHEETS = "ExcludedSheets"
+PREF_AUTO_SYNC_RANGES = "AutoSyncRanges"
 
 DEFAULT_AUTO_ALIAS_ENABLED = True
+DEFAULT_SYNC_DELAY_MS = 250
+DEFAULT_PROBE_MAX_ROWS = 10000
+DEFAULT_PROBE_MAX_COLUMNS = 702  # ZZ
+DEFAULT_PROBE_EMPTY_RUN = 50
+DEFAULT_SYNC_STATS_ENABLED = False
+DEFAULT_SYNC_CHUNK_ROWS = 500
+DEFAULT_DOCUMENT_UNIQUE_ALIASES = False
+DEFAULT_REMOVE_STALE_ALIASES = False
+DEFAULT_AUTO_SYNC_MAX_CELLS = 0  # no limit
+DEFAULT_EXCLUDED_SHEETS = ""
+DEFAULT_AUTO_SYNC_RANGES = ""  # whole sheets
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ICON_DIR = os.path.join(ROOT_DIR, "resources", "icons")
 ICON_TOGGLE = os.path.join(ICON_DIR, "toggle_auto_alias.svg")
 ICON_CREATE = os.path.join(ICON_DIR, "create_alias_now.svg")
+ICON_STATS = os.path.join(ICON_DIR, "show_sync_stats.svg")
+ICON_SYNC_SELECTION = os.path.join(ICON_DIR, "sync_selection.svg")
 
 COMMAND_TOGGLE = "SketcherAutoAlias_Toggle"
 COMMAND_CREATE_NOW = "SketcherAutoAlias_CreateAliasNow"
+COMMAND_SHOW_STATS = "SketcherAutoAlias_ShowSyncStats"
+COMMAND_SYNC_SELECTION = "SketcherAutoAlias_SyncSelection"
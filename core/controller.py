@@ -2,50 +2,41 @@
 
 from __future__ import annotations
 
-from typing import List, Set
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from .alias_service import AliasService
-from .constants import COMMAND_CREATE_NOW, COMMAND_TOGGLE
+from .cells import is_cell_address, parse_cell, parse_range, right_of
+from .chunked_sync import ChunkedSync, start_with_progress
 from .freecad_api import App, Gui
-from .logging_utils import info, warn
+from .logging_utils import details, info, warn
 from .observers import SpreadsheetObserver
 from .prefs import Preferences
-from .spreadsheet_utils import get_selected_sheets, is_sheet_object
-
-
-def _sheet_key(sheet: object) -> str:
-    document = getattr(sheet, "Document", None)
-    doc_file = getattr(document, "FileName", "")
-    if isinstance(doc_file, str) and doc_file.strip():
-        doc_name = doc_file.strip()
-    else:
-        doc_name = getattr(document, "Name", "<NoDocument>")
-    obj_name = getattr(sheet, "Name", "<NoName>")
-    return f"{doc_name}::{obj_name}"
+from .scheduler import SyncScheduler
+from .sheet_scan import content_fingerprint
+from .spreadsheet_utils import get_selected_sheets, is_sheet_object, iter_document_sheets, sheet_key
+from .stats import StatsRecorder
 
 
 class SketcherAutoAliasController:
     def __init__(self) -> None:
         self._prefs = Preferences()
-        self._alias_service = AliasService(self._prefs)
-        self._observer = SpreadsheetObserver(self.handle_sheet_change)
+        # Follows the preference, so the Parameter editor can switch recording on and off.
+        self._stats = StatsRecorder(self._prefs.is_sync_stats_enabled)
+        self._alias_service = AliasService(self._prefs, self._stats)
+        self._observer = SpreadsheetObserver(
+            self.handle_sheet_change, self.handle_sheet_removed, self.handle_document_restore
+        )
+        self._scheduler = SyncScheduler(self._sync_sheet_now, self._prefs.sync_delay_ms)
         self._observer_registered = False
-        self._commands_registered = False
         self._active_sync: Set[str] = set()
-
-    def command_names(self) -> List[str]:
-        return [COMMAND_TOGGLE, COMMAND_CREATE_NOW]
-
-    def register_commands(self) -> None:
-        if self._commands_registered or Gui is None:
-            return
-
-        from SketcherAutoAlias.commands.cmd_create_alias_now import CreateAliasNowCommand
-        from SketcherAutoAlias.commands.cmd_toggle_auto_alias import ToggleAutoAliasCommand
-
-        Gui.addCommand(COMMAND_TOGGLE, ToggleAutoAliasCommand(self))
-        Gui.addCommand(COMMAND_CREATE_NOW, CreateAliasNowCommand(self))
-        self._commands_registered = True
+        self._manual_job: Optional[ChunkedSync] = None
+        # sheet key -> content fingerprint right after its last sync
+        self._fingerprints: Dict[str, int] = {}
+        # Names of documents that are being loaded.
+        self._restoring: Set[str] = set()
+        # sheet key -> (AutoSyncRanges value, sheet names, cells it covers or None)
+        self._auto_ranges: Dict[str, Tuple[object, Tuple[str, ...], Optional[Set[int]]]] = {}
 
     def start_observer(self) -> None:
         if App is None or self._observer_registered:
@@ -73,17 +64,136 @@ class SketcherAutoAliasController:
         info(f"Automatic spreadsheet alias sync {state}.")
         return new_value
 
+    def is_sync_stats_enabled(self) -> bool:
+        return self._stats.enabled
+
+    def set_sync_stats_enabled(self, enabled: bool) -> None:
+        self._prefs.set_sync_stats_enabled(enabled)
+
+    def sync_stats(self) -> Dict[str, List[Dict[str, object]]]:
+        """Per-document and per-sheet sync statistics (empty while recording is off)."""
+        return self._stats.snapshot()
+
+    def reset_sync_stats(self) -> None:
+        self._stats.reset()
+
+    def show_sync_stats(self) -> None:
+        if not self._stats.enabled:
+            info(
+                "Alias sync statistics are off. Enable them with "
+                "SketcherAutoAlias.core.controller.get_controller().set_sync_stats_enabled(True)."
+            )
+            return
+        for line in self._stats.report().splitlines():
+            info(line)
+
+    def log_details(self) -> List[str]:
+        """Every item behind the summarised warnings so far (skipped labels, rejected aliases, ...)."""
+        return details()
+
     def is_active(self) -> bool:
         return App is not None and getattr(App, "ActiveDocument", None) is not None
 
     def run_manual_sync(self) -> int:
-        if App is None:
+        """Resync the selected (or all) sheets of the active document.
+
+        With a GUI the sync runs in chunks from the event loop behind a
+        cancellable progress dialog and 0 is returned right away; otherwise it
+        runs to completion and returns the number of aliases written.
+        """
+        if self._manual_job is not None:
+            warn("A manual sync is already running.")
+            return 0
+
+        sheets = self._manual_sheets()
+        if not sheets:
+            return 0
+
+        for sheet in sheets:
+            self._scheduler.discard(sheet)
+            # Writes of the manual run must not trigger automatic syncs of the same sheets.
+            self._active_sync.add(sheet_key(sheet))
+        job = ChunkedSync(self._alias_service, sheets, self._prefs.sync_chunk_rows(), self._finish_manual_sync)
+        self._manual_job = job
+        started = False
+        try:
+            started = start_with_progress(job)
+            return 0 if started else job.run()
+        finally:
+            if not started and not job.finished:
+                # The progress dialog failed to start; do not leave manual and automatic syncs blocked.
+                job.cancel()
+
+    def sync_selected_range(self) -> int:
+        """Sync only the rows of the cells selected in the active spreadsheet view.
+
+        Reads the selection and its neighbours, not the sheet, and returns the
+        number of aliases written.
+        """
+        sheet, ranges = self._selected_ranges()
+        cells = _cells_in_ranges(ranges)
+        if sheet is None or not cells:
+            warn("Select cells in a spreadsheet view first.")
+            return 0
+        key = sheet_key(sheet)
+        if key in self._active_sync:
             return 0
+        self._active_sync.add(key)
+        try:
+            updates = self._alias_service.sync_range(sheet, cells)
+        finally:
+            self._active_sync.discard(key)
+        self._fingerprints.pop(key, None)
+        if not updates:
+            info("Selected cells are up to date.")
+        return updates
+
+    def _selected_ranges(self) -> Tuple[Optional[object], List[str]]:
+        if Gui is None or not hasattr(Gui, "activeView"):
+            return None, []
+        try:
+            view = Gui.activeView()
+            # Only spreadsheet views offer these.
+            return view.getSheet(), list(view.selectedRanges())
+        except Exception:
+            return None, []
+
+    def clean_stale_aliases(self) -> int:
+        """Remove aliases of the selected (or all) sheets whose label cell was cleared."""
+        total = 0
+        for sheet in self._manual_sheets():
+            key = sheet_key(sheet)
+            if key in self._active_sync:
+                continue
+            self._active_sync.add(key)
+            try:
+                total += self._alias_service.clean_stale_aliases(sheet)
+            finally:
+                self._active_sync.discard(key)
+        if not total:
+            info("No stale aliases found.")
+        return total
+
+    def dry_run(self) -> List[Dict[str, object]]:
+        """Structured plan for the selected (or all) sheets of the active document; nothing is written."""
+        document = getattr(App, "ActiveDocument", None) if App is not None else None
+        if document is None:
+            return []
+        sheets = get_selected_sheets()
+        if sheets:
+            return [self._alias_service.dry_run_sheet(sheet) for sheet in sheets]
+        return self._alias_service.dry_run_document(document)
+
+    def _manual_sheets(self) -> List[object]:
+        if App is None:
+            return []
 
         document = getattr(App, "ActiveDocument", None)
         if document is None:
             warn("No active document.")
-            return 0
+            return []
+
+        self._scheduler.flush()
 
         sheets = get_selected_sheets()
         if not sheets:
@@ -91,34 +201,178 @@ class SketcherAutoAliasController:
 
         if not sheets:
             warn("No spreadsheets found. Create or select a spreadsheet first.")
-            return 0
+        return sheets
 
-        total = 0
-        for sheet in sheets:
-            total += self.handle_sheet_change(sheet, "ManualCommand", True)
+    def cancel_manual_sync(self) -> None:
+        if self._manual_job is not None:
+            self._manual_job.cancel()
 
-        if total:
+    def _finish_manual_sync(self, job: ChunkedSync) -> None:
+        self._manual_job = None
+        for sheet in job.sheets:
+            key = sheet_key(sheet)
+            self._active_sync.discard(key)
+            self._fingerprints.pop(key, None)
+
+        total = job.updated
+        if job.cancelled:
+            info(
+                f"Manual sync cancelled after {job.sheets_done} of {len(job.sheets)} spreadsheet(s). "
+                f"Updated {total} alias(es)."
+            )
+        elif total:
             info(f"Manual sync finished. Updated {total} alias(es).")
         else:
             info("Manual sync finished. Nothing to update.")
-        return total
 
-    def handle_sheet_change(self, sheet: object, _prop: str, force: bool) -> int:
+    def flush_pending(self) -> int:
+        return self._scheduler.flush()
+
+    def handle_sheet_removed(self, sheet: object) -> None:
+        if is_sheet_object(sheet):
+            self._scheduler.discard(sheet)
+            self._alias_service.forget(sheet)
+            self._fingerprints.pop(sheet_key(sheet), None)
+
+    def handle_document_restore(self, document: object, finished: bool) -> None:
+        """Hold back syncs while ``document`` loads, then queue one per sheet."""
+        name = getattr(document, "Name", "")
+        if not finished:
+            self._restoring.add(name)
+            return
+        self._restoring.discard(name)
+        if not self.is_enabled():
+            return
+        # Queued, not run: the syncs start once the GUI is idle after loading and
+        # run one sheet per event-loop tick, so many sheets do not freeze it at once.
+        sheets = [sheet for sheet in iter_document_sheets(document) if not self._is_excluded(sheet)]
+        self._scheduler.mark_dirty_spread(sheets)
+
+    def handle_sheet_change(self, sheet: object, prop: str) -> int:
         if not is_sheet_object(sheet):
             return 0
-        if not force and not self.is_enabled():
+        if self._is_restoring(sheet):
             return 0
+        if not self.is_enabled():
+            return 0
+        if self._is_excluded(sheet):
+            return 0
+        if self._stats.enabled:
+            self._stats.count_event(sheet)
+        # Cell-address properties tell us exactly which cell changed.
+        changed = [prop] if is_cell_address(prop) else None
+        range_cells = self._auto_range_cells(sheet)
+        if changed is not None and range_cells is not None and not _in_rows(parse_cell(prop), range_cells):
+            return 0
+        self._scheduler.mark_dirty(sheet, changed)
+        return 0
+
+    def _is_restoring(self, sheet: object) -> bool:
+        document = getattr(sheet, "Document", None)
+        if document is None:
+            return False
+        return getattr(document, "Name", "") in self._restoring or bool(getattr(document, "Restoring", False))
 
-        key = _sheet_key(sheet)
+    def _is_excluded(self, sheet: object) -> bool:
+        patterns = self._prefs.excluded_sheets()
+        if not patterns:
+            return False
+        names = {str(getattr(sheet, "Name", "")), str(getattr(sheet, "Label", ""))}
+        return any(fnmatchcase(name, pattern) for name in names for pattern in patterns)
+
+    def _auto_range_cells(self, sheet: object) -> Optional[Set[int]]:
+        """Cells automatic sync is limited to for ``sheet``; ``None`` syncs the whole sheet."""
+        configured = self._prefs.auto_sync_ranges()
+        if not configured:
+            return None
+        key = sheet_key(sheet)
+        names = (str(getattr(sheet, "Name", "")), str(getattr(sheet, "Label", "")))
+        cached = self._auto_ranges.get(key)
+        if cached is not None and cached[0] == configured and cached[1] == names:
+            return cached[2]
+        ranges = [
+            cell_range
+            for pattern, cell_range in configured
+            if not pattern or any(fnmatchcase(name, pattern) for name in names)
+        ]
+        cells = _cells_in_ranges(ranges) or None
+        self._auto_ranges[key] = (configured, names, cells)
+        return cells
+
+    def _sync_sheet_now(self, sheet: object, changed_cells: Optional[Iterable[str]]) -> int:
+        key = sheet_key(sheet)
         if key in self._active_sync:
             return 0
 
+        range_cells = self._auto_range_cells(sheet)
+        if range_cells is not None:
+            return self._sync_range_now(sheet, key, range_cells, changed_cells)
+
+        # Only unhinted syncs are fingerprinted: hashing the serialised cells costs
+        # as much as the sheet is large, a hinted sync only as much as the hint.
+        fingerprint = content_fingerprint(sheet) if changed_cells is None else None
+        if fingerprint is not None and self._fingerprints.get(key) == fingerprint:
+            # Nothing changed since the last sync (recompute touches, our own writes, ...).
+            return 0
+
+        self._active_sync.add(key)
+        try:
+            updates = self._alias_service.sync_sheet(sheet, changed_cells, self._prefs.auto_sync_max_cells())
+        finally:
+            self._active_sync.discard(key)
+        if fingerprint is None or self._alias_service.is_oversized(sheet):
+            # A hinted sync leaves the stored fingerprint outdated; a skipped
+            # sheet must sync once the limit allows it, even if unchanged.
+            self._fingerprints.pop(key, None)
+        else:
+            self._fingerprints[key] = content_fingerprint(sheet) if updates else fingerprint
+        return updates
+
+    def _sync_range_now(
+        self, sheet: object, key: str, range_cells: Set[int], changed_cells: Optional[Iterable[str]]
+    ) -> int:
+        # No fingerprint: hashing the serialised cells would cost as much as the sheet is large.
+        cells = range_cells
+        if changed_cells is not None:
+            changed = (parse_cell(address) for address in changed_cells)
+            cells = {cell for cell in changed if _in_rows(cell, range_cells)}
+        if not cells:
+            return 0
         self._active_sync.add(key)
         try:
-            return self._alias_service.sync_sheet(sheet)
+            updates = self._alias_service.sync_range(sheet, cells)
         finally:
             self._active_sync.discard(key)
+        self._fingerprints.pop(key, None)
+        return updates
+
+
+def _cells_in_ranges(ranges: Iterable[str]) -> Set[int]:
+    cells: Set[int] = set()
+    for cell_range in ranges:
+        cells.update(parse_range(cell_range) or ())
+    return cells
+
+
+def _in_rows(cell: Optional[int], range_cells: Set[int]) -> bool:
+    # A change matters when it is in the range or is the label of a value cell in it.
+    return cell is not None and (cell in range_cells or right_of(cell) in range_cells)
+
+
+_CONTROLLER: Optional[SketcherAutoAliasController] = None
+
+
+def get_controller() -> SketcherAutoAliasController:
+    """The plugin's controller, built on first use (see ``startup.py``)."""
+    global _CONTROLLER
+    if _CONTROLLER is None:
+        _CONTROLLER = SketcherAutoAliasController()
+    return _CONTROLLER
 
 
-CONTROLLER = SketcherAutoAliasController()
+def __getattr__(name: str):
+    # ``CONTROLLER`` stays importable for console snippets without being built at import time.
+    if name == "CONTROLLER":
+        return get_controller()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
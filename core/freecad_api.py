@@ -12,6 +12,12 @@ try:
 except Exception:  # pragma: no cover - only happens in console/no-gui runs
     Gui = None
 
+try:
+    from PySide import QtCore, QtGui  # type: ignore
+except Exception:  # pragma: no cover - Qt is only bundled with FreeCAD
+    QtCore = None
+    QtGui = None
+
 
 def has_app() -> bool:
     return App is not None
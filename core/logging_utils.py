@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict, deque
+from typing import Deque, List, Tuple
+
 from .freecad_api import App
 
 PREFIX = "[SketcherAutoAlias] "
 
+# Items quoted in a summary line; the rest are only kept for ``details()``.
+SAMPLE_SIZE = 5
+# Detail lines kept for ``details()``; older ones are dropped first.
+DETAIL_LIMIT = 10000
+# Seconds during which further summaries with the same key are suppressed.
+REPEAT_INTERVAL_S = 60.0
+# Summary keys remembered for rate limiting; the least recently reported go first.
+SUMMARY_KEY_LIMIT = 1000
+
+_details: Deque[str] = deque(maxlen=DETAIL_LIMIT)
+# summary key -> (time it was last printed, summaries suppressed since)
+_last_summary: OrderedDict[str, Tuple[float, int]] = OrderedDict()
+
 
 def _print(level: str, message: str) -> None:
     if App is None or not hasattr(App, "Console"):
@@ -30,3 +47,62 @@ def warn(message: str) -> None:
 def error(message: str) -> None:
     _print("err", message)
 
+
+class MessageBatch:
+    """Collects one kind of per-cell warning and prints it as a single summary line.
+
+    ``add`` only stores the item, so a broken sheet costs a list append per
+    cell instead of a report-view line. ``flush`` prints
+    ``'Params': 312 labels skipped (first 5: ...)`` and moves every item to
+    ``details()``. The same summary (same sheet, kind and quoted items)
+    repeated within ``REPEAT_INTERVAL_S`` (e.g. on every edit of a broken
+    sheet) is suppressed and counted in the next line that is printed.
+    """
+
+    def __init__(self, what: str) -> None:
+        self.what = what
+        self._items: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: str) -> None:
+        self._items.append(item)
+
+    def flush(self, where: str) -> None:
+        items, self._items = self._items, []
+        if not items:
+            return
+        prefix = f"'{where}': "
+        _details.extend(prefix + item for item in items)
+        sample = ", ".join(items[:SAMPLE_SIZE])
+        if len(items) > SAMPLE_SIZE:
+            sample = f"first {SAMPLE_SIZE}: {sample}, ..."
+        # Keyed on the quoted items rather than the count, so a different
+        # failure on the same sheet is still reported right away.
+        warn_limited(f"{where}\0{self.what}\0{sample}", f"{prefix}{len(items)} {self.what} ({sample}).")
+
+
+def warn_limited(key: str, message: str) -> None:
+    """``warn`` unless a message with ``key`` was printed less than ``REPEAT_INTERVAL_S`` ago."""
+    now = time.monotonic()
+    last = _last_summary.pop(key, None)
+    if last is not None and now - last[0] < REPEAT_INTERVAL_S:
+        _last_summary[key] = (last[0], last[1] + 1)
+        return
+    if last is not None and last[1]:
+        message = f"{message} ({last[1]} similar report(s) suppressed)"
+    _last_summary[key] = (now, 0)
+    while len(_last_summary) > SUMMARY_KEY_LIMIT:
+        _last_summary.popitem(last=False)
+    warn(message)
+
+
+def details() -> List[str]:
+    """Every item summarised by a ``MessageBatch`` so far, oldest first (bounded by ``DETAIL_LIMIT``)."""
+    return list(_details)
+
+
+def clear_details() -> None:
+    _details.clear()
+    _last_summary.clear()
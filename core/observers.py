@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
-from .spreadsheet_utils import is_sheet_object
+from .cells import is_cell_address
+from .spreadsheet_utils import is_sheet_object, iter_document_sheets
+from .write_batch import is_writing
+
+# Cell contents and aliases live in this property; per-cell value properties
+# are named after their address.
+CELLS_PROPERTY = "cells"
+
+
+def affects_cells(prop: str) -> bool:
+    """True for properties whose change can alter a label, value or alias."""
+    return prop == CELLS_PROPERTY or is_cell_address(prop)
 
 
 class SpreadsheetObserver:
-    def __init__(self, on_change: Callable[[object, str, bool], None]) -> None:
+    def __init__(
+        self,
+        on_change: Callable[[object, str], None],
+        on_removed: Optional[Callable[[object], None]] = None,
+        on_restore: Optional[Callable[[object, bool], None]] = None,
+    ) -> None:
         self._on_change = on_change
+        self._on_removed = on_removed
+        self._on_restore = on_restore
 
     def slotChangedObject(self, *args) -> None:  # noqa: N802 (FreeCAD naming)
         if len(args) < 2:
@@ -17,9 +35,12 @@ class SpreadsheetObserver:
         obj, prop = args[0], str(args[1])
         if not is_sheet_object(obj):
             return
-        if prop.startswith("View"):
+        # Label, column widths, alias value properties, ... cannot change what a sync decides.
+        if not affects_cells(prop):
             return
-        self._on_change(obj, prop, False)
+        if is_writing(obj):
+            return
+        self._on_change(obj, prop)
 
     def slotCreatedObject(self, *args) -> None:  # noqa: N802
         if not args:
@@ -27,5 +48,26 @@ class SpreadsheetObserver:
         obj = args[0]
         if not is_sheet_object(obj):
             return
-        self._on_change(obj, "CreatedObject", True)
+        self._on_change(obj, "CreatedObject")
+
+    def slotDeletedObject(self, *args) -> None:  # noqa: N802
+        if not args or self._on_removed is None:
+            return
+        obj = args[0]
+        if not is_sheet_object(obj):
+            return
+        self._on_removed(obj)
+
+    def slotDeletedDocument(self, *args) -> None:  # noqa: N802
+        if not args or self._on_removed is None:
+            return
+        for sheet in iter_document_sheets(args[0]):
+            self._on_removed(sheet)
+
+    def slotStartRestoreDocument(self, *args) -> None:  # noqa: N802
+        if args and self._on_restore is not None:
+            self._on_restore(args[0], False)
 
+    def slotFinishRestoreDocument(self, *args) -> None:  # noqa: N802
+        if args and self._on_restore is not None:
+            self._on_restore(args[0], True)
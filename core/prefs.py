@@ -2,19 +2,101 @@
 
 from __future__ import annotations
 
+import re
+from typing import Callable, Dict, Tuple, TypeVar
+
 from .constants import (
     DEFAULT_AUTO_ALIAS_ENABLED,
+    DEFAULT_AUTO_SYNC_MAX_CELLS,
+    DEFAULT_AUTO_SYNC_RANGES,
+    DEFAULT_DOCUMENT_UNIQUE_ALIASES,
+    DEFAULT_EXCLUDED_SHEETS,
+    DEFAULT_PROBE_EMPTY_RUN,
+    DEFAULT_PROBE_MAX_COLUMNS,
+    DEFAULT_PROBE_MAX_ROWS,
+    DEFAULT_REMOVE_STALE_ALIASES,
+    DEFAULT_SYNC_CHUNK_ROWS,
+    DEFAULT_SYNC_DELAY_MS,
+    DEFAULT_SYNC_STATS_ENABLED,
     PARAM_PATH,
     PREF_AUTO_ALIAS_ENABLED,
+    PREF_AUTO_SYNC_MAX_CELLS,
+    PREF_AUTO_SYNC_RANGES,
+    PREF_DOCUMENT_UNIQUE_ALIASES,
+    PREF_EXCLUDED_SHEETS,
+    PREF_PROBE_EMPTY_RUN,
+    PREF_PROBE_MAX_COLUMNS,
+    PREF_PROBE_MAX_ROWS,
+    PREF_REMOVE_STALE_ALIASES,
+    PREF_SYNC_CHUNK_ROWS,
+    PREF_SYNC_DELAY_MS,
+    PREF_SYNC_STATS_ENABLED,
 )
 from .freecad_api import App
+from .sheet_scan import ProbeLimits
+
+
+T = TypeVar("T")
+
+_PATTERN_SEPARATOR_RE = re.compile(r"[;,]")
+
+
+class _ParamObserver:
+    """Parameter-group observer that drops cached values when a preference changes."""
+
+    def __init__(self, cache: Dict[object, object]) -> None:
+        self._cache = cache
+
+    def OnChange(self, *args) -> None:  # noqa: N802 (FreeCAD naming)
+        # Derived values (parsed patterns, ...) depend on their key; changes are rare.
+        self._cache.clear()
 
 
 class Preferences:
+    """Plugin preferences, cached in memory.
+
+    Values are read from the parameter store once and kept until FreeCAD
+    reports a change in the group (the Parameter editor, a macro, ...), so the
+    observer hot path costs a dict lookup. Builds whose parameter groups cannot
+    be observed read the store every time.
+    """
+
     def __init__(self) -> None:
         self._group = App.ParamGet(PARAM_PATH) if App is not None else None
+        self._cache: Dict[object, object] = {}
+        self._observer = None
+        if self._group is not None and hasattr(self._group, "Attach"):
+            observer = _ParamObserver(self._cache)
+            try:
+                self._group.Attach(observer)
+                self._observer = observer
+            except Exception:
+                pass
+
+    def detach(self) -> None:
+        """Stop observing the parameter group; later reads go to the store."""
+        if self._observer is None:
+            return
+        try:
+            self._group.Detach(self._observer)
+        except Exception:
+            pass
+        self._observer = None
+        self._cache.clear()
+
+    def _cached(self, key: object, read: Callable[[], T]) -> T:
+        if self._observer is None:
+            return read()
+        try:
+            return self._cache[key]  # type: ignore[return-value]
+        except KeyError:
+            value = self._cache[key] = read()
+            return value
 
     def get_bool(self, key: str, default: bool) -> bool:
+        return self._cached(key, lambda: self._read_bool(key, default))
+
+    def _read_bool(self, key: str, default: bool) -> bool:
         if self._group is None:
             return default
         try:
@@ -26,9 +108,106 @@ class Preferences:
         if self._group is None:
             return
         self._group.SetBool(key, bool(value))
+        self._cache.clear()
+
+    def get_int(self, key: str, default: int) -> int:
+        return self._cached(key, lambda: self._read_int(key, default))
+
+    def _read_int(self, key: str, default: int) -> int:
+        if self._group is None:
+            return default
+        try:
+            return int(self._group.GetInt(key, default))
+        except Exception:
+            return default
+
+    def set_int(self, key: str, value: int) -> None:
+        if self._group is None:
+            return
+        self._group.SetInt(key, int(value))
+        self._cache.clear()
+
+    def get_string(self, key: str, default: str) -> str:
+        return self._cached(key, lambda: self._read_string(key, default))
+
+    def _read_string(self, key: str, default: str) -> str:
+        if self._group is None:
+            return default
+        try:
+            return str(self._group.GetString(key, default))
+        except Exception:
+            return default
+
+    def set_string(self, key: str, value: str) -> None:
+        if self._group is None:
+            return
+        self._group.SetString(key, str(value))
+        self._cache.clear()
 
     def is_auto_alias_enabled(self) -> bool:
         return self.get_bool(PREF_AUTO_ALIAS_ENABLED, DEFAULT_AUTO_ALIAS_ENABLED)
 
     def set_auto_alias_enabled(self, enabled: bool) -> None:
         self.set_bool(PREF_AUTO_ALIAS_ENABLED, enabled)
+
+    def is_sync_stats_enabled(self) -> bool:
+        return self.get_bool(PREF_SYNC_STATS_ENABLED, DEFAULT_SYNC_STATS_ENABLED)
+
+    def set_sync_stats_enabled(self, enabled: bool) -> None:
+        self.set_bool(PREF_SYNC_STATS_ENABLED, enabled)
+
+    def is_document_unique_aliases(self) -> bool:
+        return self.get_bool(PREF_DOCUMENT_UNIQUE_ALIASES, DEFAULT_DOCUMENT_UNIQUE_ALIASES)
+
+    def set_document_unique_aliases(self, enabled: bool) -> None:
+        self.set_bool(PREF_DOCUMENT_UNIQUE_ALIASES, enabled)
+
+    def is_remove_stale_aliases(self) -> bool:
+        return self.get_bool(PREF_REMOVE_STALE_ALIASES, DEFAULT_REMOVE_STALE_ALIASES)
+
+    def set_remove_stale_aliases(self, enabled: bool) -> None:
+        self.set_bool(PREF_REMOVE_STALE_ALIASES, enabled)
+
+    def sync_delay_ms(self) -> int:
+        return max(0, self.get_int(PREF_SYNC_DELAY_MS, DEFAULT_SYNC_DELAY_MS))
+
+    def sync_chunk_rows(self) -> int:
+        return max(1, self.get_int(PREF_SYNC_CHUNK_ROWS, DEFAULT_SYNC_CHUNK_ROWS))
+
+    def probe_limits(self) -> ProbeLimits:
+        return ProbeLimits(
+            self.get_int(PREF_PROBE_MAX_ROWS, DEFAULT_PROBE_MAX_ROWS),
+            self.get_int(PREF_PROBE_MAX_COLUMNS, DEFAULT_PROBE_MAX_COLUMNS),
+            self.get_int(PREF_PROBE_EMPTY_RUN, DEFAULT_PROBE_EMPTY_RUN),
+        )
+
+    def auto_sync_max_cells(self) -> int:
+        """Largest sheet (in non-empty cells) synced automatically; 0 means no limit."""
+        return max(0, self.get_int(PREF_AUTO_SYNC_MAX_CELLS, DEFAULT_AUTO_SYNC_MAX_CELLS))
+
+    def excluded_sheets(self) -> Tuple[str, ...]:
+        """Name/label patterns of sheets that automatic sync leaves alone."""
+        return self._cached((PREF_EXCLUDED_SHEETS, "patterns"), self._read_excluded_sheets)
+
+    def set_excluded_sheets(self, patterns: str) -> None:
+        self.set_string(PREF_EXCLUDED_SHEETS, patterns)
+
+    def _read_excluded_sheets(self) -> Tuple[str, ...]:
+        text = self._read_string(PREF_EXCLUDED_SHEETS, DEFAULT_EXCLUDED_SHEETS)
+        return tuple(part.strip() for part in _PATTERN_SEPARATOR_RE.split(text) if part.strip())
+
+    def auto_sync_ranges(self) -> Tuple[Tuple[str, str], ...]:
+        """``(sheet pattern, range)`` pairs automatic sync is limited to; an empty pattern matches every sheet."""
+        return self._cached((PREF_AUTO_SYNC_RANGES, "ranges"), self._read_auto_sync_ranges)
+
+    def set_auto_sync_ranges(self, ranges: str) -> None:
+        self.set_string(PREF_AUTO_SYNC_RANGES, ranges)
+
+    def _read_auto_sync_ranges(self) -> Tuple[Tuple[str, str], ...]:
+        text = self._read_string(PREF_AUTO_SYNC_RANGES, DEFAULT_AUTO_SYNC_RANGES)
+        ranges = []
+        for part in _PATTERN_SEPARATOR_RE.split(text):
+            pattern, _separator, cell_range = part.strip().rpartition("!")
+            if cell_range.strip():
+                ranges.append((pattern.strip(), cell_range.strip()))
+        return tuple(ranges)
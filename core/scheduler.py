@@ -0,0 +1,125 @@
+"""Debounced, coalescing scheduling of sheet syncs."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .freecad_api import Gui, QtCore
+from .logging_utils import warn
+from .spreadsheet_utils import sheet_key
+
+SyncCallback = Callable[[object, Optional[Set[str]]], int]
+
+
+def _qt_timer(callback: Callable[[], None]):
+    if QtCore is None or Gui is None:
+        return None
+    timer = QtCore.QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(callback)
+    return timer
+
+
+class SyncScheduler:
+    """Collects dirty sheets and runs one sync per sheet once edits go quiet.
+
+    ``mark_dirty`` only records the sheet (and the changed cells, if known) and
+    (re)starts a single-shot timer, so a burst of N edits costs one sync per sheet.
+    A delay of 0 runs the sync on the next idle tick of the event loop. Without a
+    Qt event loop (console mode, tests without a timer) syncs run immediately.
+
+    Sheets queued with ``mark_dirty_spread`` run one per timer tick instead, so
+    bulk work like a document restore hands control back to the event loop
+    between sheets.
+    """
+
+    def __init__(
+        self,
+        run: SyncCallback,
+        delay_ms: Callable[[], int],
+        timer_factory: Callable[[Callable[[], None]], object] = _qt_timer,
+    ) -> None:
+        self._run = run
+        self._delay_ms = delay_ms
+        self._timer_factory = timer_factory
+        self._timer = None
+        self._pending: Dict[str, Tuple[object, Optional[Set[str]]]] = {}
+        # Keys of pending full syncs that run one per tick.
+        self._spread: Set[str] = set()
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, sheet: object) -> bool:
+        return sheet_key(sheet) in self._pending
+
+    def mark_dirty(self, sheet: object, changed_cells: Optional[Iterable[str]] = None) -> None:
+        key = sheet_key(sheet)
+        # An edit makes the sheet due with the next tick.
+        self._spread.discard(key)
+        _previous, cells = self._pending.get(key, (sheet, set()))
+        if changed_cells is None or cells is None:
+            # Unknown change: the sync has to diff the whole sheet anyway.
+            cells = None
+        else:
+            cells.update(changed_cells)
+        self._pending[key] = (sheet, cells)
+        self._schedule()
+
+    def mark_dirty_spread(self, sheets: Iterable[object]) -> None:
+        """Queue a full sync of each of ``sheets``, running one sheet per timer tick."""
+        for sheet in sheets:
+            key = sheet_key(sheet)
+            if key in self._pending:
+                # Already due; just widen it to a full sync.
+                self._pending[key] = (sheet, None)
+                continue
+            self._pending[key] = (sheet, None)
+            self._spread.add(key)
+        if self._pending:
+            self._schedule()
+
+    def discard(self, sheet: object) -> None:
+        key = sheet_key(sheet)
+        self._pending.pop(key, None)
+        self._spread.discard(key)
+        if not self._pending and self._timer is not None:
+            self._timer.stop()
+
+    def flush(self, sheet: Optional[object] = None) -> int:
+        """Synchronously run pending syncs (all, or only the one for ``sheet``)."""
+        keys = list(self._pending)
+        if sheet is not None:
+            keys = [key for key in keys if key == sheet_key(sheet)]
+        return self._run_keys(keys)
+
+    def _run_keys(self, keys: List[str]) -> int:
+        batch: List[Tuple[object, Optional[Set[str]]]] = [self._pending.pop(key) for key in keys]
+        self._spread.difference_update(keys)
+        if not self._pending and self._timer is not None:
+            self._timer.stop()
+
+        total = 0
+        for pending_sheet, cells in batch:
+            try:
+                total += self._run(pending_sheet, cells)
+            except Exception as exc:
+                warn(f"Alias sync failed for '{getattr(pending_sheet, 'Name', '?')}': {exc}")
+        return total
+
+    def _schedule(self) -> None:
+        if self._timer is None:
+            self._timer = self._timer_factory(self._on_timeout)
+        if self._timer is None:
+            self.flush()
+            return
+        # Restarting the single-shot timer extends the quiet period.
+        self._timer.start(self._delay_ms())
+
+    def _on_timeout(self) -> None:
+        due = [key for key in self._pending if key not in self._spread]
+        spread = [key for key in self._pending if key in self._spread]
+        self._run_keys(due + spread[:1])
+        if self._spread and self._timer is not None:
+            # The next spread sheet runs on the next idle tick.
+            self._timer.start(0)
@@ -0,0 +1,209 @@
+"""Discovery of the non-empty cells of a spreadsheet."""
+
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cells import MAX_COLUMN_INDEX, address_to_cell, col_of, format_cell, pack, parse_cell, row_of
+from .constants import DEFAULT_PROBE_EMPTY_RUN, DEFAULT_PROBE_MAX_COLUMNS, DEFAULT_PROBE_MAX_ROWS
+from .logging_utils import warn_limited
+
+# Count attribute at the start of the serialised ``cells`` property.
+CELLS_COUNT_RE = re.compile(r'<Cells\s+Count="(\d+)"')
+
+
+class ProbeLimits:
+    """Bounds for the last-resort cell probe.
+
+    Probing stops a row after ``empty_run`` consecutive empty cells and the whole
+    scan after ``empty_run`` consecutive empty rows, so it costs roughly the used
+    area instead of ``max_rows * max_columns``.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = DEFAULT_PROBE_MAX_ROWS,
+        max_columns: int = DEFAULT_PROBE_MAX_COLUMNS,
+        empty_run: int = DEFAULT_PROBE_EMPTY_RUN,
+    ) -> None:
+        self.max_rows = max(1, int(max_rows))
+        self.max_columns = max(1, min(int(max_columns), MAX_COLUMN_INDEX))
+        self.empty_run = max(1, int(empty_run))
+
+
+def iter_non_empty_cells(sheet: object, limits: Optional[ProbeLimits] = None) -> Iterable[int]:
+    """Return packed cells that may hold content, using the cheapest API available.
+
+    Tries ``getNonEmptyCells``, then ``getUsedCells``, then the serialised
+    ``cells`` property, then the ``getUsedRange``/``getNonEmptyRange`` bounding
+    box and finally a bounded probe with early termination.
+    """
+    for method in ("getNonEmptyCells", "getUsedCells"):
+        cells = _from_address_list(sheet, method)
+        if cells is not None:
+            return cells
+
+    cells = _from_serialised_cells(sheet)
+    if cells is not None:
+        return cells
+
+    for method in ("getUsedRange", "getNonEmptyRange"):
+        cells = _from_used_range(sheet, method)
+        if cells is not None:
+            return cells
+
+    return _probe(sheet, limits or ProbeLimits())
+
+
+def cell_count(sheet: object) -> Optional[int]:
+    """Number of cells of ``sheet`` without reading them, or ``None`` when only a full read can tell.
+
+    Uses the length of ``getNonEmptyCells``/``getUsedCells`` or the ``Count``
+    of the serialised ``cells``, which also counts cells that only hold an
+    alias or formatting.
+    """
+    for method in ("getNonEmptyCells", "getUsedCells"):
+        func = getattr(sheet, method, None)
+        if func is None:
+            continue
+        try:
+            return len(func())
+        except Exception:
+            continue
+    content = _serialised_content(sheet)
+    if content is None:
+        return None
+    match = CELLS_COUNT_RE.search(content, 0, 200)
+    return int(match.group(1)) if match else None
+
+
+def _from_address_list(sheet: object, method: str) -> Optional[List[int]]:
+    func = getattr(sheet, method, None)
+    if func is None:
+        return None
+    try:
+        addresses = func()
+    except Exception:
+        return None
+    return [cell for cell in map(address_to_cell, addresses) if cell is not None]
+
+
+def serialised_cells(sheet: object) -> Optional[Dict[int, Tuple[str, str]]]:
+    """Read ``{cell: (content, alias)}`` from the serialised ``cells`` property in one call.
+
+    PropertySheet.Content is the same XML that is written into Document.xml:
+    ``<Cells Count="2"><Cell address="A1" content="width" /> ...</Cells>``.
+    Returns ``None`` when the property or its content is not available.
+    """
+    content = _serialised_content(sheet)
+    if content is None:
+        return None
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return None
+    cells: Dict[int, Tuple[str, str]] = {}
+    for element in root.iter("Cell"):
+        text = element.get("content") or ""
+        alias = element.get("alias") or ""
+        if not text.strip() and not alias:
+            continue
+        cell = parse_cell(element.get("address", ""))
+        if cell is not None:
+            cells[cell] = (text, alias)
+    return cells
+
+
+def content_fingerprint(sheet: object) -> Optional[int]:
+    """Hash of the serialised ``cells`` property, or ``None`` when it is not available.
+
+    Hashing the string is far cheaper than parsing it, so this is a quick way to
+    tell that nothing (contents, aliases or formatting) changed since a sync.
+    """
+    content = _serialised_content(sheet)
+    return None if content is None else hash(content)
+
+
+def _serialised_content(sheet: object) -> Optional[str]:
+    prop = getattr(sheet, "cells", None)
+    try:
+        content = getattr(prop, "Content", None)
+    except Exception:
+        return None
+    if not isinstance(content, str) or "<Cells" not in content:
+        return None
+    return content
+
+
+def _from_serialised_cells(sheet: object) -> Optional[List[int]]:
+    cells = serialised_cells(sheet)
+    if cells is None:
+        return None
+    return [cell for cell, (text, _alias) in cells.items() if text.strip()]
+
+
+def _from_used_range(sheet: object, method: str) -> Optional[List[int]]:
+    func = getattr(sheet, method, None)
+    if func is None:
+        return None
+    try:
+        first_address, last_address = func()
+    except Exception:
+        return None
+    first = address_to_cell(first_address)
+    last = address_to_cell(last_address)
+    if first is None or last is None:
+        return None
+
+    first_col, last_col = col_of(first), col_of(last)
+    cells = []
+    for row in range(row_of(first), row_of(last) + 1):
+        for col in range(first_col, last_col + 1):
+            cell = pack(row, col)
+            if _has_content(sheet, cell):
+                cells.append(cell)
+    return cells
+
+
+def _probe(sheet: object, limits: ProbeLimits) -> List[int]:
+    cells = []
+    empty_rows = 0
+    for row in range(1, limits.max_rows + 1):
+        found = False
+        empty_cols = 0
+        for col in range(1, limits.max_columns + 1):
+            cell = pack(row, col)
+            if _has_content(sheet, cell):
+                cells.append(cell)
+                found = True
+                empty_cols = 0
+            else:
+                empty_cols += 1
+                if empty_cols >= limits.empty_run:
+                    break
+        empty_rows = 0 if found else empty_rows + 1
+        if empty_rows >= limits.empty_run:
+            if row < limits.max_rows:
+                _warn_probe_gap(sheet, row, limits.empty_run)
+            break
+    return cells
+
+
+def _warn_probe_gap(sheet: object, row: int, empty_run: int) -> None:
+    # The probe cannot tell a gap from the end of the data; say where it gave up.
+    label = getattr(sheet, "Label", getattr(sheet, "Name", "Spreadsheet"))
+    warn_limited(
+        f"{label}\0probe\0{row}",
+        f"'{label}': cell probe stopped at row {row} after {empty_run} empty rows; "
+        "cells below a larger gap are not synced. Raise ProbeEmptyRun if the sheet has such gaps.",
+    )
+
+
+def _has_content(sheet: object, cell: int) -> bool:
+    try:
+        value = sheet.get(format_cell(cell))
+    except Exception:
+        return False
+    return value is not None and bool(str(value).strip())
@@ -0,0 +1,129 @@
+"""Local view of a sheet's cell contents and aliases."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from .alias_index import AliasIndex
+from .cells import format_cell
+from .sheet_scan import ProbeLimits, iter_non_empty_cells, serialised_cells
+
+
+def display_text(content: str) -> str:
+    # A leading apostrophe forces FreeCAD to treat the content as a string.
+    if content.startswith("'"):
+        return content[1:]
+    return content
+
+
+def read_cell(sheet: object, cell: int) -> Tuple[str, str]:
+    """Read ``(text, alias)`` of one cell through ``getContents``/``getAlias``."""
+    address = format_cell(cell)
+    return _cell_text(sheet, address), _cell_alias(sheet, address)
+
+
+def read_all_cells(sheet: object, limits: Optional[ProbeLimits] = None) -> Dict[int, Tuple[str, str]]:
+    """Read ``(text, alias)`` of every non-empty cell in as few API calls as possible.
+
+    The serialised ``cells`` property yields everything in a single call; only
+    when it is unavailable are the cells read one by one.
+    """
+    serialised = serialised_cells(sheet)
+    if serialised is not None:
+        return {cell: (display_text(text).strip(), alias.strip()) for cell, (text, alias) in serialised.items()}
+    return {cell: read_cell(sheet, cell) for cell in iter_non_empty_cells(sheet, limits)}
+
+
+class SheetView:
+    """Last known contents and aliases of one sheet, keyed by packed cell.
+
+    A sync runs entirely against this structure; only writes go back to the
+    real sheet, and they are mirrored here so the view stays current.
+    """
+
+    def __init__(self) -> None:
+        self.contents: Dict[int, str] = {}
+        self.index = AliasIndex()
+        # label cell -> alias the planner gave its value cell (see alias_plan.py)
+        self.produced: Dict[int, str] = {}
+
+    @classmethod
+    def read(cls, sheet: object, limits: Optional[ProbeLimits] = None) -> "SheetView":
+        view = cls()
+        for cell, (text, alias) in read_all_cells(sheet, limits).items():
+            view.record(cell, text, alias)
+        return view
+
+    @classmethod
+    def read_cells(cls, sheet: object, cells: Iterable[int]) -> "SheetView":
+        """View of only ``cells``, read one by one; for work that must not scale with the sheet."""
+        view = cls()
+        for cell in cells:
+            text, alias = read_cell(sheet, cell)
+            view.record(cell, text, alias)
+        return view
+
+    @property
+    def aliases(self) -> Dict[int, str]:
+        return self.index.cell_to_alias
+
+    def record(self, cell: int, text: str, alias: str) -> None:
+        if text:
+            self.contents[cell] = text
+        else:
+            self.contents.pop(cell, None)
+        self.index.assign(cell, alias)
+
+    def refresh(
+        self,
+        sheet: object,
+        cells: Optional[Iterable[int]] = None,
+        limits: Optional[ProbeLimits] = None,
+    ) -> Tuple[Set[int], int]:
+        """Re-read ``cells`` (or the whole sheet) and return ``(changed cells, cells read)``."""
+        if cells is not None:
+            current = {cell: read_cell(sheet, cell) for cell in cells}
+        else:
+            current = read_all_cells(sheet, limits)
+            # Cells that were cleared since the last read no longer show up.
+            for cell in set(self.contents) | set(self.aliases):
+                current.setdefault(cell, ("", ""))
+
+        dirty: Set[int] = set()
+        for cell, (text, alias) in current.items():
+            if (self.contents.get(cell, ""), self.aliases.get(cell, "")) != (text, alias):
+                self.record(cell, text, alias)
+                dirty.add(cell)
+        return dirty, len(current)
+
+
+def _cell_text(sheet: object, address: str) -> str:
+    # The raw content, as in the serialised ``cells``: ``get`` returns the
+    # evaluated value ("=<<depth>>" -> "depth", "5" -> 5.0).
+    if hasattr(sheet, "getContents"):
+        try:
+            value = sheet.getContents(address)
+        except Exception:
+            return ""
+        return display_text(str(value or "")).strip()
+    if not hasattr(sheet, "get"):
+        return ""
+    try:
+        value = sheet.get(address)
+    except Exception:
+        return ""
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _cell_alias(sheet: object, address: str) -> str:
+    if not hasattr(sheet, "getAlias"):
+        return ""
+    try:
+        value = sheet.getAlias(address)
+    except Exception:
+        return ""
+    if value is None:
+        return ""
+    return str(value).strip()
@@ -12,6 +12,19 @@ def is_sheet_object(obj: object) -> bool:
     return isinstance(type_id, str) and type_id.startswith("Spreadsheet::Sheet")
 
 
+def document_key(sheet: object) -> str:
+    document = getattr(sheet, "Document", None)
+    doc_file = getattr(document, "FileName", "")
+    if isinstance(doc_file, str) and doc_file.strip():
+        return doc_file.strip()
+    return getattr(document, "Name", "<NoDocument>")
+
+
+def sheet_key(sheet: object) -> str:
+    obj_name = getattr(sheet, "Name", "<NoName>")
+    return f"{document_key(sheet)}::{obj_name}"
+
+
 def iter_document_sheets(doc: object) -> Iterable[object]:
     for obj in getattr(doc, "Objects", []):
         if is_sheet_object(obj):
@@ -0,0 +1,133 @@
+"""Lazy start-up: keep FreeCAD launch cheap until a spreadsheet is actually in play."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .constants import COMMAND_CREATE_NOW, COMMAND_SHOW_STATS, COMMAND_SYNC_SELECTION, COMMAND_TOGGLE
+from .freecad_api import App, Gui
+from .logging_utils import warn
+from .spreadsheet_utils import is_sheet_object, iter_document_sheets
+
+SPREADSHEET_WORKBENCH = "SpreadsheetWorkbench"
+
+
+class LazyController:
+    """Stands in for the controller in GUI commands and builds it on first use."""
+
+    def __getattr__(self, name: str):
+        from .controller import get_controller
+
+        return getattr(get_controller(), name)
+
+
+class StartupObserver:
+    """Tiny document observer that starts the real one once a document has sheets.
+
+    It only looks at the type of new objects and at restored documents, so
+    FreeCAD sessions without spreadsheets never load the sync machinery.
+    """
+
+    def slotCreatedObject(self, *args) -> None:  # noqa: N802 (FreeCAD naming)
+        if not args or not is_sheet_object(args[0]):
+            return
+        controller = start_controller()
+        if controller is not None:
+            # The controller's own observer missed this event.
+            controller.handle_sheet_change(args[0], "CreatedObject")
+
+    def slotFinishRestoreDocument(self, *args) -> None:  # noqa: N802
+        if not args or not has_sheets(args[0]):
+            return
+        controller = start_controller()
+        if controller is not None:
+            controller.handle_document_restore(args[0], True)
+
+
+_STARTUP_OBSERVER: Optional[StartupObserver] = None
+
+
+def has_sheets(document: object) -> bool:
+    return any(True for _ in iter_document_sheets(document))
+
+
+def install() -> None:
+    """Register commands and wait for the first spreadsheet; nothing heavy is imported."""
+    global _STARTUP_OBSERVER
+    register_commands()
+    if _open_documents_have_sheets():
+        start_controller()
+        return
+    _watch_workbench()
+    if _STARTUP_OBSERVER is not None or App is None or not hasattr(App, "addDocumentObserver"):
+        return
+    _STARTUP_OBSERVER = StartupObserver()
+    App.addDocumentObserver(_STARTUP_OBSERVER)
+
+
+def register_commands() -> None:
+    if Gui is None:
+        return
+
+    from SketcherAutoAlias.commands.cmd_create_alias_now import CreateAliasNowCommand
+    from SketcherAutoAlias.commands.cmd_show_sync_stats import ShowSyncStatsCommand
+    from SketcherAutoAlias.commands.cmd_sync_selection import SyncSelectionCommand
+    from SketcherAutoAlias.commands.cmd_toggle_auto_alias import ToggleAutoAliasCommand
+
+    controller = LazyController()
+    Gui.addCommand(COMMAND_TOGGLE, ToggleAutoAliasCommand(controller))
+    Gui.addCommand(COMMAND_CREATE_NOW, CreateAliasNowCommand(controller))
+    Gui.addCommand(COMMAND_SYNC_SELECTION, SyncSelectionCommand(controller))
+    Gui.addCommand(COMMAND_SHOW_STATS, ShowSyncStatsCommand(controller))
+
+
+def start_controller():
+    """Build the controller, register its observer and drop the start-up observer.
+
+    Returns ``None`` (after a warning) when the controller cannot be loaded.
+    """
+    global _STARTUP_OBSERVER
+    try:
+        from .controller import get_controller
+
+        controller = get_controller()
+        controller.start_observer()
+    except Exception as exc:
+        warn(f"Controller could not be loaded: {exc}")
+        return None
+    if _STARTUP_OBSERVER is not None and App is not None and hasattr(App, "removeDocumentObserver"):
+        App.removeDocumentObserver(_STARTUP_OBSERVER)
+    _STARTUP_OBSERVER = None
+    return controller
+
+
+def _on_workbench_activated(name: str) -> None:
+    if str(name) != SPREADSHEET_WORKBENCH:
+        return
+    # Build the controller before the toolbar asks for its state; the observer
+    # still waits for a document with sheets.
+    try:
+        from .controller import get_controller
+
+        get_controller()
+    except Exception as exc:
+        warn(f"Controller could not be loaded: {exc}")
+
+
+def _watch_workbench() -> None:
+    if Gui is None or not hasattr(Gui, "getMainWindow"):
+        return
+    try:
+        Gui.getMainWindow().workbenchActivated.connect(_on_workbench_activated)
+    except Exception:
+        pass
+
+
+def _open_documents_have_sheets() -> bool:
+    if App is None or not hasattr(App, "listDocuments"):
+        return False
+    try:
+        documents = list(App.listDocuments().values())
+    except Exception:
+        return False
+    return any(has_sheets(document) for document in documents)
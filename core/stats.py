@@ -0,0 +1,153 @@
+"""Opt-in timing and FreeCAD API call counters for alias syncs."""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Union
+
+from .spreadsheet_utils import sheet_key
+
+COUNTED_METHODS = ("get", "getContents", "getAlias", "getAddressFromAlias", "isValidAlias", "setAlias", "set")
+
+
+class SyncStats:
+    """Aggregated numbers for one sheet or one document."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.events = 0
+        self.syncs = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.last_s = 0.0
+        self.cells_scanned = 0
+        self.aliases_written = 0
+        self.calls: Counter = Counter()
+
+    def add(self, duration: float, cells_scanned: int, aliases_written: int, calls: Counter) -> None:
+        self.syncs += 1
+        self.total_s += duration
+        self.last_s = duration
+        self.max_s = max(self.max_s, duration)
+        self.cells_scanned += cells_scanned
+        self.aliases_written += aliases_written
+        self.calls.update(calls)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "events": self.events,
+            "syncs": self.syncs,
+            "total_s": self.total_s,
+            "max_s": self.max_s,
+            "last_s": self.last_s,
+            "cells_scanned": self.cells_scanned,
+            "aliases_written": self.aliases_written,
+            "calls": {name: self.calls[name] for name in COUNTED_METHODS},
+        }
+
+    def summary(self) -> str:
+        calls = ", ".join(f"{name}={self.calls[name]}" for name in COUNTED_METHODS if self.calls[name])
+        return (
+            f"{self.syncs} sync(s) from {self.events} event(s), {self.total_s:.3f} s total "
+            f"(max {self.max_s:.3f} s, last {self.last_s:.3f} s), "
+            f"{self.cells_scanned} cell(s) scanned, {self.aliases_written} alias(es) written"
+            + (f"; calls: {calls}" if calls else "")
+        )
+
+
+class CountingSheet:
+    """Forwards everything to ``sheet`` and counts calls of ``COUNTED_METHODS``."""
+
+    def __init__(self, sheet: object) -> None:
+        self.sheet = sheet
+        self.calls: Counter = Counter()
+        self.started = time.perf_counter()
+
+    def __getattr__(self, name: str):
+        value = getattr(self.sheet, name)
+        if name not in COUNTED_METHODS:
+            return value
+        calls = self.calls
+
+        def counted(*args, **kwargs):
+            calls[name] += 1
+            return value(*args, **kwargs)
+
+        return counted
+
+
+class StatsRecorder:
+    """Collects ``SyncStats`` per sheet and per document while ``enabled``.
+
+    When disabled, callers skip timing and proxying entirely, so the only cost
+    is checking ``enabled``. ``enabled`` may be a callable (the cached
+    preference getter), so switching recording on or off takes effect at once.
+    """
+
+    def __init__(self, enabled: Union[bool, Callable[[], bool]] = False) -> None:
+        self._enabled: Callable[[], bool]
+        if callable(enabled):
+            self._enabled = enabled
+        else:
+            self.enabled = enabled
+        self._sheets: Dict[str, SyncStats] = {}
+        self._documents: Dict[str, SyncStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._enabled())
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        value = bool(value)
+        self._enabled = lambda: value
+
+    def reset(self) -> None:
+        self._sheets.clear()
+        self._documents.clear()
+
+    def start(self, sheet: object) -> CountingSheet:
+        return CountingSheet(sheet)
+
+    def finish(self, proxy: CountingSheet, cells_scanned: int, aliases_written: int) -> None:
+        duration = time.perf_counter() - proxy.started
+        for stats in self._targets(proxy.sheet):
+            stats.add(duration, cells_scanned, aliases_written, proxy.calls)
+
+    def count_event(self, sheet: object) -> None:
+        for stats in self._targets(sheet):
+            stats.events += 1
+
+    def sheet_stats(self, sheet: object) -> Optional[SyncStats]:
+        return self._sheets.get(sheet_key(sheet))
+
+    def snapshot(self) -> Dict[str, List[Dict[str, object]]]:
+        return {
+            "documents": [stats.as_dict() for stats in self._documents.values()],
+            "sheets": [stats.as_dict() for stats in self._sheets.values()],
+        }
+
+    def report(self) -> str:
+        if not self._documents:
+            return "No alias syncs recorded yet."
+        lines = []
+        for doc_name, doc_stats in self._documents.items():
+            lines.append(f"Document '{doc_name}': {doc_stats.summary()}")
+            prefix = f"{doc_name}::"
+            for key, stats in self._sheets.items():
+                if key.startswith(prefix):
+                    lines.append(f"  Sheet '{key[len(prefix):]}': {stats.summary()}")
+        return "\n".join(lines)
+
+    def _targets(self, sheet: object) -> List[SyncStats]:
+        key = sheet_key(sheet)
+        doc_name = key.rsplit("::", 1)[0]
+        sheet_stats = self._sheets.get(key)
+        if sheet_stats is None:
+            sheet_stats = self._sheets[key] = SyncStats(key)
+        doc_stats = self._documents.get(doc_name)
+        if doc_stats is None:
+            doc_stats = self._documents[doc_name] = SyncStats(doc_name)
+        return [sheet_stats, doc_stats]
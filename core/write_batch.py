@@ -0,0 +1,124 @@
+"""Batched spreadsheet writes applied inside one document transaction."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from .logging_utils import MessageBatch, warn
+from .spreadsheet_utils import sheet_key
+
+TRANSACTION_NAME = "Sync spreadsheet aliases"
+
+# sheet key -> write generation; bumped when a batch starts and when it ends,
+# so the generation is odd exactly while the plugin is writing to the sheet.
+_generations: Dict[str, int] = {}
+
+
+def write_generation(sheet: object) -> int:
+    return _generations.get(sheet_key(sheet), 0)
+
+
+def is_writing(sheet: object) -> bool:
+    """True while a ``WriteBatch`` transaction on ``sheet`` is open.
+
+    FreeCAD signals property changes synchronously, so observer events that
+    arrive meanwhile are echoes of the plugin's own writes.
+    """
+    return write_generation(sheet) % 2 == 1
+
+
+class WriteBatch:
+    """Queue of cell initialisations and alias assignments for one sheet.
+
+    Writes are only sent to FreeCAD by ``flush``. Wrapping the flushes in
+    ``transaction`` gives the whole sync a single undo entry and keeps the
+    document from recomputing until every write has been applied.
+    """
+
+    def __init__(self, sheet: object) -> None:
+        self._sheet = sheet
+        self._cells: List[Tuple[str, str]] = []
+        self._aliases: List[Tuple[str, str]] = []
+        self._written = 0
+
+    def __len__(self) -> int:
+        return len(self._cells) + len(self._aliases)
+
+    def set_cell(self, cell: str, value: str) -> None:
+        self._cells.append((cell, str(value)))
+
+    def set_alias(self, cell: str, alias: str) -> None:
+        self._aliases.append((cell, alias))
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """Apply queued writes; return the ``(cell, alias)`` pairs FreeCAD rejected."""
+        cells, self._cells = self._cells, []
+        aliases, self._aliases = self._aliases, []
+
+        if cells and hasattr(self._sheet, "set"):
+            errors = MessageBatch("cell(s) could not be set")
+            for cell, value in cells:
+                try:
+                    self._sheet.set(cell, value)
+                    self._written += 1
+                except Exception as exc:
+                    errors.add(f"{cell}: {exc}")
+            errors.flush(getattr(self._sheet, "Label", getattr(self._sheet, "Name", "Spreadsheet")))
+
+        failed: List[Tuple[str, str]] = []
+        if not hasattr(self._sheet, "setAlias"):
+            return list(aliases)
+        for cell, alias in aliases:
+            try:
+                self._sheet.setAlias(cell, alias)
+                self._written += 1
+            except Exception:
+                failed.append((cell, alias))
+        return failed
+
+    @contextmanager
+    def transaction(self, name: str = TRANSACTION_NAME) -> Iterator["WriteBatch"]:
+        document = getattr(self._sheet, "Document", None)
+        # Join a transaction someone else already opened instead of committing it early.
+        own_transaction = document is not None and not getattr(document, "HasPendingTransaction", False)
+        frozen = getattr(document, "RecomputesFrozen", None)
+
+        key = sheet_key(self._sheet)
+        _generations[key] = _generations.get(key, 0) + 1
+        if own_transaction:
+            self._call(document, "openTransaction", name)
+        if frozen is False:
+            self._set_frozen(document, True)
+        try:
+            yield self
+        except Exception:
+            if own_transaction:
+                self._call(document, "abortTransaction")
+                own_transaction = False
+                self._written = 0
+            raise
+        finally:
+            if frozen is False:
+                self._set_frozen(document, False)
+            if own_transaction:
+                self._call(document, "commitTransaction")
+            if self._written:
+                self._written = 0
+                self._call(self._sheet, "recompute")
+            _generations[key] += 1
+
+    def _call(self, target: object, method: str, *args) -> None:
+        func = getattr(target, method, None)
+        if func is None:
+            return
+        try:
+            func(*args)
+        except Exception as exc:
+            warn(f"{method} failed: {exc}")
+
+    def _set_frozen(self, document: object, value: bool) -> None:
+        try:
+            document.RecomputesFrozen = value
+        except Exception:
+            pass
@@ -0,0 +1 @@
+"""Tools that work on .FCStd files without running FreeCAD."""
@@ -0,0 +1,160 @@
+"""Report missing, stale and colliding spreadsheet aliases in .FCStd files.
+
+Usage::
+
+    python -m SketcherAutoAlias.headless.audit [--jobs N] [--format json|csv]
+        [--output FILE] PATH [PATH ...]
+
+PATH may be a .FCStd file or a directory that is searched recursively.
+Files are audited in a process pool; the exit code is 0 when every sheet is
+in sync, 1 when findings were reported and 2 when a file could not be read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from SketcherAutoAlias.core.alias_plan import AliasPlan, plan_aliases
+from SketcherAutoAlias.core.cells import format_cell, left_of
+
+from .fcstd import SheetCells, iter_document_sheets
+
+CSV_FIELDS = ["file", "sheet", "kind", "cell", "label_cell", "label", "alias", "expected"]
+
+
+def iter_fcstd_files(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(".fcstd"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def plan_sheet(source: SheetCells, keep_existing: bool = False) -> AliasPlan:
+    """Plan ``source`` with the plugin's sync rules; nothing is written."""
+    return plan_aliases(source.to_view(), keep_existing=keep_existing)
+
+
+def audit_sheet(source: SheetCells) -> List[Dict[str, str]]:
+    findings = []
+    for entry in plan_sheet(source).aliases:
+        if entry.alias != entry.base:
+            # The label's natural alias is held by another cell, so the row needs a suffix.
+            kind = "colliding"
+        elif not entry.previous:
+            kind = "missing"
+        else:
+            kind = "stale"
+        findings.append(
+            {
+                "kind": kind,
+                "cell": format_cell(entry.cell),
+                "label_cell": format_cell(left_of(entry.cell)),
+                "label": entry.label,
+                "alias": entry.previous,
+                "expected": entry.alias,
+            }
+        )
+    return findings
+
+
+def audit_file(path: str) -> Dict[str, object]:
+    report: Dict[str, object] = {"file": path, "error": None, "sheets": []}
+    try:
+        for source in iter_document_sheets(path):
+            report["sheets"].append(
+                {
+                    "name": source.name,
+                    "label": source.label,
+                    "cells": len(source.cells),
+                    "findings": audit_sheet(source),
+                }
+            )
+    except Exception as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+    return report
+
+
+def iter_reports(
+    paths: Iterable[str],
+    jobs: int,
+    worker: Callable[[str], Dict[str, object]] = audit_file,
+) -> Iterator[Dict[str, object]]:
+    """Run ``worker`` on every .FCStd file, in a process pool when ``jobs`` > 1."""
+    files = list(iter_fcstd_files(paths))
+    if jobs <= 1 or len(files) <= 1:
+        yield from map(worker, files)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(worker, files, chunksize=max(1, len(files) // (jobs * 8)))
+
+
+def write_json(reports: Iterable[Dict[str, object]], out: IO[str]) -> Dict[str, int]:
+    counts = {"findings": 0, "errors": 0}
+    out.write("[")
+    for number, report in enumerate(reports):
+        _count(report, counts)
+        out.write(",\n" if number else "\n")
+        out.write(json.dumps(report, ensure_ascii=False))
+    out.write("\n]\n")
+    return counts
+
+
+def write_csv(reports: Iterable[Dict[str, object]], out: IO[str]) -> Dict[str, int]:
+    counts = {"findings": 0, "errors": 0}
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for report in reports:
+        _count(report, counts)
+        if report["error"]:
+            writer.writerow({"file": report["file"], "kind": "error", "label": report["error"]})
+        for sheet in report["sheets"]:
+            for finding in sheet["findings"]:
+                writer.writerow({"file": report["file"], "sheet": sheet["name"], **finding})
+    return counts
+
+
+def _count(report: Dict[str, object], counts: Dict[str, int]) -> None:
+    if report["error"]:
+        counts["errors"] += 1
+    counts["findings"] += sum(len(sheet["findings"]) for sheet in report["sheets"])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m SketcherAutoAlias.headless.audit",
+        description="Report missing, stale and colliding spreadsheet aliases in .FCStd files.",
+    )
+    parser.add_argument("paths", nargs="+", help=".FCStd files or directories to scan recursively")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--output", "-o", help="write the report to this file instead of stdout")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    writer = write_csv if args.format == "csv" else write_json
+    reports = iter_reports(args.paths, args.jobs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            counts = writer(reports, out)
+    else:
+        counts = writer(reports, sys.stdout)
+    if counts["errors"]:
+        return 2
+    return 1 if counts["findings"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Streaming access to spreadsheet cells stored in .FCStd archives."""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from SketcherAutoAlias.core.cells import parse_cell
+from SketcherAutoAlias.core.sheet_view import SheetView, display_text
+
+DOCUMENT_XML = "Document.xml"
+
+
+class SheetCells:
+    """Cells of one ``Spreadsheet::Sheet`` object as stored in ``Document.xml``."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.label = name
+        # address -> (content, alias)
+        self.cells: Dict[str, Tuple[str, str]] = {}
+
+    def to_view(self) -> SheetView:
+        """Build the view the alias planner works on (display text, packed cells)."""
+        view = SheetView()
+        for address, (content, alias) in self.cells.items():
+            cell = parse_cell(address)
+            if cell is not None:
+                view.record(cell, display_text(content).strip(), alias)
+        return view
+
+
+def iter_document_sheets(path: str) -> Iterator[SheetCells]:
+    """Yield the spreadsheets of an .FCStd file one at a time."""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open(DOCUMENT_XML) as stream:
+            yield from iter_xml_sheets(stream)
+
+
+def iter_xml_sheets(stream: IO[bytes]) -> Iterator[SheetCells]:
+    """Stream-parse ``Document.xml`` and yield every spreadsheet object.
+
+    Elements are detached from their parent as soon as they have been handled,
+    so memory stays bounded by the largest single sheet, not by the document.
+    """
+    sheet_types: Dict[str, str] = {}
+    stack: List[ET.Element] = []
+    sheet: Optional[SheetCells] = None
+    prop_name = ""
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            parent_tag = stack[-1].tag if stack else ""
+            if elem.tag == "Object" and parent_tag == "ObjectData":
+                name = elem.get("name", "")
+                if sheet_types.get(name, "").startswith("Spreadsheet::Sheet"):
+                    sheet = SheetCells(name)
+            elif elem.tag == "Property" and sheet is not None:
+                prop_name = elem.get("name", "")
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+        parent_tag = parent.tag if parent is not None else ""
+        if elem.tag == "Object" and parent_tag == "Objects":
+            sheet_types[elem.get("name", "")] = elem.get("type", "")
+        elif sheet is not None:
+            if elem.tag == "Cell" and prop_name == "cells":
+                content = elem.get("content", "")
+                alias = elem.get("alias", "")
+                if content or alias:
+                    sheet.cells[elem.get("address", "").upper()] = (content, alias)
+            elif elem.tag == "String" and prop_name == "Label":
+                sheet.label = elem.get("value", sheet.name)
+            elif elem.tag == "Property":
+                prop_name = ""
+            elif elem.tag == "Object" and parent_tag == "ObjectData":
+                yield sheet
+                sheet = None
+        if parent is not None:
+            parent.remove(elem)
@@ -0,0 +1,231 @@
+"""Write planned spreadsheet aliases back into .FCStd files without FreeCAD.
+
+Usage::
+
+    python -m SketcherAutoAlias.headless.rewrite [--jobs N] [--rename-stale]
+        PATH [PATH ...]
+
+Aliases are planned with the same rules the plugin uses (see ``audit.py``).
+``Document.xml`` is rewritten as a SAX stream; every other archive member is
+streamed across with its name, time stamp and compression method. The result
+is written to a temp file next to the original and renamed over it.
+
+Renaming an existing alias in FreeCAD also updates the expressions that
+reference it. This tool cannot do that, so stale aliases are only renamed
+with ``--rename-stale``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from typing import Dict, List, Optional, Set
+from xml.sax import handler, make_parser
+from xml.sax.saxutils import XMLGenerator
+
+from SketcherAutoAlias.core.alias_plan import PLACEHOLDER_VALUE
+from SketcherAutoAlias.core.cells import format_cell
+
+from .audit import iter_reports, plan_sheet
+from .fcstd import DOCUMENT_XML, SheetCells, iter_document_sheets
+from .zip_copy import copy_member
+
+
+class SheetWrites:
+    """Planned changes for one sheet: address -> new content / new alias."""
+
+    def __init__(self) -> None:
+        self.contents: Dict[str, str] = {}
+        self.aliases: Dict[str, str] = {}
+        # Planned cells that have no <Cell> element yet.
+        self.new_cells: Set[str] = set()
+        self.skipped: List[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.contents or self.aliases)
+
+    def addresses(self) -> Set[str]:
+        return set(self.contents) | set(self.aliases)
+
+
+def plan_sheet_writes(source: SheetCells, rename_stale: bool = False) -> SheetWrites:
+    writes = SheetWrites()
+    if rename_stale:
+        plan = plan_sheet(source)
+    else:
+        # Existing aliases stay put, so plan the other rows around them rather than
+        # around renames that are then dropped (which would suffix names left unused).
+        writes.skipped = sorted(format_cell(entry.cell) for entry in plan_sheet(source).aliases if entry.previous)
+        plan = plan_sheet(source, keep_existing=True)
+    writes.contents = {format_cell(cell): PLACEHOLDER_VALUE for cell in plan.values}
+    writes.aliases = {format_cell(entry.cell): entry.alias for entry in plan.aliases}
+    writes.new_cells = writes.addresses() - set(source.cells)
+    return writes
+
+
+class _DocumentRewriter(XMLGenerator):
+    """Echo ``Document.xml`` while patching the ``Cell`` elements of planned sheets."""
+
+    def __init__(self, out, plans: Dict[str, SheetWrites]) -> None:
+        super().__init__(out, encoding="utf-8", short_empty_elements=True)
+        self._plans = plans
+        self._stack: List[str] = []
+        self._sheet: Optional[SheetWrites] = None
+        self._pending: Set[str] = set()
+        self._in_cells = False
+
+    def startElement(self, name, attrs):  # noqa: N802 (SAX API)
+        parent = self._stack[-1] if self._stack else ""
+        values = dict(attrs.items())
+        if name == "Object" and parent == "ObjectData":
+            self._sheet = self._plans.get(values.get("name", ""))
+            self._pending = self._sheet.addresses() if self._sheet else set()
+        elif self._sheet is not None and name == "Property":
+            self._in_cells = values.get("name") == "cells"
+        elif self._sheet is not None and self._in_cells and name == "Cells":
+            values["Count"] = str(int(values.get("Count") or 0) + len(self._sheet.new_cells))
+        elif self._sheet is not None and self._in_cells and name == "Cell":
+            address = values.get("address", "").upper()
+            if address in self._pending:
+                self._pending.discard(address)
+                self._patch(address, values)
+        self._stack.append(name)
+        super().startElement(name, values)
+
+    def endElement(self, name):  # noqa: N802
+        self._stack.pop()
+        if self._sheet is not None and self._in_cells and name == "Cells":
+            # Target cells that did not exist yet are appended; FreeCAD does not care about order.
+            for address in sorted(self._pending):
+                values = {"address": address}
+                self._patch(address, values)
+                super().startElement("Cell", values)
+                super().endElement("Cell")
+            self._pending = set()
+        elif name == "Property":
+            self._in_cells = False
+        elif name == "Object" and self._stack and self._stack[-1] == "ObjectData":
+            self._sheet = None
+        super().endElement(name)
+
+    def comment(self, content):
+        # characters() would escape the markup; ignorableWhitespace() writes its text
+        # as-is after closing a pending start tag.
+        self.ignorableWhitespace(f"<!--{content}-->")
+
+    def startDTD(self, name, public_id, system_id):  # noqa: N802 (LexicalHandler API)
+        pass
+
+    def endDTD(self):  # noqa: N802
+        pass
+
+    def startCDATA(self):  # noqa: N802
+        pass
+
+    def endCDATA(self):  # noqa: N802
+        pass
+
+    def _patch(self, address: str, values: Dict[str, str]) -> None:
+        content = self._sheet.contents.get(address)
+        alias = self._sheet.aliases.get(address)
+        if content is not None:
+            values["content"] = content
+        if alias is not None:
+            values["alias"] = alias
+
+
+def rewrite_document_xml(source, target, plans: Dict[str, SheetWrites]) -> None:
+    """Stream ``Document.xml`` from ``source`` to ``target`` (binary streams) applying ``plans``."""
+    out = io.TextIOWrapper(target, encoding="utf-8", newline="")
+    rewriter = _DocumentRewriter(out, plans)
+    parser = make_parser()
+    parser.setContentHandler(rewriter)
+    parser.setProperty(handler.property_lexical_handler, rewriter)
+    parser.parse(source)
+    out.flush()
+    out.detach()
+
+
+def rewrite_file(path: str, rename_stale: bool = False) -> Dict[str, object]:
+    report: Dict[str, object] = {
+        "file": path,
+        "error": None,
+        "changed": False,
+        "aliases_written": 0,
+        "cells_initialised": 0,
+        "skipped_renames": 0,
+    }
+    try:
+        plans: Dict[str, SheetWrites] = {}
+        for source in iter_document_sheets(path):
+            writes = plan_sheet_writes(source, rename_stale)
+            report["skipped_renames"] += len(writes.skipped)
+            if writes:
+                plans[source.name] = writes
+                report["aliases_written"] += len(writes.aliases)
+                report["cells_initialised"] += len(writes.contents)
+        if plans:
+            _rewrite_archive(path, plans)
+            report["changed"] = True
+    except Exception as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+    return report
+
+
+def _rewrite_archive(path: str, plans: Dict[str, SheetWrites]) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(prefix=".autoalias-", suffix=".FCStd", dir=directory)
+    os.close(handle)
+    try:
+        with zipfile.ZipFile(path) as source, zipfile.ZipFile(temp_path, "w") as target:
+            for info in source.infolist():
+                if info.filename != DOCUMENT_XML:
+                    copy_member(source, target, info)
+                    continue
+                document_info = zipfile.ZipInfo(DOCUMENT_XML, date_time=info.date_time)
+                document_info.compress_type = info.compress_type
+                document_info.external_attr = info.external_attr
+                with source.open(info) as reader, target.open(document_info, "w", force_zip64=True) as writer:
+                    rewrite_document_xml(reader, writer, plans)
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m SketcherAutoAlias.headless.rewrite",
+        description="Write planned spreadsheet aliases back into .FCStd files without FreeCAD.",
+    )
+    parser.add_argument("paths", nargs="+", help=".FCStd files or directories to scan recursively")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument(
+        "--rename-stale",
+        action="store_true",
+        help="also rename existing aliases (expressions using the old names are NOT updated)",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    worker = functools.partial(rewrite_file, rename_stale=args.rename_stale)
+    errors = 0
+    for report in iter_reports(args.paths, args.jobs, worker):
+        errors += bool(report["error"])
+        sys.stdout.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return 2 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,21 @@
+"""Copy zip members from one archive to another."""
+
+from __future__ import annotations
+
+import copy
+import shutil
+import zipfile
+
+CHUNK_SIZE = 1 << 20
+
+
+def copy_member(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """Stream ``info`` from ``source`` into ``target``, keeping its name, time stamp and compression.
+
+    The member is decompressed and compressed again, ``CHUNK_SIZE`` bytes at a
+    time, so large shapes never have to fit in memory.
+    """
+    # ZipFile.open(..., "w") fills in offsets and sizes on the ZipInfo it is given.
+    copied = copy.copy(info)
+    with source.open(info) as reader, target.open(copied, "w") as writer:
+        shutil.copyfileobj(reader, writer, CHUNK_SIZE)
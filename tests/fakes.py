@@ -0,0 +1,162 @@
+"""Fake FreeCAD spreadsheets, documents and preferences shared by the tests."""
+
+from __future__ import annotations
+
+import re
+from xml.sax.saxutils import quoteattr
+
+from SketcherAutoAlias.core.prefs import Preferences
+from SketcherAutoAlias.core.sheet_view import display_text
+
+
+class FakeSheet:
+    """Sheet with only per-cell access, counting ``get`` and alias probes."""
+
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self) -> None:
+        self.Name = "Variables"
+        self.Label = "Variables"
+        self.cells = {}
+        self.alias_to_cell = {}
+        self.get_calls = 0
+        self.probe_calls = 0
+
+    def isValidAlias(self, alias: str) -> bool:  # noqa: N802
+        self.probe_calls += 1
+        return bool(re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", alias))
+
+    def getAddressFromAlias(self, alias: str):  # noqa: N802
+        self.probe_calls += 1
+        return self.alias_to_cell.get(alias, "")
+
+    def getAlias(self, cell: str):  # noqa: N802
+        for alias, mapped in self.alias_to_cell.items():
+            if mapped == cell:
+                return alias
+        return ""
+
+    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
+        existing = self.alias_to_cell.get(alias)
+        if alias and existing and existing != cell:
+            raise ValueError(f"Alias '{alias}' already used in {existing}")
+        for old_alias, old_cell in list(self.alias_to_cell.items()):
+            if old_cell == cell and old_alias != alias:
+                del self.alias_to_cell[old_alias]
+        if alias:
+            self.alias_to_cell[alias] = cell
+
+    def get(self, cell: str):
+        self.get_calls += 1
+        return self.cells.get(cell, "")
+
+    def set(self, cell: str, value: str) -> None:
+        self.cells[cell] = value
+
+    def getNonEmptyCells(self):  # noqa: N802
+        return [cell for cell, value in self.cells.items() if str(value).strip()]
+
+
+class FakePrefs(Preferences):
+    """Default preferences, as without FreeCAD."""
+
+
+def large_sheet(rows: int, name: str = "Variables") -> FakeSheet:
+    """A sheet with a label in A and a value in B on each of ``rows`` rows."""
+    sheet = FakeSheet()
+    sheet.Name = sheet.Label = name
+    for row in range(1, rows + 1):
+        sheet.set(f"A{row}", f"param {row}")
+        sheet.set(f"B{row}", str(row))
+    return sheet
+
+
+class StalePrefs(Preferences):
+    def is_remove_stale_aliases(self) -> bool:
+        return True
+
+
+class UniquePrefs(Preferences):
+    def is_document_unique_aliases(self) -> bool:
+        return True
+
+
+class FakeDocument:
+    def __init__(self, *sheets, name: str = "Assembly") -> None:
+        self.Name = name
+        self.Objects = list(sheets)
+        for number, sheet in enumerate(sheets, 1):
+            # Fresh fakes all share one name; number them so their sheet keys differ.
+            if sheet.Name == "Variables":
+                sheet.Name = sheet.Label = f"Sheet{number}"
+            sheet.Document = self
+
+
+class _CellsProperty:
+    def __init__(self, sheet: "SerialisedSheet") -> None:
+        self._sheet = sheet
+
+    @property
+    def Content(self) -> str:  # noqa: N802
+        self._sheet.content_reads += 1
+        addresses = sorted(set(self._sheet.contents) | set(self._sheet.aliases))
+        rows = []
+        for address in addresses:
+            attributes = f"address={quoteattr(address)} content={quoteattr(self._sheet.contents.get(address, ''))}"
+            if address in self._sheet.aliases:
+                attributes += f" alias={quoteattr(self._sheet.aliases[address])}"
+            rows.append(f"<Cell {attributes} />")
+        return f'<Cells Count="{len(rows)}" xlink="1">{"".join(rows)}</Cells>'
+
+
+class SerialisedSheet:
+    """Sheet that also exposes its cells serialised, as FreeCAD's ``cells.Content``."""
+
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self) -> None:
+        self.Name = "Variables"
+        self.Label = "Variables"
+        self.contents = {}
+        self.aliases = {}
+        self.cells = _CellsProperty(self)
+        self.content_reads = 0
+        self.read_calls = 0
+
+    def get(self, cell: str):
+        # Evaluated value, as FreeCAD returns it: formulas are computed and numbers are floats.
+        self.read_calls += 1
+        content = self.contents.get(cell, "")
+        match = re.fullmatch(r"=<<(.*)>>", content)
+        if match:
+            return match.group(1)
+        try:
+            return float(content)
+        except ValueError:
+            return display_text(content)
+
+    def getContents(self, cell: str):  # noqa: N802
+        self.read_calls += 1
+        return self.contents.get(cell, "")
+
+    def getAlias(self, cell: str):  # noqa: N802
+        self.read_calls += 1
+        return self.aliases.get(cell, "")
+
+    def getAddressFromAlias(self, alias: str):  # noqa: N802
+        for address, current in self.aliases.items():
+            if current == alias:
+                return address
+        return ""
+
+    def isValidAlias(self, alias: str) -> bool:  # noqa: N802
+        return bool(re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", alias))
+
+    def set(self, cell: str, value: str) -> None:
+        self.contents[cell] = value
+
+    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
+        owner = self.getAddressFromAlias(alias)
+        if owner and owner != cell:
+            raise ValueError(f"Alias '{alias}' already used in {owner}")
+        self.aliases[cell] = alias
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.alias_plan import is_valid_alias, plan_aliases, plan_stale_cleanup, stale_aliases
+from SketcherAutoAlias.core.cells import format_cell, parse_cell
+from SketcherAutoAlias.core.sheet_view import SheetView
+
+
+def _view(cells) -> SheetView:
+    view = SheetView()
+    for address, (text, alias) in cells.items():
+        view.record(parse_cell(address), text, alias)
+    return view
+
+
+def _aliases(plan):
+    return {format_cell(entry.cell): entry.alias for entry in plan.aliases}
+
+
+class PlanAliasesTests(unittest.TestCase):
+    def test_plans_aliases_and_placeholder_values(self) -> None:
+        view = _view({"A1": ("wall thickness", ""), "B1": ("5 mm", ""), "A2": ("height", "")})
+
+        plan = plan_aliases(view)
+
+        self.assertEqual(_aliases(plan), {"B1": "wall_thickness", "B2": "height"})
+        self.assertEqual([format_cell(cell) for cell in plan.values], ["B2"])
+        self.assertEqual(view.index.owner("height"), parse_cell("B2"))
+
+    def test_planned_state_is_recorded_in_view(self) -> None:
+        view = _view({"A1": ("width", "")})
+        plan_aliases(view)
+
+        self.assertEqual(len(plan_aliases(view)), 0)
+
+    def test_duplicate_and_taken_aliases_get_suffixes(self) -> None:
+        view = _view({"A1": ("offset", ""), "A2": ("offset", ""), "D9": ("", "offset2")})
+
+        plan = plan_aliases(view)
+
+        self.assertEqual(_aliases(plan), {"B1": "offset", "B2": "offset3"})
+        self.assertEqual([entry.base for entry in plan.aliases], ["offset", "offset"])
+
+    def test_stale_alias_is_reported_with_previous_value(self) -> None:
+        view = _view({"A1": ("depth", ""), "B1": ("3", "width")})
+
+        (entry,) = plan_aliases(view).aliases
+
+        self.assertEqual((entry.alias, entry.previous, entry.label), ("depth", "width", "depth"))
+
+    def test_cells_limit_planning_to_affected_rows(self) -> None:
+        view = _view({"A1": ("width", ""), "A2": ("height", "")})
+
+        plan = plan_aliases(view, [parse_cell("B2")])
+
+        self.assertEqual(_aliases(plan), {"B2": "height"})
+
+    def test_unusable_label_is_skipped(self) -> None:
+        view = _view({"A1": ("width", "")})
+
+        plan = plan_aliases(view, is_valid=lambda alias: False)
+
+        self.assertEqual(plan.skipped, [(parse_cell("A1"), "width")])
+        self.assertEqual(len(plan), 0)
+
+    def test_split_keeps_rows_together_in_row_order(self) -> None:
+        view = _view({f"A{row}": (f"p{row}", "") for row in range(1, 6)})
+        view.record(parse_cell("B2"), "7", "")
+        plan = plan_aliases(view)
+
+        chunks = plan.split(2)
+
+        self.assertEqual([len(chunk.aliases) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([format_cell(cell) for cell in chunks[0].values], ["B1"])
+        self.assertEqual(_aliases(chunks[2]), {"B5": "p5"})
+
+    def test_renamed_label_updates_reverse_index(self) -> None:
+        view = _view({"A1": ("width", "")})
+        plan_aliases(view)
+
+        view.record(parse_cell("A1"), "depth", "")
+        plan = plan_aliases(view, [parse_cell("A1")])
+
+        self.assertEqual(_aliases(plan), {"B1": "depth"})
+        self.assertEqual(view.produced, {parse_cell("A1"): "depth"})
+
+    def test_stale_aliases_are_listed_and_cleaned(self) -> None:
+        view = _view({"A1": ("width", ""), "A2": ("height", ""), "A3": ("depth", "")})
+        plan_aliases(view)
+        view.record(parse_cell("A1"), "", "")
+        view.record(parse_cell("A3"), "12", "")
+        # Renamed by hand, so no longer the plugin's alias.
+        view.record(parse_cell("B2"), "0", "h")
+        view.record(parse_cell("A2"), "", "")
+
+        self.assertEqual(
+            [(format_cell(cell), alias) for cell, alias in stale_aliases(view)],
+            [("B1", "width"), ("B3", "depth")],
+        )
+        plan = plan_stale_cleanup(view)
+
+        self.assertEqual(
+            [(format_cell(entry.cell), entry.alias, entry.previous) for entry in plan.aliases],
+            [("B1", "", "width"), ("B3", "", "depth")],
+        )
+        # Only the hand-renamed alias is still listed; it is left alone.
+        self.assertEqual(view.produced, {parse_cell("A2"): "height"})
+        self.assertEqual(view.index.alias_of(parse_cell("B2")), "h")
+
+    def test_offline_validator_rejects_cell_addresses(self) -> None:
+        self.assertTrue(is_valid_alias("wall_thickness"))
+        self.assertFalse(is_valid_alias("AB12"))
+        self.assertFalse(is_valid_alias("2nd"))
+
+    def test_offline_validator_rejects_units_and_reserved_names(self) -> None:
+        for alias in ("h", "mm", "in", "kg", "cells", "pi", "_width"):
+            self.assertFalse(is_valid_alias(alias), alias)
+
+        view = _view({"A1": ("h", ""), "B1": ("5 mm", ""), "A2": ("cells", ""), "B2": ("3", "")})
+        self.assertEqual(_aliases(plan_aliases(view)), {"B1": "h2", "B2": "cells2"})
+
+    def test_keep_existing_plans_around_current_aliases(self) -> None:
+        view = _view(
+            {"A1": ("width", ""), "B1": ("5", "old"), "A3": ("width", ""), "B3": ("7", ""), "A4": ("old", "")}
+        )
+
+        plan = plan_aliases(view, keep_existing=True)
+
+        self.assertEqual(_aliases(plan), {"B3": "width", "B4": "old2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
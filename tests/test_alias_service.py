@@ -1,62 +1,23 @@
 from __future__ import annotations
 
-import re
 import unittest
+from unittest import mock
 
+from SketcherAutoAlias.core import logging_utils
+from SketcherAutoAlias.core.alias_index import AliasIndex, AliasNamespace
 from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.cells import parse_range
 
-
-class _FakeSheet:
-    TypeId = "Spreadsheet::Sheet"
-
-    def __init__(self) -> None:
-        self.Name = "Variables"
-        self.Label = "Variables"
-        self.cells = {}
-        self.alias_to_cell = {}
-
-    def isValidAlias(self, alias: str) -> bool:  # noqa: N802
-        return bool(re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", alias))
-
-    def getAddressFromAlias(self, alias: str):  # noqa: N802
-        return self.alias_to_cell.get(alias, "")
-
-    def getAlias(self, cell: str):  # noqa: N802
-        for alias, mapped in self.alias_to_cell.items():
-            if mapped == cell:
-                return alias
-        return ""
-
-    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
-        for old_alias, old_cell in list(self.alias_to_cell.items()):
-            if old_cell == cell and old_alias != alias:
-                del self.alias_to_cell[old_alias]
-        existing = self.alias_to_cell.get(alias)
-        if existing and existing != cell:
-            raise ValueError(f"Alias '{alias}' already used in {existing}")
-        self.alias_to_cell[alias] = cell
-
-    def get(self, cell: str):
-        return self.cells.get(cell, "")
-
-    def set(self, cell: str, value: str) -> None:
-        self.cells[cell] = value
-
-    def getNonEmptyCells(self):  # noqa: N802
-        return [cell for cell, value in self.cells.items() if str(value).strip()]
-
-
-class _FakePrefs:
-    pass
+from .fakes import FakeDocument, FakePrefs, FakeSheet, StalePrefs, UniquePrefs, large_sheet
 
 
 class AliasServiceTests(unittest.TestCase):
     def test_sync_creates_aliases_from_col_a_to_col_b(self) -> None:
-        sheet = _FakeSheet()
+        sheet = FakeSheet()
         sheet.set("A1", "wall thickness")
         sheet.set("B1", "5 mm")
 
-        service = AliasService(_FakePrefs())
+        service = AliasService(FakePrefs())
         updated = service.sync_sheet(sheet)
 
         self.assertEqual(updated, 1)
@@ -65,13 +26,13 @@ class AliasServiceTests(unittest.TestCase):
         self.assertNotIn("v5_mm", sheet.alias_to_cell)
 
     def test_sync_handles_duplicate_names_with_suffix(self) -> None:
-        sheet = _FakeSheet()
+        sheet = FakeSheet()
         sheet.set("A1", "wall thickness")
         sheet.set("B1", "5 mm")
         sheet.set("A2", "wall thickness")
         sheet.set("B2", "8 mm")
 
-        service = AliasService(_FakePrefs())
+        service = AliasService(FakePrefs())
         updated = service.sync_sheet(sheet)
 
         self.assertEqual(updated, 2)
@@ -79,10 +40,10 @@ class AliasServiceTests(unittest.TestCase):
         self.assertEqual(sheet.alias_to_cell["wall_thickness2"], "B2")
 
     def test_sync_initializes_empty_target_cell(self) -> None:
-        sheet = _FakeSheet()
+        sheet = FakeSheet()
         sheet.set("A3", "height")
 
-        service = AliasService(_FakePrefs())
+        service = AliasService(FakePrefs())
         updated = service.sync_sheet(sheet)
 
         self.assertEqual(updated, 1)
@@ -90,17 +51,393 @@ class AliasServiceTests(unittest.TestCase):
         self.assertEqual(sheet.alias_to_cell["height"], "B3")
 
     def test_sync_works_in_any_column(self) -> None:
-        sheet = _FakeSheet()
+        sheet = FakeSheet()
         sheet.set("D4", "wand höhe")
         sheet.set("E4", "2400 mm")
 
-        service = AliasService(_FakePrefs())
+        service = AliasService(FakePrefs())
         updated = service.sync_sheet(sheet)
 
         self.assertEqual(updated, 1)
         self.assertEqual(sheet.alias_to_cell["wand_hoehe"], "E4")
         self.assertEqual(sheet.cells["E4"], "2400 mm")
 
+    def test_many_duplicate_labels_get_suffixes_without_probing(self) -> None:
+        sheet = FakeSheet()
+        for row in range(1, 1201):
+            sheet.set(f"A{row}", "offset")
+            sheet.set(f"B{row}", "1 mm")
+
+        service = AliasService(FakePrefs())
+        updated = service.sync_sheet(sheet)
+
+        self.assertEqual(updated, 1200)
+        self.assertEqual(sheet.alias_to_cell["offset"], "B1")
+        self.assertEqual(sheet.alias_to_cell["offset2"], "B2")
+        self.assertEqual(sheet.alias_to_cell["offset1200"], "B1200")
+        self.assertEqual(sheet.probe_calls, 1)
+
+    def test_suffix_skips_alias_held_by_another_cell(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        sheet.set("B1", "1")
+        sheet.set("A2", "width")
+        sheet.set("B2", "2")
+        sheet.set("D9", "7")
+        sheet.setAlias("D9", "width2")
+
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        self.assertEqual(sheet.alias_to_cell["width"], "B1")
+        self.assertEqual(sheet.alias_to_cell["width2"], "D9")
+        self.assertEqual(sheet.alias_to_cell["width3"], "B2")
+
+    def test_alias_on_empty_cell_is_discovered_on_conflict(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        sheet.set("B1", "1")
+        sheet.setAlias("Z50", "width")
+
+        service = AliasService(FakePrefs())
+        updated = service.sync_sheet(sheet)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(sheet.alias_to_cell["width"], "Z50")
+        self.assertEqual(sheet.alias_to_cell["width2"], "B1")
+
+
+class IncrementalSyncTests(unittest.TestCase):
+    def test_hinted_sync_only_reads_changed_row(self) -> None:
+        sheet = large_sheet(200)
+        service = AliasService(FakePrefs())
+        self.assertEqual(service.sync_sheet(sheet), 200)
+
+        sheet.set("A7", "renamed")
+        sheet.get_calls = 0
+        updated = service.sync_sheet(sheet, ["A7"])
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(sheet.alias_to_cell["renamed"], "B7")
+        self.assertNotIn("param_7", sheet.alias_to_cell)
+        self.assertLess(sheet.get_calls, 10)
+
+    def test_unhinted_sync_detects_changed_cells(self) -> None:
+        sheet = large_sheet(20)
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A21", "extra")
+        sheet.set("A3", "other name")
+        updated = service.sync_sheet(sheet)
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(sheet.alias_to_cell["extra"], "B21")
+        self.assertEqual(sheet.alias_to_cell["other_name"], "B3")
+        self.assertEqual(sheet.cells["B21"], "0")
+
+    def test_unchanged_sheet_is_not_reprocessed(self) -> None:
+        sheet = large_sheet(20)
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        self.assertEqual(service.sync_sheet(sheet), 0)
+
+    def test_invalidate_forces_full_rescan(self) -> None:
+        sheet = large_sheet(5)
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        del sheet.alias_to_cell["param_2"]
+        self.assertEqual(service.sync_sheet(sheet, []), 0)
+
+        service.invalidate(sheet)
+        self.assertEqual(service.sync_sheet(sheet), 1)
+        self.assertEqual(sheet.alias_to_cell["param_2"], "B2")
+
+    def test_sheet_over_size_limit_is_planned_once_allowed(self) -> None:
+        sheet = large_sheet(20)
+        service = AliasService(FakePrefs())
+
+        self.assertEqual(service.sync_sheet(sheet, None, max_cells=10), 0)
+        self.assertEqual(sheet.alias_to_cell, {})
+        self.assertEqual(sheet.get_calls, 0)
+        self.assertTrue(service.is_oversized(sheet))
+        sheet.set("A3", "other name")
+        self.assertEqual(service.sync_sheet(sheet, ["A3"], max_cells=10), 0)
+
+        self.assertEqual(service.sync_sheet(sheet), 20)
+        self.assertEqual(sheet.alias_to_cell["other_name"], "B3")
+        self.assertFalse(service.is_oversized(sheet))
+
+    def test_changes_missed_while_oversized_are_picked_up(self) -> None:
+        sheet = large_sheet(5)
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        for row in range(6, 21):
+            sheet.set(f"A{row}", f"param {row}")
+        self.assertEqual(service.sync_sheet(sheet, ["A6"], max_cells=10), 0)
+        sheet.set("A3", "renamed")
+        self.assertEqual(service.sync_sheet(sheet, ["A3"]), 16)
+
+        self.assertEqual(sheet.alias_to_cell["renamed"], "B3")
+        self.assertEqual(sheet.alias_to_cell["param_20"], "B20")
+
+
+class RangeSyncTests(unittest.TestCase):
+    def test_range_sync_reads_only_the_range(self) -> None:
+        sheet = large_sheet(2000)
+        service = AliasService(FakePrefs())
+
+        self.assertEqual(service.sync_range(sheet, parse_range("A7:B8")), 2)
+
+        self.assertEqual(sheet.alias_to_cell, {"param_7": "B7", "param_8": "B8"})
+        # Two rows of the range plus their neighbour columns.
+        self.assertLessEqual(sheet.get_calls, 8)
+
+    def test_alias_outside_range_gets_suffix(self) -> None:
+        sheet = large_sheet(60)
+        sheet.set("A50", "width")
+        sheet.setAlias("B1", "width")
+
+        self.assertEqual(AliasService(FakePrefs()).sync_range(sheet, parse_range("B50")), 1)
+
+        self.assertEqual(sheet.alias_to_cell["width"], "B1")
+        self.assertEqual(sheet.alias_to_cell["width2"], "B50")
+
+    def test_range_sync_uses_existing_snapshot(self) -> None:
+        sheet = large_sheet(50)
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A9", "renamed")
+        sheet.get_calls = 0
+        self.assertEqual(service.sync_range(sheet, parse_range("A9:B9")), 1)
+
+        self.assertEqual(sheet.alias_to_cell["renamed"], "B9")
+        self.assertLess(sheet.get_calls, 10)
+
+    def test_suffixed_alias_with_base_outside_range_is_kept(self) -> None:
+        sheet = large_sheet(60)
+        sheet.set("A50", "depth")
+        sheet.setAlias("B50", "depth")
+        sheet.set("A2", "depth")
+        sheet.setAlias("B2", "depth2")
+        service = AliasService(FakePrefs())
+
+        with mock.patch.object(logging_utils, "warn_limited") as warn_limited:
+            self.assertEqual(service.sync_range(sheet, parse_range("A2:B2")), 0)
+            self.assertEqual(service.sync_range(sheet, parse_range("A2:B2")), 0)
+
+        warn_limited.assert_not_called()
+        self.assertEqual(sheet.alias_to_cell["depth"], "B50")
+        self.assertEqual(sheet.alias_to_cell["depth2"], "B2")
+
+    def test_retry_onto_current_alias_is_not_a_failure(self) -> None:
+        sheet = large_sheet(60)
+        sheet.set("A50", "depth")
+        sheet.setAlias("B50", "depth2")
+        sheet.set("A2", "depth")
+        sheet.setAlias("B2", "depth3")
+        sheet.setAlias("B40", "depth")
+        service = AliasService(FakePrefs())
+
+        with mock.patch.object(logging_utils, "warn_limited") as warn_limited:
+            self.assertEqual(service.sync_range(sheet, parse_range("A2:B2")), 0)
+
+        warn_limited.assert_not_called()
+        self.assertEqual(sheet.alias_to_cell["depth3"], "B2")
+
+
+class DryRunTests(unittest.TestCase):
+    def test_dry_run_reports_plan_without_writing(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        sheet.set("B1", "5")
+        sheet.setAlias("B1", "old")
+        sheet.set("A2", "width")
+        sheet.set("A3", "42")
+        service = AliasService(FakePrefs())
+
+        report = service.dry_run_sheet(sheet)
+
+        self.assertEqual(sheet.alias_to_cell, {"old": "B1"})
+        self.assertNotIn("B2", sheet.cells)
+        self.assertEqual(report["sheet"], "Variables")
+        self.assertEqual(
+            [(row["cell"], row["alias"], row["previous"]) for row in report["aliases"]],
+            [("B1", "width", "old"), ("B2", "width2", "")],
+        )
+        self.assertEqual([(row["cell"], row["base"]) for row in report["collisions"]], [("B2", "width")])
+        self.assertEqual(report["initialised"], [{"cell": "B2", "value": "0"}])
+        self.assertEqual(report["skipped"], [])
+        # The real sync still sees the sheet as it is.
+        self.assertEqual(service.sync_sheet(sheet), 2)
+
+    def test_dry_run_document_uses_shared_namespace(self) -> None:
+        first, second = FakeSheet(), FakeSheet()
+        first.set("A1", "depth")
+        second.set("A1", "depth")
+        FakeDocument(first, second)
+
+        reports = AliasService(UniquePrefs()).dry_run_document(first.Document)
+
+        self.assertEqual([report["aliases"][0]["alias"] for report in reports], ["depth", "depth2"])
+        self.assertEqual(first.alias_to_cell, {})
+
+
+class StaleAliasTests(unittest.TestCase):
+    def test_cleared_label_keeps_alias_until_cleanup(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        sheet.set("A2", "height")
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A1", "")
+        service.sync_sheet(sheet, ["A1"])
+        self.assertEqual(sheet.alias_to_cell["width"], "B1")
+
+        sheet.get_calls = 0
+        self.assertEqual(service.clean_stale_aliases(sheet), 1)
+        self.assertEqual(sheet.alias_to_cell, {"height": "B2"})
+        self.assertLess(sheet.get_calls, 10)
+
+    def test_cleanup_after_a_full_rescan(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A1", "")
+        # Create Alias Now drops the snapshot and resyncs the sheet.
+        list(service.iter_sync_chunks(sheet, 0))
+
+        self.assertEqual(service.clean_stale_aliases(sheet), 1)
+        self.assertNotIn("width", sheet.alias_to_cell)
+
+    def test_forgotten_sheet_has_no_stale_aliases(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A1", "")
+        service.forget(sheet)
+
+        self.assertEqual(service.clean_stale_aliases(sheet), 0)
+
+    def test_dry_run_reports_alias_of_cleared_label_as_removal(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        sheet.set("A2", "height")
+        service = AliasService(StalePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A1", "")
+        report = service.dry_run_sheet(sheet)
+
+        self.assertEqual([(row["cell"], row["previous"]) for row in report["removals"]], [("B1", "width")])
+        self.assertEqual(sheet.alias_to_cell["width"], "B1")
+
+    def test_moved_label_takes_its_alias_along(self) -> None:
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        service = AliasService(StalePrefs())
+        service.sync_sheet(sheet)
+
+        sheet.set("A1", "")
+        sheet.set("A5", "width")
+        service.sync_sheet(sheet, ["A1", "A5"])
+
+        self.assertEqual(sheet.alias_to_cell, {"width": "B5"})
+
+
+class DocumentUniqueAliasTests(unittest.TestCase):
+    def test_aliases_are_unique_across_sheets(self) -> None:
+        first, second = FakeSheet(), FakeSheet()
+        first.set("A1", "thickness")
+        second.set("A1", "thickness")
+        second.set("A2", "depth")
+        FakeDocument(first, second)
+
+        service = AliasService(UniquePrefs())
+        service.sync_sheet(first)
+        service.sync_sheet(second)
+
+        self.assertEqual(first.alias_to_cell, {"thickness": "B1"})
+        self.assertEqual(second.alias_to_cell, {"thickness2": "B1", "depth": "B2"})
+
+    def test_existing_alias_in_other_sheet_is_respected(self) -> None:
+        first, second = FakeSheet(), FakeSheet()
+        second.set("A1", "width")
+        second.set("B1", "5")
+        second.setAlias("B1", "width")
+        first.set("A1", "width")
+        FakeDocument(first, second)
+
+        AliasService(UniquePrefs()).sync_sheet(first)
+
+        self.assertEqual(first.alias_to_cell, {"width2": "B1"})
+
+    def test_released_claim_passes_to_the_next_sheet(self) -> None:
+        namespace = AliasNamespace()
+        namespace.claim("depth", "Sheet1", 2)
+        namespace.claim("depth", "Sheet2", 2)
+
+        namespace.release("depth", "Sheet1", 2)
+
+        self.assertEqual(namespace.owner("depth"), ("Sheet2", 2))
+
+    def test_resync_of_every_sheet_keeps_the_namespace(self) -> None:
+        sheets = [FakeSheet() for _ in range(4)]
+        for sheet in sheets:
+            sheet.set("A1", "depth")
+        document = FakeDocument(*sheets)
+        service = AliasService(UniquePrefs())
+        service.sync_document(document)
+
+        with mock.patch.object(AliasIndex, "attach", autospec=True, side_effect=AliasIndex.attach) as attach:
+            for sheet in sheets:
+                service.invalidate(sheet)
+                self.assertEqual(service.sync_sheet(sheet), 0)
+
+        attach.assert_not_called()
+        self.assertEqual([sheet.getAlias("B1") for sheet in sheets], ["depth", "depth2", "depth3", "depth4"])
+
+    def test_dry_run_sheet_sees_aliases_of_other_sheets(self) -> None:
+        first, second = FakeSheet(), FakeSheet()
+        first.set("A1", "depth")
+        first.set("B1", "5")
+        first.setAlias("B1", "depth")
+        second.set("A1", "depth")
+        FakeDocument(first, second)
+
+        report = AliasService(UniquePrefs()).dry_run_sheet(second)
+
+        self.assertEqual(report["aliases"][0]["alias"], "depth2")
+        self.assertEqual(second.alias_to_cell, {})
+
+    def test_index_follows_edits_and_removed_sheets(self) -> None:
+        first, second = FakeSheet(), FakeSheet()
+        first.set("A1", "depth")
+        FakeDocument(first, second)
+        service = AliasService(UniquePrefs())
+        service.sync_sheet(first)
+
+        first.set("A1", "height")
+        service.sync_sheet(first, ["A1"])
+        second.set("A1", "depth")
+        service.sync_sheet(second)
+        self.assertEqual(second.alias_to_cell, {"depth": "B1"})
+
+        service.invalidate(second)
+        first.set("A2", "depth")
+        service.sync_sheet(first, ["A2"])
+        # Sheet2 is re-read on its next sync; until then its alias stays claimed.
+        self.assertEqual(first.alias_to_cell["depth2"], "B2")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
-from SketcherAutoAlias.core.camel_case import to_camel_case, to_valid_alias
+from SketcherAutoAlias.core import camel_case
+from SketcherAutoAlias.core.camel_case import (
+    cache_stats,
+    clear_caches,
+    to_camel_case,
+    to_valid_alias,
+    to_valid_aliases,
+)
 
 
 class CamelCaseTests(unittest.TestCase):
@@ -18,6 +26,69 @@ class CamelCaseTests(unittest.TestCase):
         self.assertEqual(to_valid_alias("wand höhe"), "wand_hoehe")
         self.assertEqual(to_valid_alias("Blech-Deckel"), "blech_deckel")
 
+    def test_transliterates_latin_greek_and_cyrillic(self) -> None:
+        self.assertEqual(to_valid_alias("łódź"), "lodz")
+        self.assertEqual(to_valid_alias("størrelse"), "stoerrelse")
+        self.assertEqual(to_valid_alias("naïve café"), "naive_cafe")
+        self.assertEqual(to_valid_alias("Δ länge"), "d_laenge")
+        self.assertEqual(to_valid_alias("πλάτος"), "platos")
+        self.assertEqual(to_valid_alias("Ширина стены"), "shirina_steny")
+        self.assertEqual(to_valid_alias("µm"), "um")
+        self.assertEqual(to_camel_case("höhe ﬁlter x²"), "hoeheFilterX2")
+
+    def test_compatibility_forms_keep_their_ascii_part(self) -> None:
+        # Same results as the plain NFKD normalisation used before the table.
+        expected = {
+            "a ½": "a_12",
+            "a ¼": "a_14",
+            "a ¾": "a_34",
+            "a Ŀ": "a_l",
+            "a ŀ": "a_l",
+            "a ŉ": "a_n",
+            "a ʰ": "a_h",
+            "a ʲ": "a_j",
+            "a ℓ": "a_l",
+            "a ㎜": "a_mm",
+            "a №": "a_no",
+            "a ①": "a_1",
+            "a Ⅻ": "a_xii",
+            "a ™": "a_tm",
+            "a ℕ": "a_n",
+            "a 𝐱": "a_x",
+        }
+        for label, alias in expected.items():
+            with self.subTest(label=label):
+                self.assertEqual(to_valid_alias(label), alias)
+        self.assertEqual(to_camel_case("länge ℓ ½"), "laengeL12")
+
+    def test_decomposed_input_matches_composed(self) -> None:
+        self.assertEqual(to_valid_alias("ho\u0308he"), "hoehe")
+
+    def test_ascii_labels_skip_unicode_work(self) -> None:
+        clear_caches()
+        with mock.patch.object(camel_case.unicodedata, "normalize", side_effect=AssertionError):
+            self.assertEqual(to_valid_alias("Wall Thickness"), "wall_thickness")
+
+    def test_repeated_labels_hit_the_cache(self) -> None:
+        clear_caches()
+        to_valid_alias("wall thickness")
+        to_valid_alias("wall thickness")
+        to_valid_alias("height")
+
+        stats = cache_stats()["to_valid_alias"]
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["size"], 2)
+
+    def test_batch_normalises_each_distinct_label_once(self) -> None:
+        clear_caches()
+        labels = ["offset"] * 300 + ["wand höhe", "123 width"]
+
+        result = to_valid_aliases(labels)
+
+        self.assertEqual(result, {"offset": "offset", "wand höhe": "wand_hoehe", "123 width": "v123_width"})
+        self.assertEqual(cache_stats()["to_valid_alias"]["misses"], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
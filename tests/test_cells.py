@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.cells import (
+    COLUMN_NAMES,
+    MAX_COLUMN_INDEX,
+    col_of,
+    format_cell,
+    left_of,
+    pack,
+    parse_cell,
+    parse_range,
+    right_of,
+    row_of,
+)
+
+
+class CellCoordinateTests(unittest.TestCase):
+    def test_column_table_covers_every_column(self) -> None:
+        self.assertEqual(COLUMN_NAMES[1], "A")
+        self.assertEqual(COLUMN_NAMES[26], "Z")
+        self.assertEqual(COLUMN_NAMES[27], "AA")
+        self.assertEqual(COLUMN_NAMES[702], "ZZ")
+        self.assertEqual(COLUMN_NAMES[703], "AAA")
+        self.assertEqual(COLUMN_NAMES[MAX_COLUMN_INDEX], "XFD")
+        self.assertEqual(len(COLUMN_NAMES), MAX_COLUMN_INDEX + 1)
+
+    def test_parse_and_format_round_trip(self) -> None:
+        for address in ("A1", "Z9", "AB123", "XFD1048576"):
+            self.assertEqual(format_cell(parse_cell(address)), address)
+        self.assertEqual(parse_cell(" ab12 "), pack(12, 28))
+
+    def test_parse_rejects_invalid_addresses(self) -> None:
+        for address in ("", "A", "12", "A0", "A01", "XFE1", "A1B", "wall"):
+            self.assertIsNone(parse_cell(address), address)
+
+    def test_packed_cells_sort_row_major(self) -> None:
+        cells = [parse_cell(address) for address in ("B2", "AA1", "A2", "C1")]
+        self.assertEqual([format_cell(cell) for cell in sorted(cells)], ["C1", "AA1", "A2", "B2"])
+        self.assertEqual((row_of(cells[1]), col_of(cells[1])), (1, 27))
+
+    def test_neighbours_stop_at_sheet_edges(self) -> None:
+        self.assertEqual(format_cell(right_of(parse_cell("Z5"))), "AA5")
+        self.assertEqual(format_cell(left_of(parse_cell("AA5"))), "Z5")
+        self.assertIsNone(left_of(parse_cell("A5")))
+        self.assertIsNone(right_of(parse_cell("XFD5")))
+
+    def test_parse_range_expands_row_major(self) -> None:
+        self.assertEqual([format_cell(cell) for cell in parse_range("B2:A3")], ["A2", "B2", "A3", "B3"])
+        self.assertEqual([format_cell(cell) for cell in parse_range("c7")], ["C7"])
+        self.assertIsNone(parse_range("A1:"))
+        self.assertIsNone(parse_range("width"))
+
+
+if __name__ == "__main__":
+    unittest.main()
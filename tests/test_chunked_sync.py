@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from SketcherAutoAlias.core import alias_service as alias_service_module
+from SketcherAutoAlias.core import logging_utils
+from SketcherAutoAlias.core.alias_plan import plan_aliases
+from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.cells import row_of
+from SketcherAutoAlias.core.chunked_sync import ChunkedSync
+
+from .fakes import FakePrefs, FakeSheet, large_sheet
+
+
+class ChunkedSyncTests(unittest.TestCase):
+    def test_run_writes_every_sheet_in_bounded_steps(self) -> None:
+        sheets = [large_sheet(25, "First"), large_sheet(5, "Second")]
+        job = ChunkedSync(AliasService(FakePrefs()), sheets, 10)
+
+        steps = 0
+        while job.step():
+            steps += 1
+
+        self.assertEqual(job.updated, 30)
+        self.assertEqual(job.sheets_done, 2)
+        # 3 chunks + end of "First", 1 chunk + end of "Second".
+        self.assertEqual(steps, 6)
+        self.assertEqual(sheets[0].alias_to_cell["param_25"], "B25")
+
+    def test_cancel_keeps_written_chunks_and_next_sync_completes(self) -> None:
+        sheet = large_sheet(25)
+        service = AliasService(FakePrefs())
+        finished = []
+        job = ChunkedSync(service, [sheet], 10, finished.append)
+
+        job.step()
+        job.cancel()
+
+        self.assertEqual(finished, [job])
+        self.assertTrue(job.cancelled)
+        self.assertEqual(job.updated, 10)
+        self.assertEqual(len(sheet.alias_to_cell), 10)
+        self.assertFalse(job.step())
+
+        self.assertEqual(service.sync_sheet(sheet), 15)
+        self.assertEqual(sheet.alias_to_cell["param_25"], "B25")
+
+    def test_each_step_plans_a_band_of_rows(self) -> None:
+        sheet = large_sheet(25)
+        job = ChunkedSync(AliasService(FakePrefs()), [sheet], 10)
+
+        with mock.patch.object(alias_service_module, "plan_aliases", wraps=plan_aliases) as planner:
+            job.run()
+
+        bands = [sorted({row_of(cell) for cell in call.args[1]}) for call in planner.call_args_list]
+        self.assertEqual(bands, [list(range(1, 11)), list(range(11, 21)), list(range(21, 26))])
+        self.assertEqual(job.updated, 25)
+
+    def test_duplicate_labels_across_bands_get_suffixes(self) -> None:
+        sheet = FakeSheet()
+        for row in range(1, 26):
+            sheet.set(f"A{row}", "offset")
+        job = ChunkedSync(AliasService(FakePrefs()), [sheet], 10)
+
+        self.assertEqual(job.run(), 25)
+        self.assertEqual(sheet.alias_to_cell["offset"], "B1")
+        self.assertEqual(sheet.alias_to_cell["offset2"], "B2")
+        self.assertEqual(sheet.alias_to_cell["offset25"], "B25")
+
+    def test_skipped_labels_are_reported_once_per_sheet(self) -> None:
+        sheet = large_sheet(25)
+        sheet.isValidAlias = lambda alias: False
+        job = ChunkedSync(AliasService(FakePrefs()), [sheet], 10)
+
+        with mock.patch.object(logging_utils, "warn_limited") as warned:
+            self.assertEqual(job.run(), 0)
+
+        self.assertEqual(warned.call_count, 1)
+
+    def test_failing_sheet_does_not_stop_the_job(self) -> None:
+        class _BrokenService:
+            def iter_sync_chunks(self, sheet, rows):
+                if sheet == "broken":
+                    raise RuntimeError("deleted")
+                yield 3
+
+        job = ChunkedSync(_BrokenService(), ["broken", "ok"], 10)
+
+        self.assertEqual(job.run(), 3)
+        self.assertEqual(job.sheets_done, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import unittest
 
 from SketcherAutoAlias.commands.cmd_create_alias_now import CreateAliasNowCommand
+from SketcherAutoAlias.commands.cmd_show_sync_stats import ShowSyncStatsCommand
+from SketcherAutoAlias.commands.cmd_sync_selection import SyncSelectionCommand
 from SketcherAutoAlias.commands.cmd_toggle_auto_alias import ToggleAutoAliasCommand
 
 
@@ -10,6 +12,8 @@ class _FakeController:
     def __init__(self) -> None:
         self.toggle_count = 0
         self.manual_count = 0
+        self.stats_count = 0
+        self.range_count = 0
 
     def is_active(self) -> bool:
         return True
@@ -25,6 +29,13 @@ class _FakeController:
         self.manual_count += 1
         return 1
 
+    def show_sync_stats(self):
+        self.stats_count += 1
+
+    def sync_selected_range(self):
+        self.range_count += 1
+        return 1
+
 
 class CommandSignatureTests(unittest.TestCase):
     def test_toggle_activated_accepts_optional_checked_arg(self) -> None:
@@ -45,6 +56,25 @@ class CommandSignatureTests(unittest.TestCase):
 
         self.assertEqual(controller.manual_count, 2)
 
+    def test_show_stats_activated_accepts_optional_arg(self) -> None:
+        controller = _FakeController()
+        command = ShowSyncStatsCommand(controller)
+
+        command.Activated()
+        command.Activated(False)
+
+        self.assertEqual(controller.stats_count, 2)
+        self.assertEqual(command.GetResources()["MenuText"], "Show Alias Sync Stats")
+
+    def test_sync_selection_activated_accepts_optional_arg(self) -> None:
+        controller = _FakeController()
+        command = SyncSelectionCommand(controller)
+
+        command.Activated()
+        command.Activated(False)
+
+        self.assertEqual(controller.range_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
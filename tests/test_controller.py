@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest import mock
+
+from SketcherAutoAlias.core import controller as controller_module
+from SketcherAutoAlias.core.controller import SketcherAutoAliasController
+
+from .fakes import FakeDocument, FakeSheet, SerialisedSheet
+
+
+def _sheet() -> SerialisedSheet:
+    sheet = SerialisedSheet()
+    sheet.contents.update({"A1": "width", "B1": "12", "A2": "height", "B2": "30"})
+    return sheet
+
+
+class FingerprintTests(unittest.TestCase):
+    def test_unchanged_sheet_skips_sync(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+        self.assertEqual(controller.handle_sheet_change(sheet, "cells"), 0)
+        self.assertEqual(sheet.aliases, {"B1": "width", "B2": "height"})
+
+        reads = sheet.content_reads
+        controller.handle_sheet_change(sheet, "cells")
+        controller.handle_sheet_change(sheet, "Label")
+
+        # One fingerprint read per event, no bulk read or cell access.
+        self.assertEqual(sheet.content_reads, reads + 2)
+        self.assertEqual(sheet.read_calls, 0)
+
+    def test_changed_sheet_is_synced(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+        controller.handle_sheet_change(sheet, "cells")
+
+        sheet.contents["A3"] = "depth"
+        controller.handle_sheet_change(sheet, "cells")
+
+        self.assertEqual(sheet.aliases["B3"], "depth")
+
+    def test_hinted_sync_does_not_serialise_the_sheet(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+        controller.handle_sheet_change(sheet, "cells")
+
+        reads = sheet.content_reads
+        sheet.contents["A3"] = "depth"
+        controller.handle_sheet_change(sheet, "A3")
+
+        self.assertEqual(sheet.aliases["B3"], "depth")
+        self.assertEqual(sheet.content_reads, reads)
+
+    def test_sheet_without_serialised_cells_is_always_synced(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        controller.handle_sheet_change(sheet, "cells")
+
+        del sheet.alias_to_cell["width"]
+        sheet.get_calls = 0
+        controller.handle_sheet_change(sheet, "cells")
+
+        self.assertGreater(sheet.get_calls, 0)
+        self.assertEqual(sheet.alias_to_cell["width"], "B1")
+
+    def test_oversized_sheet_syncs_once_the_limit_allows_it(self) -> None:
+        controller = SketcherAutoAliasController()
+        controller._prefs.auto_sync_max_cells = lambda: 2
+        sheet = _sheet()
+
+        controller.handle_sheet_change(sheet, "cells")
+        self.assertEqual(sheet.aliases, {})
+
+        controller._prefs.auto_sync_max_cells = lambda: 0
+        controller.handle_sheet_change(sheet, "cells")
+        self.assertEqual(sheet.aliases, {"B1": "width", "B2": "height"})
+
+    def test_excluded_sheet_is_not_synced_automatically(self) -> None:
+        controller = SketcherAutoAliasController()
+        controller._prefs.excluded_sheets = lambda: ("Lookup*",)
+        sheet = _sheet()
+        sheet.Label = "Lookup table"
+
+        self.assertEqual(controller.handle_sheet_change(sheet, "cells"), 0)
+        self.assertEqual(sheet.content_reads, 0)
+        self.assertEqual(sheet.aliases, {})
+
+
+class RangeTests(unittest.TestCase):
+    def _gui(self, sheet, ranges):
+        view = types.SimpleNamespace(getSheet=lambda: sheet, selectedRanges=lambda: ranges)
+        return types.SimpleNamespace(activeView=lambda: view)
+
+    def test_selected_range_is_synced_without_reading_the_sheet(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+
+        with mock.patch.object(controller_module, "Gui", self._gui(sheet, ["A2:B2"])):
+            self.assertEqual(controller.sync_selected_range(), 1)
+
+        self.assertEqual(sheet.aliases, {"B2": "height"})
+        self.assertEqual(sheet.content_reads, 0)
+
+    def test_no_spreadsheet_view_syncs_nothing(self) -> None:
+        controller = SketcherAutoAliasController()
+        gui = types.SimpleNamespace(activeView=lambda: object())
+
+        with mock.patch.object(controller_module, "Gui", gui):
+            self.assertEqual(controller.sync_selected_range(), 0)
+
+    def test_auto_sync_is_limited_to_configured_ranges(self) -> None:
+        controller = SketcherAutoAliasController()
+        controller._prefs.auto_sync_ranges = lambda: (("Other*", "A1:B1"), ("Vari*", "B2"))
+        sheet = _sheet()
+
+        controller.handle_sheet_change(sheet, "A1")
+        self.assertEqual(sheet.aliases, {})
+
+        controller.handle_sheet_change(sheet, "cells")
+        self.assertEqual(sheet.aliases, {"B2": "height"})
+        self.assertEqual(sheet.content_reads, 0)
+
+
+class RestoreTests(unittest.TestCase):
+    def test_sheets_are_synced_after_restore_finishes(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+        document = FakeDocument(sheet)
+
+        controller.handle_document_restore(document, False)
+        controller.handle_sheet_change(sheet, "CreatedObject")
+        controller.handle_sheet_change(sheet, "cells")
+        self.assertEqual(sheet.content_reads, 0)
+        self.assertEqual(sheet.aliases, {})
+
+        controller.handle_document_restore(document, True)
+        self.assertEqual(sheet.aliases, {"B1": "width", "B2": "height"})
+
+    def test_restore_of_other_document_does_not_block(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = _sheet()
+        FakeDocument(sheet)
+
+        other = FakeDocument()
+        other.Name = "Other"
+        controller.handle_document_restore(other, False)
+        controller.handle_sheet_change(sheet, "cells")
+
+        self.assertEqual(sheet.aliases["B1"], "width")
+
+
+class ManualSyncTests(unittest.TestCase):
+    def test_failed_progress_start_does_not_block_later_syncs(self) -> None:
+        controller = SketcherAutoAliasController()
+        sheet = FakeSheet()
+        sheet.set("A1", "width")
+        app = types.SimpleNamespace(ActiveDocument=FakeDocument(sheet))
+
+        with mock.patch.object(controller_module, "App", app):
+            with mock.patch.object(controller_module, "start_with_progress", side_effect=RuntimeError("no Qt")):
+                with self.assertRaises(RuntimeError):
+                    controller.run_manual_sync()
+
+            self.assertIsNone(controller._manual_job)
+            self.assertEqual(controller._active_sync, set())
+            with mock.patch.object(controller_module, "start_with_progress", return_value=False):
+                self.assertEqual(controller.run_manual_sync(), 1)
+
+        self.assertEqual(sheet.alias_to_cell, {"width": "B1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
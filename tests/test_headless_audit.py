@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from SketcherAutoAlias.headless.audit import audit_file, main
+from SketcherAutoAlias.headless.fcstd import iter_document_sheets
+
+
+def document_xml(sheets) -> str:
+    objects = ['<Object type="Part::Box" name="Box" id="1" />']
+    data = ['<Object name="Box"><Properties Count="0"></Properties></Object>']
+    for number, (name, label, cells) in enumerate(sheets, start=2):
+        objects.append(f'<Object type="Spreadsheet::Sheet" name="{name}" id="{number}" />')
+        cell_xml = "".join(
+            f"<Cell address={quoteattr(address)} content={quoteattr(content)}"
+            + (f" alias={quoteattr(alias)}" if alias else "")
+            + " />"
+            for address, content, alias in cells
+        )
+        data.append(
+            f'<Object name="{name}"><Properties Count="2">'
+            f'<Property name="Label" type="App::PropertyString"><String value={quoteattr(label)}/></Property>'
+            f'<Property name="cells" type="Spreadsheet::PropertySheet">'
+            f'<Cells Count="{len(cells)}" xlink="1"><XLinks count="0"></XLinks>{cell_xml}</Cells>'
+            f"</Property></Properties></Object>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n<Document SchemaVersion="4" FileVersion="1">'
+        f'<Objects Count="{len(objects)}">{"".join(objects)}</Objects>'
+        f'<ObjectData Count="{len(data)}">{"".join(data)}</ObjectData></Document>'
+    )
+
+
+def write_fcstd(path: str, sheets, extra_members=None) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("Document.xml", document_xml(sheets))
+        for name, payload in (extra_members or {}).items():
+            archive.writestr(name, payload)
+
+
+PARAMS = (
+    "Params",
+    "Parameters",
+    [
+        ("A1", "wall thickness", ""),
+        ("B1", "5 mm", "wall_thickness"),
+        ("A2", "höhe", ""),
+        ("B2", "2400 mm", ""),
+        ("A3", "width", ""),
+        ("B3", "30 mm", "old_width"),
+        ("A4", "wall thickness", ""),
+        ("B4", "8 mm", ""),
+    ],
+)
+
+
+class HeadlessAuditTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp)
+
+    def test_stream_parser_yields_only_sheets(self) -> None:
+        path = os.path.join(self.tmp, "part.FCStd")
+        write_fcstd(path, [PARAMS])
+
+        sheets = list(iter_document_sheets(path))
+
+        self.assertEqual([sheet.name for sheet in sheets], ["Params"])
+        self.assertEqual(sheets[0].label, "Parameters")
+        self.assertEqual(sheets[0].cells["B1"], ("5 mm", "wall_thickness"))
+
+    def test_audit_classifies_findings(self) -> None:
+        path = os.path.join(self.tmp, "part.FCStd")
+        write_fcstd(path, [PARAMS])
+
+        report = audit_file(path)
+
+        self.assertIsNone(report["error"])
+        findings = {item["cell"]: item for item in report["sheets"][0]["findings"]}
+        self.assertEqual(set(findings), {"B2", "B3", "B4"})
+        self.assertEqual((findings["B2"]["kind"], findings["B2"]["expected"]), ("missing", "hoehe"))
+        self.assertEqual((findings["B3"]["kind"], findings["B3"]["alias"]), ("stale", "old_width"))
+        self.assertEqual((findings["B4"]["kind"], findings["B4"]["expected"]), ("colliding", "wall_thickness2"))
+
+    def test_audit_matches_freecad_alias_rules(self) -> None:
+        path = os.path.join(self.tmp, "units.FCStd")
+        cells = [("A1", "h", ""), ("B1", "5", ""), ("A2", "cells", ""), ("B2", "3", "")]
+        write_fcstd(path, [("Sheet", "Sheet", cells)])
+
+        findings = {item["cell"]: item["expected"] for item in audit_file(path)["sheets"][0]["findings"]}
+
+        self.assertEqual(findings, {"B1": "h2", "B2": "cells2"})
+
+    def test_unreadable_file_is_reported_as_error(self) -> None:
+        path = os.path.join(self.tmp, "broken.FCStd")
+        with open(path, "wb") as handle:
+            handle.write(b"not a zip")
+
+        self.assertIn("BadZipFile", audit_file(path)["error"])
+
+    def test_cli_scans_directories_with_worker_pool(self) -> None:
+        os.makedirs(os.path.join(self.tmp, "vault", "sub"))
+        write_fcstd(os.path.join(self.tmp, "vault", "a.FCStd"), [PARAMS])
+        clean = ("Clean", "Clean", [("A1", "x", ""), ("B1", "1", "x")])
+        write_fcstd(os.path.join(self.tmp, "vault", "sub", "b.fcstd"), [clean])
+        output = os.path.join(self.tmp, "report.json")
+
+        code = main(["--jobs", "2", "--output", output, os.path.join(self.tmp, "vault")])
+
+        self.assertEqual(code, 1)
+        with open(output, encoding="utf-8") as handle:
+            reports = json.load(handle)
+        self.assertEqual([os.path.basename(report["file"]) for report in reports], ["a.FCStd", "b.fcstd"])
+        self.assertEqual(reports[1]["sheets"][0]["findings"], [])
+
+    def test_cli_csv_output(self) -> None:
+        path = os.path.join(self.tmp, "part.FCStd")
+        write_fcstd(path, [PARAMS])
+        output = os.path.join(self.tmp, "report.csv")
+
+        main(["--jobs", "1", "--format", "csv", "--output", output, path])
+
+        with open(output, encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(lines[0], "file,sheet,kind,cell,label_cell,label,alias,expected")
+        self.assertEqual(len(lines), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from SketcherAutoAlias.headless.fcstd import iter_document_sheets
+from SketcherAutoAlias.headless.rewrite import main, rewrite_file
+
+from .test_headless_audit import PARAMS, document_xml, write_fcstd
+
+
+class HeadlessRewriteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "part.FCStd")
+        extra = {"PartShape.brp": b"brep " * 5000, "thumbnails/Thumbnail.png": os.urandom(2048)}
+        write_fcstd(self.path, [PARAMS], extra)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp)
+
+    def _cells(self):
+        return next(iter(iter_document_sheets(self.path))).cells
+
+    def _members(self):
+        with zipfile.ZipFile(self.path) as archive:
+            return {
+                info.filename: (info.compress_type, info.date_time, info.CRC, archive.read(info))
+                for info in archive.infolist()
+                if info.filename != "Document.xml"
+            }
+
+    def test_rewrite_adds_missing_aliases_and_keeps_stale_ones(self) -> None:
+        report = rewrite_file(self.path)
+
+        self.assertIsNone(report["error"])
+        self.assertTrue(report["changed"])
+        self.assertEqual(report["skipped_renames"], 1)
+        cells = self._cells()
+        self.assertEqual(cells["B2"], ("2400 mm", "hoehe"))
+        self.assertEqual(cells["B3"], ("30 mm", "old_width"))
+        self.assertEqual(cells["B4"], ("8 mm", "wall_thickness2"))
+
+    def test_rename_stale_matches_plugin_result(self) -> None:
+        rewrite_file(self.path, rename_stale=True)
+
+        self.assertEqual(self._cells()["B3"], ("30 mm", "width"))
+
+    def test_unit_named_label_gets_an_alias_freecad_accepts(self) -> None:
+        write_fcstd(self.path, [("Sheet", "Sheet", [("A1", "h", ""), ("B1", "5 mm", "")])])
+
+        rewrite_file(self.path)
+
+        self.assertEqual(self._cells()["B1"], ("5 mm", "h2"))
+
+    def test_kept_stale_alias_does_not_push_others_to_a_suffix(self) -> None:
+        cells = [("A1", "width", ""), ("B1", "5", "old"), ("A3", "width", ""), ("B3", "7", "")]
+        write_fcstd(self.path, [("Sheet", "Sheet", cells)])
+
+        report = rewrite_file(self.path)
+
+        self.assertEqual(report["skipped_renames"], 1)
+        self.assertEqual(self._cells()["B1"], ("5", "old"))
+        self.assertEqual(self._cells()["B3"], ("7", "width"))
+
+    def test_new_target_cells_are_created_with_zero(self) -> None:
+        write_fcstd(self.path, [("Sheet", "Sheet", [("A1", "height", ""), ("C7", "depth", "")])])
+
+        rewrite_file(self.path)
+
+        cells = self._cells()
+        self.assertEqual(cells["B1"], ("0", "height"))
+        self.assertEqual(cells["D7"], ("0", "depth"))
+        with zipfile.ZipFile(self.path) as archive:
+            self.assertIn('<Cells Count="4"', archive.read("Document.xml").decode("utf-8"))
+
+    def test_other_members_keep_content_and_compression(self) -> None:
+        before = self._members()
+
+        rewrite_file(self.path)
+
+        self.assertEqual(self._members(), before)
+        with zipfile.ZipFile(self.path) as archive:
+            self.assertIsNone(archive.testzip())
+
+    def test_comments_are_kept(self) -> None:
+        xml = document_xml([PARAMS]).replace("<Objects Count=\"2\">", "<Objects Count=\"2\"><!-- kept -->")
+        with zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("Document.xml", xml)
+
+        rewrite_file(self.path)
+
+        with zipfile.ZipFile(self.path) as archive:
+            self.assertIn('<Objects Count="2"><!-- kept --><Object', archive.read("Document.xml").decode("utf-8"))
+        self.assertEqual(self._cells()["B2"], ("2400 mm", "hoehe"))
+
+    def test_file_in_sync_is_left_untouched(self) -> None:
+        write_fcstd(self.path, [("Sheet", "Sheet", [("A1", "x", ""), ("B1", "1", "x")])])
+        stamp = os.stat(self.path).st_mtime_ns
+
+        report = rewrite_file(self.path)
+
+        self.assertFalse(report["changed"])
+        self.assertEqual(os.stat(self.path).st_mtime_ns, stamp)
+
+    def test_failed_rewrite_leaves_no_temp_file(self) -> None:
+        with open(self.path, "wb") as handle:
+            handle.write(b"broken")
+
+        self.assertEqual(main(["--jobs", "1", self.tmp]), 2)
+        self.assertEqual(os.listdir(self.tmp), ["part.FCStd"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,14 @@ class _FakeParamGroup:
         self.storage[key] = str(value)
 
 
+class _Sheet:
+    TypeId = "Spreadsheet::Sheet"
+    Name = "Spreadsheet"
+
+    def __init__(self) -> None:
+        self.Document = types.SimpleNamespace(Name="Doc", Objects=[self])
+
+
 class InitGuiTests(unittest.TestCase):
     def setUp(self) -> None:
         self._saved_modules = {name: sys.modules.get(name) for name in ("FreeCAD", "FreeCADGui")}
@@ -121,11 +129,43 @@ class InitGuiTests(unittest.TestCase):
 
         self.assertIn("SketcherAutoAlias_CreateAliasNow", self.gui._commands)
         self.assertIn("SketcherAutoAlias_Toggle", self.gui._commands)
+        self.assertIn("SketcherAutoAlias_ShowSyncStats", self.gui._commands)
         self.assertEqual(len(self.gui._manipulators), 1)
         self.assertTrue(hasattr(self.gui, "SPREADSHEET_ALIAS_WB_MANIPULATOR"))
         self.assertGreaterEqual(self.gui._active_workbench.reloaded, 1)
         self.assertEqual(len(self.app._observers), 1)
 
+    def test_import_defers_controller_until_a_sheet_appears(self) -> None:
+        importlib.import_module("SketcherAutoAlias.InitGui")
+
+        self.assertNotIn("SketcherAutoAlias.core.controller", sys.modules)
+        self.assertNotIn("SketcherAutoAlias.core.alias_service", sys.modules)
+        startup_observer = self.app._observers[0]
+
+        startup_observer.slotCreatedObject(types.SimpleNamespace(TypeId="Part::Box"))
+        self.assertNotIn("SketcherAutoAlias.core.controller", sys.modules)
+
+        startup_observer.slotCreatedObject(_Sheet())
+        controller = sys.modules["SketcherAutoAlias.core.controller"].get_controller()
+        self.assertEqual(self.app._observers, [controller._observer])
+
+    def test_command_builds_controller_on_first_use(self) -> None:
+        importlib.import_module("SketcherAutoAlias.InitGui")
+
+        self.assertTrue(self.gui._commands["SketcherAutoAlias_Toggle"].IsChecked())
+        self.assertIn("SketcherAutoAlias.core.controller", sys.modules)
+        # Building the controller alone does not register its observer.
+        self.assertEqual(len(self.app._observers), 1)
+
+    def test_open_document_with_sheets_starts_observer_immediately(self) -> None:
+        document = types.SimpleNamespace(Name="Doc", Objects=[_Sheet()])
+        self.app.listDocuments = lambda: {"Doc": document}
+
+        importlib.import_module("SketcherAutoAlias.InitGui")
+
+        controller = sys.modules["SketcherAutoAlias.core.controller"].get_controller()
+        self.assertEqual(self.app._observers, [controller._observer])
+
     def test_manipulator_targets_spreadsheet_toolbar(self) -> None:
         importlib.import_module("SketcherAutoAlias.InitGui")
 
@@ -140,21 +180,29 @@ class InitGuiTests(unittest.TestCase):
             config,
         )
 
-    def test_import_survives_controller_import_failure(self) -> None:
-        broken_controller = types.ModuleType("SketcherAutoAlias.core.controller")
-        saved = sys.modules.get("SketcherAutoAlias.core.controller")
-        sys.modules["SketcherAutoAlias.core.controller"] = broken_controller
+    def test_import_survives_startup_import_failure(self) -> None:
+        broken_startup = types.ModuleType("SketcherAutoAlias.core.startup")
+        saved = sys.modules.get("SketcherAutoAlias.core.startup")
+        sys.modules["SketcherAutoAlias.core.startup"] = broken_startup
         sys.modules.pop("SketcherAutoAlias.InitGui", None)
 
         try:
             importlib.import_module("SketcherAutoAlias.InitGui")
-            # No crash during import, and no manipulator because controller setup aborted.
+            # No crash during import, and no manipulator because command setup aborted.
             self.assertEqual(len(self.gui._manipulators), 0)
         finally:
             if saved is None:
-                sys.modules.pop("SketcherAutoAlias.core.controller", None)
+                sys.modules.pop("SketcherAutoAlias.core.startup", None)
             else:
-                sys.modules["SketcherAutoAlias.core.controller"] = saved
+                sys.modules["SketcherAutoAlias.core.startup"] = saved
+
+    def test_sheet_survives_controller_import_failure(self) -> None:
+        importlib.import_module("SketcherAutoAlias.InitGui")
+        sys.modules["SketcherAutoAlias.core.controller"] = types.ModuleType("SketcherAutoAlias.core.controller")
+
+        # The start-up observer warns and stays registered instead of raising into FreeCAD.
+        self.app._observers[0].slotCreatedObject(_Sheet())
+        self.assertEqual(len(self.app._observers), 1)
 
 
 if __name__ == "__main__":
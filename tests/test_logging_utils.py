@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest import mock
+
+from SketcherAutoAlias.core import logging_utils
+from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.logging_utils import MessageBatch, clear_details, details
+
+from .fakes import FakePrefs, FakeSheet
+
+
+class _Console:
+    def __init__(self) -> None:
+        self.warnings = []
+
+    def PrintWarning(self, line):  # noqa: N802
+        self.warnings.append(line)
+
+    def PrintMessage(self, _line):  # noqa: N802
+        pass
+
+
+class MessageBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_details()
+        self.console = _Console()
+        patcher = mock.patch.object(logging_utils, "App", types.SimpleNamespace(Console=self.console))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(clear_details)
+
+    def test_many_items_print_one_summary(self) -> None:
+        batch = MessageBatch("labels skipped")
+        for row in range(1, 313):
+            batch.add(f"A{row}")
+        batch.flush("Params")
+
+        self.assertEqual(len(self.console.warnings), 1)
+        self.assertIn("'Params': 312 labels skipped (first 5: A1, A2, A3, A4, A5, ...)", self.console.warnings[0])
+        self.assertEqual(len(details()), 312)
+        self.assertEqual(details()[-1], "'Params': A312")
+
+    def test_empty_batch_prints_nothing(self) -> None:
+        MessageBatch("labels skipped").flush("Params")
+
+        self.assertEqual(self.console.warnings, [])
+
+    def test_repeats_are_rate_limited(self) -> None:
+        batch = MessageBatch("labels skipped")
+        with mock.patch.object(logging_utils.time, "monotonic", side_effect=[0.0, 10.0, 20.0, 100.0]):
+            for _ in range(4):
+                batch.add("A1")
+                batch.flush("Params")
+
+        self.assertEqual(len(self.console.warnings), 2)
+        self.assertIn("(2 similar report(s) suppressed)", self.console.warnings[1])
+        self.assertEqual(len(details()), 4)
+
+    def test_different_failure_is_not_suppressed(self) -> None:
+        batch = MessageBatch("labels skipped")
+        with mock.patch.object(logging_utils.time, "monotonic", side_effect=[0.0, 10.0, 20.0]):
+            for item in ("A1", "A1", "B7"):
+                batch.add(item)
+                batch.flush("Params")
+
+        self.assertEqual(len(self.console.warnings), 2)
+        self.assertIn("(B7)", self.console.warnings[1])
+
+    def test_rate_limit_keys_are_bounded(self) -> None:
+        with mock.patch.object(logging_utils, "SUMMARY_KEY_LIMIT", 3):
+            for name in ("First", "Second", "Third", "Fourth"):
+                logging_utils.warn_limited(name, f"{name} failed")
+            # A suppressed repeat keeps its key among the most recent ones.
+            logging_utils.warn_limited("Second", "Second failed")
+            logging_utils.warn_limited("Fifth", "Fifth failed")
+
+        self.assertEqual(list(logging_utils._last_summary), ["Fourth", "Second", "Fifth"])
+        self.assertEqual(len(self.console.warnings), 5)
+
+    def test_sync_of_broken_sheet_prints_one_line(self) -> None:
+        sheet = FakeSheet()
+        sheet.isValidAlias = lambda _alias: False
+        for row in range(1, 51):
+            sheet.set(f"A{row}", f"param {row}")
+
+        AliasService(FakePrefs()).sync_sheet(sheet)
+
+        self.assertEqual(len(self.console.warnings), 1)
+        self.assertIn("'Variables': 50 label(s) skipped", self.console.warnings[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.observers import SpreadsheetObserver
+from SketcherAutoAlias.core.write_batch import WriteBatch, is_writing, write_generation
+
+
+class _EchoSheet:
+    """Sheet that notifies the observer synchronously, like FreeCAD does."""
+
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self, observer: SpreadsheetObserver) -> None:
+        self.Name = "Echo"
+        self._observer = observer
+
+    def set(self, cell: str, value: str) -> None:
+        self._observer.slotChangedObject(self, "cells")
+        self._observer.slotChangedObject(self, cell)
+
+    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
+        self._observer.slotChangedObject(self, "cells")
+
+    def recompute(self) -> None:
+        self._observer.slotChangedObject(self, "B1")
+
+
+class SpreadsheetObserverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = []
+        self.observer = SpreadsheetObserver(lambda sheet, prop: self.events.append(prop))
+        self.sheet = _EchoSheet(self.observer)
+
+    def test_only_cell_properties_are_forwarded(self) -> None:
+        for prop in ("Label", "columnWidths", "ExpressionEngine", "wall_thickness", "Visibility", "cells", "B7"):
+            self.observer.slotChangedObject(self.sheet, prop)
+
+        self.assertEqual(self.events, ["cells", "B7"])
+
+    def test_created_sheet_is_forwarded(self) -> None:
+        observer = SpreadsheetObserver(lambda sheet, prop: self.events.append((sheet, prop)))
+
+        observer.slotCreatedObject(self.sheet)
+
+        self.assertEqual(self.events, [(self.sheet, "CreatedObject")])
+
+    def test_restore_slots_are_forwarded(self) -> None:
+        restores = []
+        observer = SpreadsheetObserver(lambda *args: None, None, lambda doc, finished: restores.append((doc, finished)))
+
+        observer.slotStartRestoreDocument("doc")
+        observer.slotFinishRestoreDocument("doc")
+
+        self.assertEqual(restores, [("doc", False), ("doc", True)])
+
+    def test_own_writes_are_not_echoed(self) -> None:
+        generation = write_generation(self.sheet)
+        batch = WriteBatch(self.sheet)
+        batch.set_cell("B1", "0")
+        batch.set_alias("B1", "width")
+
+        with batch.transaction():
+            self.assertTrue(is_writing(self.sheet))
+            batch.flush()
+
+        self.assertEqual(self.events, [])
+        self.assertFalse(is_writing(self.sheet))
+        self.assertEqual(write_generation(self.sheet), generation + 2)
+
+        self.sheet.set("A2", "height")
+        self.assertEqual(self.events, ["cells", "A2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest import mock
+
+from SketcherAutoAlias.core import prefs as prefs_module
+from SketcherAutoAlias.core.constants import PREF_AUTO_ALIAS_ENABLED, PREF_AUTO_SYNC_MAX_CELLS, PREF_EXCLUDED_SHEETS
+from SketcherAutoAlias.core.prefs import Preferences
+
+
+class _ObservableGroup:
+    """Parameter group fake that notifies attached observers like FreeCAD does."""
+
+    def __init__(self, attachable: bool = True) -> None:
+        self.values = {}
+        self.reads = 0
+        self.observers = []
+        if not attachable:
+            # Attaching fails on builds without parameter observers.
+            self.Attach = None
+
+    def _get(self, key, default):
+        self.reads += 1
+        return self.values.get(key, default)
+
+    GetBool = GetInt = GetString = _get  # noqa: N815
+
+    def _set(self, key, value):
+        self.values[key] = value
+        for observer in list(self.observers):
+            observer.OnChange(self, key)
+
+    SetBool = SetInt = SetString = _set  # noqa: N815
+
+    def Attach(self, observer):  # noqa: N802
+        self.observers.append(observer)
+
+    def Detach(self, observer):  # noqa: N802
+        self.observers.remove(observer)
+
+
+def _preferences(group: _ObservableGroup) -> Preferences:
+    app = types.SimpleNamespace(ParamGet=lambda _path: group)
+    with mock.patch.object(prefs_module, "App", app):
+        return Preferences()
+
+
+class PreferencesCacheTests(unittest.TestCase):
+    def test_values_are_read_once(self) -> None:
+        group = _ObservableGroup()
+        prefs = _preferences(group)
+
+        for _ in range(100):
+            self.assertTrue(prefs.is_auto_alias_enabled())
+            prefs.sync_delay_ms()
+
+        self.assertEqual(group.reads, 2)
+
+    def test_external_change_refreshes_cache(self) -> None:
+        group = _ObservableGroup()
+        prefs = _preferences(group)
+        self.assertTrue(prefs.is_auto_alias_enabled())
+
+        # e.g. edited in the Parameter editor
+        group.SetBool(PREF_AUTO_ALIAS_ENABLED, False)
+
+        self.assertFalse(prefs.is_auto_alias_enabled())
+
+    def test_group_without_observer_support_is_read_every_time(self) -> None:
+        group = _ObservableGroup(attachable=False)
+        prefs = _preferences(group)
+
+        prefs.is_auto_alias_enabled()
+        prefs.is_auto_alias_enabled()
+
+        self.assertEqual(group.reads, 2)
+
+    def test_detach_stops_observing(self) -> None:
+        group = _ObservableGroup()
+        prefs = _preferences(group)
+        prefs.detach()
+
+        self.assertEqual(group.observers, [])
+
+    def test_excluded_sheets_are_parsed_and_cached(self) -> None:
+        group = _ObservableGroup()
+        prefs = _preferences(group)
+        prefs.set_excluded_sheets(" Lookup* ; Import,,  ")
+
+        self.assertEqual(prefs.excluded_sheets(), ("Lookup*", "Import"))
+        reads = group.reads
+        prefs.excluded_sheets()
+        self.assertEqual(group.reads, reads)
+
+        group.SetString(PREF_EXCLUDED_SHEETS, "")
+        self.assertEqual(prefs.excluded_sheets(), ())
+
+    def test_auto_sync_ranges_are_parsed(self) -> None:
+        prefs = _preferences(_ObservableGroup())
+        prefs.set_auto_sync_ranges("A1:B20; Params!D1:E5;;")
+
+        self.assertEqual(prefs.auto_sync_ranges(), (("", "A1:B20"), ("Params", "D1:E5")))
+
+    def test_auto_sync_max_cells_is_not_negative(self) -> None:
+        group = _ObservableGroup()
+        prefs = _preferences(group)
+        prefs.set_int(PREF_AUTO_SYNC_MAX_CELLS, -5)
+
+        self.assertEqual(prefs.auto_sync_max_cells(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.scheduler import SyncScheduler
+
+
+class _FakeSheet:
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+class _FakeTimer:
+    def __init__(self, callback) -> None:
+        self.callback = callback
+        self.started_with = []
+        self.active = False
+
+    def start(self, delay_ms: int) -> None:
+        self.started_with.append(delay_ms)
+        self.active = True
+
+    def stop(self) -> None:
+        self.active = False
+
+    def fire(self) -> None:
+        self.active = False
+        self.callback()
+
+
+class SyncSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = []
+        self.timers = []
+
+        def _timer_factory(callback):
+            timer = _FakeTimer(callback)
+            self.timers.append(timer)
+            return timer
+
+        def _run(sheet, cells):
+            self.calls.append((sheet.Name, None if cells is None else sorted(cells)))
+            return 1
+
+        self.scheduler = SyncScheduler(_run, lambda: 120, _timer_factory)
+
+    def test_burst_of_edits_costs_one_sync_per_sheet(self) -> None:
+        sheet = _FakeSheet("Params")
+        for row in range(1, 501):
+            self.scheduler.mark_dirty(sheet, [f"A{row}"])
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(len(self.timers[0].started_with), 500)
+        self.assertEqual(self.timers[0].started_with[-1], 120)
+
+        self.timers[0].fire()
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(self.calls[0][1]), 500)
+        self.assertEqual(self.scheduler.pending_count(), 0)
+
+    def test_unknown_change_widens_to_full_diff(self) -> None:
+        sheet = _FakeSheet("Params")
+        self.scheduler.mark_dirty(sheet, ["A1"])
+        self.scheduler.mark_dirty(sheet, None)
+        self.scheduler.mark_dirty(sheet, ["A2"])
+
+        self.scheduler.flush()
+
+        self.assertEqual(self.calls, [("Params", None)])
+
+    def test_flush_single_sheet_keeps_others_pending(self) -> None:
+        first = _FakeSheet("First")
+        second = _FakeSheet("Second")
+        self.scheduler.mark_dirty(first, ["A1"])
+        self.scheduler.mark_dirty(second, ["B2"])
+
+        self.assertEqual(self.scheduler.flush(first), 1)
+
+        self.assertEqual(self.calls, [("First", ["A1"])])
+        self.assertTrue(self.scheduler.is_pending(second))
+
+    def test_discard_drops_pending_sync(self) -> None:
+        sheet = _FakeSheet("Params")
+        self.scheduler.mark_dirty(sheet, ["A1"])
+        self.scheduler.discard(sheet)
+
+        self.assertEqual(self.scheduler.flush(), 0)
+        self.assertFalse(self.timers[0].active)
+
+    def test_without_event_loop_syncs_run_immediately(self) -> None:
+        scheduler = SyncScheduler(lambda sheet, cells: 1, lambda: 120, lambda callback: None)
+        scheduler.mark_dirty(_FakeSheet("Params"), ["A1"])
+
+        self.assertEqual(scheduler.pending_count(), 0)
+
+    def test_spread_sheets_run_one_per_tick(self) -> None:
+        sheets = [_FakeSheet(name) for name in ("First", "Second", "Third")]
+        self.scheduler.mark_dirty_spread(sheets)
+        self.scheduler.mark_dirty(_FakeSheet("Edited"), ["A1"])
+
+        self.timers[0].fire()
+        self.assertEqual(self.calls, [("Edited", ["A1"]), ("First", None)])
+        self.assertEqual(self.timers[0].started_with[-1], 0)
+
+        self.timers[0].fire()
+        self.timers[0].fire()
+        self.assertEqual([name for name, _cells in self.calls], ["Edited", "First", "Second", "Third"])
+        self.assertFalse(self.timers[0].active)
+        self.assertEqual(self.scheduler.pending_count(), 0)
+
+    def test_edit_makes_spread_sheet_due_with_the_next_tick(self) -> None:
+        first, second = _FakeSheet("First"), _FakeSheet("Second")
+        self.scheduler.mark_dirty_spread([first, second])
+        self.scheduler.mark_dirty(second, ["A1"])
+
+        self.timers[0].fire()
+
+        # The queued full sync is kept, not narrowed to the edited cell.
+        self.assertEqual(self.calls, [("Second", None), ("First", None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from SketcherAutoAlias.core import sheet_scan
+from SketcherAutoAlias.core.cells import format_cell
+from SketcherAutoAlias.core.sheet_scan import ProbeLimits, content_fingerprint, iter_non_empty_cells
+
+
+class _GetOnlySheet:
+    def __init__(self, cells) -> None:
+        self.cells = dict(cells)
+        self.get_calls = 0
+
+    def get(self, cell: str):
+        self.get_calls += 1
+        if cell not in self.cells:
+            raise ValueError("cell is empty")
+        return self.cells[cell]
+
+
+class _Property:
+    def __init__(self, content: str) -> None:
+        self.Content = content
+
+
+def _addresses(cells):
+    return sorted(format_cell(cell) for cell in cells)
+
+
+class SheetScanTests(unittest.TestCase):
+    def test_prefers_non_empty_cells_api(self) -> None:
+        sheet = _GetOnlySheet({})
+        sheet.getNonEmptyCells = lambda: ["B2", "a1", "not-a-cell"]
+
+        self.assertEqual(_addresses(iter_non_empty_cells(sheet)), ["A1", "B2"])
+        self.assertEqual(sheet.get_calls, 0)
+
+    def test_falls_back_to_used_cells_when_primary_api_raises(self) -> None:
+        sheet = _GetOnlySheet({})
+
+        def _broken():
+            raise RuntimeError("broken")
+
+        sheet.getNonEmptyCells = _broken
+        sheet.getUsedCells = lambda: ["C3"]
+
+        self.assertEqual(_addresses(iter_non_empty_cells(sheet)), ["C3"])
+
+    def test_reads_serialised_cells_property(self) -> None:
+        sheet = _GetOnlySheet({})
+        sheet.cells = _Property(
+            '<Cells Count="3" xlink="1">'
+            '<Cell address="A1" content="width" />'
+            '<Cell address="B1" content="5 mm" alias="width" />'
+            '<Cell address="C1" style="bold" />'
+            "</Cells>"
+        )
+
+        self.assertEqual(_addresses(iter_non_empty_cells(sheet)), ["A1", "B1"])
+        self.assertEqual(sheet.get_calls, 0)
+
+    def test_fingerprint_follows_serialised_cells(self) -> None:
+        sheet = _GetOnlySheet({})
+        sheet.cells = _Property('<Cells Count="1"><Cell address="A1" content="width" /></Cells>')
+        before = content_fingerprint(sheet)
+
+        self.assertEqual(content_fingerprint(sheet), before)
+        sheet.cells = _Property('<Cells Count="1"><Cell address="A1" content="width" alias="w" /></Cells>')
+        self.assertNotEqual(content_fingerprint(sheet), before)
+        self.assertIsNone(content_fingerprint(_GetOnlySheet({"A1": "width"})))
+
+    def test_used_range_limits_probing_to_bounding_box(self) -> None:
+        sheet = _GetOnlySheet({"AB3000": "far away", "AC3001": "1"})
+        sheet.getUsedRange = lambda: ("AB3000", "AC3001")
+
+        self.assertEqual(_addresses(iter_non_empty_cells(sheet)), ["AB3000", "AC3001"])
+        self.assertEqual(sheet.get_calls, 4)
+
+    def test_probe_stops_after_empty_runs(self) -> None:
+        sheet = _GetOnlySheet({"A1": "width", "AD1": "beyond z", "A3": "height"})
+
+        cells = iter_non_empty_cells(sheet, ProbeLimits(max_rows=1000, max_columns=100, empty_run=30))
+
+        self.assertEqual(_addresses(cells), ["A1", "A3", "AD1"])
+        self.assertLess(sheet.get_calls, 30 * 35)
+
+    def test_probe_warns_when_it_stops_on_an_empty_gap(self) -> None:
+        sheet = _GetOnlySheet({"A1": "width", "A40": "below the gap"})
+
+        with mock.patch.object(sheet_scan, "warn_limited") as warn_limited:
+            cells = iter_non_empty_cells(sheet, ProbeLimits(max_rows=1000, max_columns=5, empty_run=30))
+
+        self.assertEqual(_addresses(cells), ["A1"])
+        self.assertIn("stopped at row 31", warn_limited.call_args[0][1])
+
+    def test_probe_does_not_warn_when_it_reaches_max_rows(self) -> None:
+        sheet = _GetOnlySheet({"A1": "width"})
+
+        with mock.patch.object(sheet_scan, "warn_limited") as warn_limited:
+            iter_non_empty_cells(sheet, ProbeLimits(max_rows=10, max_columns=5, empty_run=10))
+
+        warn_limited.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.cells import format_cell, parse_cell
+from SketcherAutoAlias.core.sheet_view import SheetView
+
+from .fakes import FakePrefs, SerialisedSheet
+
+
+class SheetViewTests(unittest.TestCase):
+    def test_read_uses_serialised_cells_once(self) -> None:
+        sheet = SerialisedSheet()
+        sheet.contents.update({"A1": "'width", "B1": "12", "A2": "height"})
+        sheet.aliases["B1"] = "width"
+        sheet.aliases["C9"] = "orphan"
+
+        view = SheetView.read(sheet)
+
+        self.assertEqual(sheet.content_reads, 1)
+        self.assertEqual(sheet.read_calls, 0)
+        self.assertEqual(view.contents[parse_cell("A1")], "width")
+        self.assertEqual(view.index.owner("width"), parse_cell("B1"))
+        # Aliases on empty cells are known without a failed write.
+        self.assertEqual(view.index.owner("orphan"), parse_cell("C9"))
+        self.assertNotIn(parse_cell("C9"), view.contents)
+
+    def test_refresh_reports_changed_and_cleared_cells(self) -> None:
+        sheet = SerialisedSheet()
+        sheet.contents.update({"A1": "width", "A2": "height"})
+        view = SheetView.read(sheet)
+
+        del sheet.contents["A1"]
+        sheet.contents["A3"] = "depth"
+        dirty, scanned = view.refresh(sheet)
+
+        self.assertEqual(sorted(map(format_cell, dirty)), ["A1", "A3"])
+        self.assertEqual(scanned, 3)
+        self.assertNotIn(parse_cell("A1"), view.contents)
+
+    def test_refresh_of_hinted_cells_reads_only_those_cells(self) -> None:
+        sheet = SerialisedSheet()
+        sheet.contents.update({"A1": "width", "A2": "height"})
+        view = SheetView.read(sheet)
+
+        sheet.contents["A2"] = "depth"
+        dirty, scanned = view.refresh(sheet, [parse_cell("A2")])
+
+        self.assertEqual(sheet.content_reads, 1)
+        self.assertEqual(sheet.read_calls, 2)
+        self.assertEqual(dirty, {parse_cell("A2")})
+        self.assertEqual(scanned, 1)
+
+    def test_full_sync_reads_no_cell_individually(self) -> None:
+        sheet = SerialisedSheet()
+        for row in range(1, 101):
+            sheet.contents[f"A{row}"] = f"param {row}"
+        sheet.contents["B1"] = "5"
+
+        updated = AliasService(FakePrefs()).sync_sheet(sheet)
+
+        self.assertEqual(updated, 100)
+        self.assertEqual(sheet.read_calls, 0)
+        self.assertEqual(sheet.contents["B1"], "5")
+        self.assertEqual(sheet.contents["B2"], "0")
+        self.assertEqual(sheet.aliases["B100"], "param_100")
+
+    def test_hinted_sync_reads_contents_like_full_sync(self) -> None:
+        sheet = SerialisedSheet()
+        sheet.contents.update({"A1": "width", "B1": "5", "A2": "=<<depth>>", "B2": "7"})
+        service = AliasService(FakePrefs())
+        service.sync_sheet(sheet)
+        self.assertEqual(sheet.aliases, {"B1": "width"})
+
+        updated = service.sync_sheet(sheet, ["A1", "B1", "A2", "B2"])
+
+        self.assertEqual(updated, 0)
+        self.assertEqual(sheet.aliases, {"B1": "width"})
+        view = SheetView.read(sheet)
+        dirty, _scanned = view.refresh(sheet, [parse_cell(address) for address in ("B1", "A2")])
+        self.assertEqual(dirty, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.alias_service import AliasService
+from SketcherAutoAlias.core.stats import StatsRecorder
+
+from .fakes import FakeDocument, FakePrefs, large_sheet
+
+
+class SyncStatsTests(unittest.TestCase):
+    def test_records_timing_counts_and_calls_per_sheet_and_document(self) -> None:
+        stats = StatsRecorder(enabled=True)
+        service = AliasService(FakePrefs(), stats)
+        first = large_sheet(3, "First")
+        second = large_sheet(2, "Second")
+        FakeDocument(first, second)
+
+        service.sync_sheet(first)
+        service.sync_sheet(second)
+        service.sync_sheet(first, ["A1"])
+
+        sheet_stats = stats.sheet_stats(first)
+        self.assertEqual(sheet_stats.syncs, 2)
+        self.assertEqual(sheet_stats.aliases_written, 3)
+        self.assertEqual(sheet_stats.cells_scanned, 7)
+        self.assertEqual(sheet_stats.calls["setAlias"], 3)
+        self.assertGreater(sheet_stats.calls["get"], 0)
+        self.assertGreaterEqual(sheet_stats.total_s, sheet_stats.max_s)
+
+        documents = stats.snapshot()["documents"]
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(documents[0]["syncs"], 3)
+        self.assertEqual(documents[0]["aliases_written"], 5)
+        self.assertIn("Sheet 'Second'", stats.report())
+
+    def test_disabled_recorder_stays_out_of_the_way(self) -> None:
+        stats = StatsRecorder(enabled=False)
+        service = AliasService(FakePrefs(), stats)
+        sheet = large_sheet(3, "First")
+
+        self.assertEqual(service.sync_sheet(sheet), 3)
+
+        self.assertIsNone(stats.sheet_stats(sheet))
+        self.assertEqual(stats.report(), "No alias syncs recorded yet.")
+
+    def test_recorder_follows_a_preference_getter(self) -> None:
+        preference = {"enabled": False}
+        stats = StatsRecorder(lambda: preference["enabled"])
+        service = AliasService(FakePrefs(), stats)
+        sheet = large_sheet(3, "First")
+
+        service.sync_sheet(sheet)
+        self.assertIsNone(stats.sheet_stats(sheet))
+
+        # e.g. SyncStatsEnabled switched on in the Parameter editor
+        preference["enabled"] = True
+        sheet.set("A4", "extra")
+        service.sync_sheet(sheet)
+        self.assertEqual(stats.sheet_stats(sheet).syncs, 1)
+
+    def test_events_are_counted_separately_from_syncs(self) -> None:
+        stats = StatsRecorder(enabled=True)
+        sheet = large_sheet(1, "First")
+        for _ in range(5):
+            stats.count_event(sheet)
+
+        self.assertEqual(stats.sheet_stats(sheet).events, 5)
+        self.assertEqual(stats.sheet_stats(sheet).syncs, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
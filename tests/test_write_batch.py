@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import unittest
+
+from SketcherAutoAlias.core.write_batch import WriteBatch
+
+
+class _FakeDocument:
+    def __init__(self) -> None:
+        self.events = []
+        self.HasPendingTransaction = False
+        self.RecomputesFrozen = False
+
+    def openTransaction(self, name: str) -> None:  # noqa: N802
+        self.events.append(("open", name))
+        self.HasPendingTransaction = True
+
+    def commitTransaction(self) -> None:  # noqa: N802
+        self.events.append(("commit",))
+        self.HasPendingTransaction = False
+
+    def abortTransaction(self) -> None:  # noqa: N802
+        self.events.append(("abort",))
+        self.HasPendingTransaction = False
+
+
+class _FakeSheet:
+    TypeId = "Spreadsheet::Sheet"
+
+    def __init__(self, document: _FakeDocument) -> None:
+        self.Document = document
+        self.cells = {}
+        self.aliases = {}
+        self.recomputes = 0
+
+    def set(self, cell: str, value: str) -> None:
+        self.Document.events.append(("set", cell, self.Document.RecomputesFrozen))
+        self.cells[cell] = value
+
+    def setAlias(self, cell: str, alias: str) -> None:  # noqa: N802
+        if alias in self.aliases.values():
+            raise ValueError(alias)
+        self.aliases[cell] = alias
+
+    def recompute(self) -> None:
+        self.recomputes += 1
+
+
+class WriteBatchTests(unittest.TestCase):
+    def test_writes_are_deferred_until_flush(self) -> None:
+        document = _FakeDocument()
+        sheet = _FakeSheet(document)
+        batch = WriteBatch(sheet)
+        batch.set_cell("B1", "0")
+        batch.set_alias("B1", "width")
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(sheet.cells, {})
+
+        self.assertEqual(batch.flush(), [])
+        self.assertEqual(sheet.cells, {"B1": "0"})
+        self.assertEqual(sheet.aliases, {"B1": "width"})
+        self.assertEqual(len(batch), 0)
+
+    def test_transaction_wraps_all_writes_and_recomputes_once(self) -> None:
+        document = _FakeDocument()
+        sheet = _FakeSheet(document)
+        batch = WriteBatch(sheet)
+        for row in range(1, 4):
+            batch.set_cell(f"B{row}", "0")
+            batch.set_alias(f"B{row}", f"name{row}")
+
+        with batch.transaction():
+            batch.flush()
+
+        self.assertEqual(document.events[0][0], "open")
+        self.assertEqual(document.events[-1], ("commit",))
+        set_events = [event for event in document.events if event[0] == "set"]
+        self.assertEqual(len(set_events), 3)
+        self.assertTrue(all(frozen for _kind, _cell, frozen in set_events))
+        self.assertFalse(document.RecomputesFrozen)
+        self.assertEqual(sheet.recomputes, 1)
+
+    def test_rejected_aliases_are_reported(self) -> None:
+        sheet = _FakeSheet(_FakeDocument())
+        sheet.aliases["Z1"] = "width"
+        batch = WriteBatch(sheet)
+        batch.set_alias("B1", "width")
+        batch.set_alias("B2", "height")
+
+        with batch.transaction():
+            failed = batch.flush()
+
+        self.assertEqual(failed, [("B1", "width")])
+        self.assertEqual(sheet.aliases["B2"], "height")
+
+    def test_joins_transaction_that_is_already_open(self) -> None:
+        document = _FakeDocument()
+        document.HasPendingTransaction = True
+        sheet = _FakeSheet(document)
+        batch = WriteBatch(sheet)
+        batch.set_cell("B1", "0")
+
+        with batch.transaction():
+            batch.flush()
+
+        self.assertNotIn(("commit",), document.events)
+        self.assertTrue(document.HasPendingTransaction)
+
+
+if __name__ == "__main__":
+    unittest.main()